@@ -0,0 +1,192 @@
+import gzip
+import json
+import logging
+import os
+from collections.abc import Iterable, Iterator
+from datetime import date, datetime, time
+from decimal import Decimal
+from enum import Enum
+from itertools import islice
+from pathlib import Path
+from typing import TYPE_CHECKING
+from uuid import uuid4
+
+if TYPE_CHECKING:
+    import pyarrow
+
+logger = logging.getLogger(__name__)
+
+
+class ChunkFormat(Enum):
+    CSV = "csv"
+    PARQUET = "parquet"
+
+    @property
+    def file_format_definition(self) -> str:
+        if self is ChunkFormat.CSV:
+            return (
+                "TYPE = CSV PARSE_HEADER = TRUE COMPRESSION = GZIP "
+                "FIELD_OPTIONALLY_ENCLOSED_BY = '\"' EMPTY_FIELD_AS_NULL = TRUE "
+                "ERROR_ON_COLUMN_COUNT_MISMATCH = FALSE"
+            )
+        return "TYPE = PARQUET USE_LOGICAL_TYPE = TRUE"
+
+
+def _import_pyarrow():
+    try:
+        import pyarrow
+        import pyarrow.parquet
+    except ImportError as e:
+        raise ImportError(
+            "pyarrow is required for Arrow and Parquet loading, install snowflake-utils[arrow]"
+        ) from e
+    return pyarrow
+
+
+def _csv_field(value) -> str:
+    """Renders a value as a CSV field: NULLs stay unquoted and empty, strings are always quoted"""
+    if value is None:
+        return ""
+    if isinstance(value, (bool, int, float, Decimal)):
+        return str(value)
+    if isinstance(value, (datetime, date, time)):
+        value = value.isoformat()
+    elif isinstance(value, (dict, list)):
+        value = json.dumps(value, default=str)
+    value = str(value)
+    return '"' + value.replace('"', '""') + '"'
+
+
+def _chunk_path(directory: str | Path, suffix: str) -> Path:
+    return Path(directory) / f"chunk_{uuid4().hex}{suffix}"
+
+
+def write_csv_chunks(
+    records: Iterable[dict], directory: str | Path, chunk_size: int
+) -> Iterator[Path]:
+    """Streams records into gzip'd CSV files of about `chunk_size` compressed bytes.
+    A new file is also started whenever the record keys change, as each file carries its own header.
+    """
+    columns, chunk, raw = None, None, None
+    try:
+        for record in records:
+            keys = tuple(record.keys())
+            if chunk is not None and (keys != columns or raw.tell() >= chunk_size):
+                chunk.close()
+                raw.close()
+                yield Path(raw.name)
+                chunk = None
+            if chunk is None:
+                columns = keys
+                raw = open(_chunk_path(directory, ".csv.gz"), "wb")
+                chunk = gzip.GzipFile(fileobj=raw, mode="wb")
+                chunk.write((",".join(f'"{c}"' for c in columns) + "\n").encode())
+            chunk.write(
+                (",".join(_csv_field(v) for v in record.values()) + "\n").encode()
+            )
+        if chunk is not None:
+            chunk.close()
+            raw.close()
+            yield Path(raw.name)
+            chunk = None
+    finally:
+        if chunk is not None:
+            chunk.close()
+            raw.close()
+
+
+def iter_record_batches(
+    data: "pyarrow.Table | pyarrow.RecordBatchReader | Iterable[pyarrow.RecordBatch]",
+) -> Iterator["pyarrow.RecordBatch"]:
+    pa = _import_pyarrow()
+    if isinstance(data, pa.Table):
+        return iter(data.to_batches())
+    return iter(data)
+
+
+def write_arrow_chunks(
+    batches: Iterable["pyarrow.RecordBatch"], directory: str | Path, chunk_size: int
+) -> Iterator[Path]:
+    """Writes Arrow record batches as they come into Parquet files of about `chunk_size` bytes,
+    starting a new file whenever the schema of the batches changes"""
+    pa = _import_pyarrow()
+    writer, path = None, None
+    try:
+        for batch in batches:
+            if writer is not None and not batch.schema.equals(writer.schema):
+                writer.close()
+                writer = None
+                yield path
+            if writer is None:
+                path = _chunk_path(directory, ".parquet")
+                writer = pa.parquet.ParquetWriter(path, batch.schema)
+            writer.write_batch(batch)
+            if os.path.getsize(path) >= chunk_size:
+                writer.close()
+                writer = None
+                yield path
+        if writer is not None:
+            writer.close()
+            writer = None
+            yield path
+    finally:
+        if writer is not None:
+            writer.close()
+
+
+def _unify_schemas(
+    schema: "pyarrow.Schema | None", other: "pyarrow.Schema"
+) -> "pyarrow.Schema":
+    if schema is None:
+        return other
+    pa = _import_pyarrow()
+    try:
+        return pa.unify_schemas([schema, other], promote_options="permissive")
+    except (pa.ArrowInvalid, pa.ArrowTypeError) as e:
+        raise ValueError(
+            f"The records do not share a schema, pass an explicit one: {e}"
+        ) from e
+
+
+def write_parquet_chunks(
+    records: Iterable[dict],
+    directory: str | Path,
+    chunk_size: int,
+    rows_per_group: int = 10_000,
+    schema: "pyarrow.Schema | None" = None,
+) -> Iterator[Path]:
+    """Streams records into Parquet files of about `chunk_size` bytes,
+    converting `rows_per_group` records at a time into a row group.
+
+    Without an explicit `schema`, the schema is inferred from the records and widened
+    as new keys and types are found, e.g. a column that was null so far gets the type
+    of its first value, and an integer one becomes a double. A new file is started
+    whenever it changes. Raises a ValueError on types that cannot be unified."""
+    pa = _import_pyarrow()
+
+    def batches() -> Iterator["pyarrow.RecordBatch"]:
+        rows_iter, unified = iter(records), schema
+        while rows := list(islice(rows_iter, rows_per_group)):
+            if schema is not None:
+                yield pa.RecordBatch.from_pylist(rows, schema=schema)
+                continue
+            batch = pa.RecordBatch.from_pylist(rows)
+            unified = _unify_schemas(unified, batch.schema)
+            yield (
+                batch
+                if batch.schema.equals(unified)
+                else pa.RecordBatch.from_pylist(rows, schema=unified)
+            )
+
+    return write_arrow_chunks(batches(), directory, chunk_size)
+
+
+def write_chunks(
+    records: Iterable[dict],
+    directory: str | Path,
+    chunk_format: ChunkFormat,
+    chunk_size: int,
+) -> Iterator[Path]:
+    if chunk_format is ChunkFormat.PARQUET:
+        return write_parquet_chunks(records, directory, chunk_size)
+    return write_csv_chunks(records, directory, chunk_size)
@@ -0,0 +1,263 @@
+import logging
+import re
+import statistics
+import threading
+import time
+from collections import defaultdict
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from enum import Enum
+
+from snowflake.connector.cursor import SnowflakeCursor
+
+from .tracing import tracing
+
+logger = logging.getLogger(__name__)
+
+_TARGET = re.compile(
+    r"\s*(?:copy\s+into|merge\s+into|insert\s+(?:overwrite\s+)?into|delete\s+from|update"
+    r"|(?:create|alter|drop|desc|describe)\b[\w ]*?\btable(?:\s+if(?:\s+not)?\s+exists)?)"
+    r"\s+([\w.$\"%]+)",
+    re.IGNORECASE,
+)
+_TAG = re.compile(r"\b(?:set|unset)\s+tag\b", re.IGNORECASE)
+
+
+class StatementKind(Enum):
+    COPY = "copy"
+    MERGE = "merge"
+    INSERT = "insert"
+    DELETE = "delete"
+    UPDATE = "update"
+    DDL = "ddl"
+    TAG = "tag"
+    QUERY = "query"
+    PUT = "put"
+    CONTEXT = "context"
+    TRANSACTION = "transaction"
+    BATCH = "batch"
+    OTHER = "other"
+
+
+_KINDS = {
+    "COPY": StatementKind.COPY,
+    "MERGE": StatementKind.MERGE,
+    "INSERT": StatementKind.INSERT,
+    "DELETE": StatementKind.DELETE,
+    "UPDATE": StatementKind.UPDATE,
+    "CREATE": StatementKind.DDL,
+    "ALTER": StatementKind.DDL,
+    "DROP": StatementKind.DDL,
+    "SELECT": StatementKind.QUERY,
+    "WITH": StatementKind.QUERY,
+    "SHOW": StatementKind.QUERY,
+    "DESC": StatementKind.QUERY,
+    "DESCRIBE": StatementKind.QUERY,
+    "LIST": StatementKind.QUERY,
+    "PUT": StatementKind.PUT,
+    "USE": StatementKind.CONTEXT,
+    "SET": StatementKind.CONTEXT,
+    "BEGIN": StatementKind.TRANSACTION,
+    "COMMIT": StatementKind.TRANSACTION,
+    "ROLLBACK": StatementKind.TRANSACTION,
+}
+
+
+def statement_kind(statement: str) -> StatementKind:
+    first = statement.lstrip(" \t\r\n(").split(None, 1)
+    kind = _KINDS.get(first[0].upper(), StatementKind.OTHER) if first else None
+    if kind is StatementKind.DDL and _TAG.search(statement):
+        return StatementKind.TAG
+    return kind or StatementKind.OTHER
+
+
+def statement_table(statement: str) -> str | None:
+    """The table a statement writes to or describes, if any"""
+    if match := _TARGET.match(statement):
+        return match.group(1)
+    return None
+
+
+@dataclass(frozen=True)
+class StatementRecord:
+    kind: StatementKind
+    table: str | None
+    query_id: str | None
+    elapsed: float
+    rows: int | None
+    statement: str
+    error: str | None = None
+
+
+Sink = Callable[[StatementRecord], None]
+
+
+class LoggingSink:
+    """Logs every statement, with the record as the `snowflake_statement` extra
+    for structured log handlers"""
+
+    def __init__(
+        self, logger: logging.Logger | None = None, level: int = logging.INFO
+    ) -> None:
+        self.logger = logger or logging.getLogger("snowflake_utils.statements")
+        self.level = level
+
+    def __call__(self, record: StatementRecord) -> None:
+        extra = asdict(record)
+        extra["kind"] = record.kind.value
+        self.logger.log(
+            self.level,
+            f"{record.kind.value} {record.table or ''} {record.query_id} "
+            f"took {record.elapsed:.3f}s{' and failed' if record.error else ''}",
+            extra={"snowflake_statement": extra},
+        )
+
+
+@dataclass(frozen=True)
+class StatementSummary:
+    count: int
+    errors: int
+    total: float
+    p50: float
+    p95: float
+    rows: int
+
+
+def _percentile(values: list[float], percent: int) -> float:
+    if len(values) == 1:
+        return values[0]
+    return statistics.quantiles(values, n=100, method="inclusive")[percent - 1]
+
+
+class StatementAggregator:
+    """In-memory sink keeping the wall time of the statements, summarized by kind
+    or by kind and table"""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._records: list[StatementRecord] = []
+
+    def __call__(self, record: StatementRecord) -> None:
+        with self._lock:
+            self._records.append(record)
+
+    @property
+    def records(self) -> list[StatementRecord]:
+        with self._lock:
+            return list(self._records)
+
+    def summary(
+        self, by_table: bool = False
+    ) -> dict[StatementKind | tuple[StatementKind, str | None], StatementSummary]:
+        groups: dict = defaultdict(list)
+        for record in self.records:
+            groups[(record.kind, record.table) if by_table else record.kind].append(
+                record
+            )
+        return {
+            key: StatementSummary(
+                count=len(records),
+                errors=sum(r.error is not None for r in records),
+                total=sum(r.elapsed for r in records),
+                p50=_percentile([r.elapsed for r in records], 50),
+                p95=_percentile([r.elapsed for r in records], 95),
+                rows=sum(r.rows or 0 for r in records),
+            )
+            for key, records in groups.items()
+        }
+
+    def clear(self) -> None:
+        with self._lock:
+            self._records.clear()
+
+
+class Instrumentation:
+    """Records every statement run by the library (kind, target table, query id, wall time
+    and rows affected) to the registered sinks. Without sinks, statements are not timed."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._sinks: list[Sink] = []
+
+    def add_sink(self, sink: Sink) -> None:
+        with self._lock:
+            self._sinks.append(sink)
+
+    def remove_sink(self, sink: Sink) -> None:
+        with self._lock:
+            self._sinks.remove(sink)
+
+    @contextmanager
+    def sink(self, sink: Sink) -> Iterator[Sink]:
+        """Registers the sink for the duration of the block"""
+        self.add_sink(sink)
+        try:
+            yield sink
+        finally:
+            self.remove_sink(sink)
+
+    @contextmanager
+    def statement(
+        self,
+        cursor: SnowflakeCursor,
+        statement: str,
+        kind: StatementKind | None = None,
+    ) -> Iterator[None]:
+        """Times the statement run in the block, in a span if tracing, and records it"""
+        if not self._sinks and not tracing.enabled:
+            yield
+            return
+        kind = kind or statement_kind(statement)
+        table = None if kind is StatementKind.BATCH else statement_table(statement)
+        with tracing.span("statement", kind=kind.value, table=table) as span:
+            started = time.perf_counter()
+            try:
+                yield
+            except Exception as e:
+                self._record(
+                    cursor,
+                    statement,
+                    kind,
+                    table,
+                    started,
+                    getattr(e, "sfqid", None),
+                    str(e),
+                )
+                raise
+            for key, value in (("query_id", cursor.sfqid), ("rows", cursor.rowcount)):
+                if isinstance(value, (str, int)):
+                    span.set_attribute(key, value)
+            self._record(cursor, statement, kind, table, started, cursor.sfqid)
+
+    def _record(
+        self,
+        cursor: SnowflakeCursor,
+        statement: str,
+        kind: StatementKind,
+        table: str | None,
+        started: float,
+        query_id: str | None,
+        error: str | None = None,
+    ) -> None:
+        if not self._sinks:
+            return None
+        record = StatementRecord(
+            kind=kind,
+            table=table,
+            query_id=query_id,
+            elapsed=time.perf_counter() - started,
+            rows=None if error else cursor.rowcount,
+            statement=statement,
+            error=error,
+        )
+        with self._lock:
+            sinks = list(self._sinks)
+        for sink in sinks:
+            try:
+                sink(record)
+            except Exception:
+                logger.exception("Statement sink failed")
+
+
+instrumentation = Instrumentation()
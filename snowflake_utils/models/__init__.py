@@ -1,17 +1,33 @@
 from .column import Column
-from .enums import MatchByColumnName, TagLevel
+from .enums import (
+    MatchByColumnName,
+    MergeStrategy,
+    QualifyMode,
+    TableType,
+    TagLevel,
+)
 from .file_format import FileFormat, InlineFileFormat
-from .schema import Schema
+from .results import FileLoad, LoadResult, MergeResult
+from .schema import MergeJob, MergeJobResult, Schema
 from .table import Table
-from .table_structure import TableStructure
+from .table_structure import SchemaInference, TableStructure
 
 __all__ = [
     "Column",
     "MatchByColumnName",
+    "MergeStrategy",
+    "QualifyMode",
+    "TableType",
     "TagLevel",
     "Schema",
+    "MergeJob",
+    "MergeJobResult",
     "Table",
     "TableStructure",
+    "SchemaInference",
     "FileFormat",
     "InlineFileFormat",
+    "FileLoad",
+    "LoadResult",
+    "MergeResult",
 ]
@@ -0,0 +1,325 @@
+import logging
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict, defaultdict
+
+from snowflake.connector.cursor import SnowflakeCursor
+
+from ..queries import execute
+from .column import Column
+from .table_structure import TableStructure
+
+TableKey = tuple[str, str, str]
+ScopeKey = tuple[str, str | None]
+
+
+def _key(*parts: str | None) -> tuple:
+    return tuple(p.casefold() if p is not None else None for p in parts)
+
+
+def _data_type(
+    data_type: str,
+    length: int | None,
+    precision: int | None,
+    scale: int | None,
+    datetime_precision: int | None,
+) -> str:
+    """Rebuilds the data type as `desc table` reports it from the information_schema columns"""
+    if data_type == "TEXT":
+        return f"VARCHAR({length})" if length is not None else "VARCHAR"
+    if data_type == "NUMBER" and precision is not None:
+        return f"NUMBER({precision},{scale or 0})"
+    if data_type == "BINARY" and length is not None:
+        return f"BINARY({length})"
+    if data_type.startswith("TIME") and datetime_precision is not None:
+        return f"{data_type}({datetime_precision})"
+    return data_type
+
+
+class _Catalog(ABC):
+    """Snapshots of whole schemas, or databases, serving lookups until they are older than `ttl`
+    seconds. Invalidated tables are no longer served, and are looked up live again until the
+    next snapshot. Dropped tables are served as absent."""
+
+    def __init__(self, ttl: float) -> None:
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._snapshots: dict[ScopeKey, float] = {}
+        self._invalidated: set[TableKey] = set()
+
+    def load(
+        self, cursor: SnowflakeCursor, database: str, schema: str | None = None
+    ) -> int:
+        """Loads a snapshot of a schema, or of the whole database if no schema is given.
+        Returns the number of rows loaded."""
+        logging.debug(
+            f"Loading {type(self).__name__} snapshot of {database}.{schema or '*'}"
+        )
+        rows = self._fetch(cursor, database, schema)
+        with self._lock:
+            self._evict(database, schema)
+            self._index(database, rows)
+            self._snapshots[_key(database, schema)] = time.monotonic()
+        return len(rows)
+
+    def refresh(self, cursor: SnowflakeCursor) -> None:
+        """Reloads every snapshot currently held"""
+        with self._lock:
+            scopes = list(self._snapshots)
+        for database, schema in scopes:
+            self.load(cursor, database, schema)
+
+    def invalidate(self, database: str, schema: str, table: str) -> None:
+        key = _key(database, schema, table)
+        with self._lock:
+            if self._covers_schema(*key[:2]):
+                self._invalidated.add(key)
+            for index in self._indexes():
+                index.pop(key, None)
+
+    def dropped(self, database: str, schema: str, table: str) -> None:
+        """Records that the table no longer exists"""
+        key = _key(database, schema, table)
+        with self._lock:
+            self._invalidated.discard(key)
+            for index in self._indexes():
+                index.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._snapshots.clear()
+            self._invalidated.clear()
+            for index in self._indexes():
+                index.clear()
+
+    @abstractmethod
+    def _fetch(
+        self, cursor: SnowflakeCursor, database: str, schema: str | None
+    ) -> list[tuple]:
+        """Fetches the rows of a snapshot"""
+
+    @abstractmethod
+    def _index(self, database: str, rows: list[tuple]) -> None:
+        """Adds the rows of a snapshot to the indexes"""
+
+    @abstractmethod
+    def _indexes(self) -> list[dict]:
+        """The indexes keyed by table"""
+
+    def _covers(self, key: TableKey) -> bool:
+        if key in self._invalidated:
+            return False
+        return self._covers_schema(*key[:2])
+
+    def _covers_schema(self, database: str, schema: str) -> bool:
+        for scope in ((database, schema), (database, None)):
+            loaded_at = self._snapshots.get(scope)
+            if loaded_at is None:
+                continue
+            if time.monotonic() - loaded_at < self.ttl:
+                return True
+            self._evict(*scope)
+        return False
+
+    def _evict(self, database: str, schema: str | None) -> None:
+        """Drops a snapshot and the entries it covers"""
+        database, schema = _key(database, schema)
+        self._snapshots.pop((database, schema), None)
+
+        def covered(key: TableKey) -> bool:
+            return key[0] == database and (schema is None or key[1] == schema)
+
+        self._invalidated = {k for k in self._invalidated if not covered(k)}
+        for index in self._indexes():
+            for key in [k for k in index if covered(k)]:
+                index.pop(key)
+
+
+class TagCatalog(_Catalog):
+    """In-memory index of the table and column tags of whole schemas or databases.
+
+    A snapshot is loaded with a single query on `SNOWFLAKE.ACCOUNT_USAGE.TAG_REFERENCES`
+    (which requires access to the shared SNOWFLAKE database and lags behind by up to two hours)
+    and serves the tag lookups of every table it covers until it is older than `ttl` seconds.
+    Tables whose tags are changed through this library are invalidated and looked up live again.
+    """
+
+    def __init__(self, ttl: float = 3600) -> None:
+        super().__init__(ttl)
+        self._table_tags: dict[TableKey, dict[str, str]] = defaultdict(dict)
+        self._column_tags: dict[TableKey, dict[str, dict[str, str]]] = defaultdict(
+            lambda: defaultdict(dict)
+        )
+
+    def table_tags(
+        self, database: str, schema: str, table: str
+    ) -> dict[str, str] | None:
+        """Tags set on the table, or None if no valid snapshot covers it"""
+        key = _key(database, schema, table)
+        with self._lock:
+            if not self._covers(key):
+                return None
+            return dict(self._table_tags.get(key, {}))
+
+    def column_tags(
+        self, database: str, schema: str, table: str
+    ) -> dict[str, dict[str, str]] | None:
+        """Tags set on the columns of the table, or None if no valid snapshot covers it"""
+        key = _key(database, schema, table)
+        with self._lock:
+            if not self._covers(key):
+                return None
+            return defaultdict(
+                dict,
+                {c: dict(t) for c, t in self._column_tags.get(key, {}).items()},
+            )
+
+    def _fetch(
+        self, cursor: SnowflakeCursor, database: str, schema: str | None
+    ) -> list[tuple]:
+        schema_filter = f"and object_schema = '{schema.upper()}'" if schema else ""
+        return execute(
+            cursor,
+            f"""select object_schema, object_name, lower(domain), lower(column_name), lower(tag_name), tag_value
+                from snowflake.account_usage.tag_references
+                where object_deleted is null
+                and domain in ('TABLE', 'COLUMN')
+                and object_database = '{database.upper()}'
+                {schema_filter}
+                """,
+        ).fetchall()
+
+    def _index(self, database: str, rows: list[tuple]) -> None:
+        for object_schema, object_name, domain, column, tag_name, value in rows:
+            table = _key(database, object_schema, object_name)
+            if domain == "column":
+                self._column_tags[table][column][tag_name] = value
+            else:
+                self._table_tags[table][tag_name] = value
+
+    def _indexes(self) -> list[dict]:
+        return [self._table_tags, self._column_tags]
+
+
+class SchemaCatalog(_Catalog):
+    """In-memory index of the tables and columns of whole schemas or databases.
+
+    A snapshot is loaded with a single query on `information_schema.columns` and answers
+    `Table.exists`, `Table.get_columns` and `Schema.get_tables` until it is older than `ttl`
+    seconds. Tables created, dropped or altered through this library are updated in the index,
+    with their columns looked up live again, objects changed by other processes are only seen
+    after a reload.
+    """
+
+    def __init__(self, ttl: float = 300) -> None:
+        super().__init__(ttl)
+        self._tables: dict[TableKey, tuple[str, str, str, str]] = {}
+        self._columns: dict[TableKey, list[Column]] = defaultdict(list)
+
+    def columns(self, database: str, schema: str, table: str) -> list[Column] | None:
+        """Columns of the table in ordinal order, empty if the table does not exist,
+        or None if no valid snapshot covers it"""
+        key = _key(database, schema, table)
+        with self._lock:
+            if not self._covers(key):
+                return None
+            return list(self._columns.get(key, []))
+
+    def tables(self, database: str, schema: str) -> list[tuple[str, str, str]] | None:
+        """(name, database, schema) of the base tables of the schema, or None if no valid
+        snapshot covers it"""
+        database, schema = _key(database, schema)
+        with self._lock:
+            if not self._covers_schema(database, schema):
+                return None
+            return [
+                (name, table_database, table_schema)
+                for key, (table_database, table_schema, name, table_type) in sorted(
+                    self._tables.items()
+                )
+                if key[:2] == (database, schema) and "VIEW" not in table_type
+            ]
+
+    def invalidate(self, database: str, schema: str, table: str) -> None:
+        """Looks the columns of the table up live again, the table still exists if it did"""
+        key = _key(database, schema, table)
+        with self._lock:
+            if self._covers_schema(*key[:2]):
+                self._invalidated.add(key)
+            self._columns.pop(key, None)
+
+    def created(self, database: str, schema: str, table: str) -> None:
+        """Records that the table exists, with its columns looked up live again"""
+        key = _key(database, schema, table)
+        with self._lock:
+            if not self._covers_schema(*key[:2]):
+                return
+            self._invalidated.add(key)
+            self._columns.pop(key, None)
+            self._tables.setdefault(
+                key, (database.upper(), schema.upper(), table.upper(), "BASE TABLE")
+            )
+
+    def _fetch(
+        self, cursor: SnowflakeCursor, database: str, schema: str | None
+    ) -> list[tuple]:
+        schema_filter = f"and c.table_schema = '{schema.upper()}'" if schema else ""
+        return execute(
+            cursor,
+            f"""select t.table_catalog, t.table_schema, t.table_name, t.table_type,
+                c.column_name, c.data_type, c.character_maximum_length,
+                c.numeric_precision, c.numeric_scale, c.datetime_precision
+                from {database}.information_schema.columns c
+                join {database}.information_schema.tables t
+                on c.table_schema = t.table_schema and c.table_name = t.table_name
+                where c.table_schema != 'INFORMATION_SCHEMA'
+                {schema_filter}
+                order by c.table_schema, c.table_name, c.ordinal_position
+                """,
+        ).fetchall()
+
+    def _index(self, database: str, rows: list[tuple]) -> None:
+        for table_database, table_schema, name, table_type, column, *data_type in rows:
+            table = _key(table_database, table_schema, name)
+            self._tables[table] = (table_database, table_schema, name, table_type)
+            self._columns[table].append(
+                Column(name=column, data_type=_data_type(*data_type))
+            )
+
+    def _indexes(self) -> list[dict]:
+        return [self._tables, self._columns]
+
+
+class InferenceCache:
+    """Table structures inferred from staged files, keyed by the source of the files
+    (stage location and file format) and a fingerprint of the files they were inferred from.
+    Holds the `max_size` most recently used ones."""
+
+    def __init__(self, max_size: int = 128) -> None:
+        self.max_size = max_size
+        self._lock = threading.Lock()
+        self._structures: OrderedDict[tuple, TableStructure] = OrderedDict()
+
+    def get(self, key: tuple) -> TableStructure | None:
+        with self._lock:
+            structure = self._structures.get(key)
+            if structure is not None:
+                self._structures.move_to_end(key)
+            return structure
+
+    def put(self, key: tuple, structure: TableStructure) -> None:
+        with self._lock:
+            self._structures[key] = structure
+            self._structures.move_to_end(key)
+            while len(self._structures) > self.max_size:
+                self._structures.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._structures.clear()
+
+
+tag_catalog = TagCatalog()
+schema_catalog = SchemaCatalog()
+inference_cache = InferenceCache()
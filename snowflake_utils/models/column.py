@@ -1,5 +1,3 @@
-from datetime import date, datetime
-
 from pydantic import BaseModel, Field
 
 
@@ -25,6 +23,16 @@ def _matched(columns: list[Column], old_columns: dict[str, str]):
     )
 
 
+def _changed(columns: list[Column], old_columns: dict[str, str]) -> str:
+    def tmp(x: str) -> str:
+        return f'tmp."{x}"'
+
+    return " or ".join(
+        f'dest."{c.name}" is distinct from {_possibly_cast(tmp(c.name), old_columns.get(c.name), c.data_type)}'
+        for c in columns
+    )
+
+
 def _inserts(columns: list[Column], old_columns: dict[str, str]) -> str:
     return ",".join(
         _possibly_cast(f'tmp."{c.name}"', old_columns.get(c.name), c.data_type)
@@ -32,17 +40,6 @@ def _inserts(columns: list[Column], old_columns: dict[str, str]) -> str:
     )
 
 
-def _type_cast(s: any) -> any:
-    if isinstance(s, (int, float)):
-        return str(s)
-    elif isinstance(s, str):
-        return f"'{s}'"
-    elif isinstance(s, (datetime, date)):
-        return f"'{s.isoformat()}'"
-    else:
-        return f"'{s}'"
-
-
 class MetadataColumn(BaseModel):
     name: str
     data_type: str
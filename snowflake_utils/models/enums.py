@@ -10,3 +10,32 @@ class MatchByColumnName(Enum):
 class TagLevel(Enum):
     COLUMN = "column"
     TABLE = "table"
+
+
+class TableType(Enum):
+    PERMANENT = "permanent"
+    TRANSIENT = "transient"
+    TEMPORARY = "temporary"
+
+
+class QualifyMode(Enum):
+    """How `qualify` keeps one record per primary key.
+
+    REWRITE recreates the table from a QUALIFY over all its rows, and SOURCE deduplicates
+    the staged rows of a merge in its USING subquery. INCREMENTAL deletes in place the records
+    superseded by the rows of the last load, ranked on the replication keys then the scan time.
+    It requires replication keys, since all the rows of a load share their scan time, and rows
+    of a key equal on both are all kept: unlike REWRITE, it does not remove duplicates that
+    arrive in the same load with the same replication key values.
+    """
+
+    REWRITE = "rewrite"
+    SOURCE = "source"
+    INCREMENTAL = "incremental"
+
+
+class MergeStrategy(Enum):
+    MERGE = "merge"
+    DELETE_INSERT = "delete_insert"
+    APPEND = "append"
+    AUTO = "auto"
@@ -0,0 +1,136 @@
+import time
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+
+from pydantic import BaseModel, ConfigDict, Field
+from typing_extensions import Self
+
+from ..instrumentation import StatementKind, statement_kind
+from ..tracing import AttributeValue, tracing
+
+
+def _count(value) -> int | None:
+    return value if isinstance(value, int) else None
+
+
+@contextmanager
+def timed(
+    phases: dict[str, float], phase: str, **attributes: AttributeValue | None
+) -> Iterator[None]:
+    """Adds the time spent in the block to `phases`, and traces it as a span"""
+    started = time.perf_counter()
+    try:
+        with tracing.span(phase, **attributes):
+            yield
+    finally:
+        phases[phase] = phases.get(phase, 0.0) + time.perf_counter() - started
+
+
+class FileLoad(BaseModel):
+    """One row of the result of a COPY"""
+
+    file: str
+    status: str
+    rows_parsed: int | None = None
+    rows_loaded: int | None = None
+    errors_seen: int | None = None
+    first_error: str | None = None
+
+    @classmethod
+    def from_row(cls, row: tuple) -> Self | None:
+        """Parses a COPY result row, None for the single message row of a COPY with no files"""
+        if len(row) < 6:
+            return None
+        file, status, rows_parsed, rows_loaded, _, errors_seen, *rest = row
+        return cls(
+            file=str(file),
+            status=str(status),
+            rows_parsed=_count(rows_parsed),
+            rows_loaded=_count(rows_loaded),
+            errors_seen=_count(errors_seen),
+            first_error=rest[0] if rest else None,
+        )
+
+
+class LoadResult(list):
+    """The rows returned by the COPY statements of a load, as fetched, along with their
+    query ids and the time spent in each phase of the load. The rows are parsed in `files`."""
+
+    def __init__(
+        self,
+        rows: Iterable[tuple] = (),
+        query_ids: list[str] | None = None,
+        phases: dict[str, float] | None = None,
+    ) -> None:
+        super().__init__(rows)
+        self.query_ids = [q for q in query_ids or [] if q is not None]
+        self.phases = phases if phases is not None else {}
+
+    @classmethod
+    def combine(cls, results: Iterable["LoadResult"]) -> Self:
+        combined = cls()
+        for result in results:
+            combined.extend(result)
+            combined.query_ids.extend(result.query_ids)
+        return combined
+
+    @property
+    def files(self) -> list[FileLoad]:
+        return [f for f in map(FileLoad.from_row, self) if f is not None]
+
+    @property
+    def rows_parsed(self) -> int:
+        return sum(f.rows_parsed or 0 for f in self.files)
+
+    @property
+    def rows_loaded(self) -> int:
+        return sum(f.rows_loaded or 0 for f in self.files)
+
+    @property
+    def errors_seen(self) -> int:
+        return sum(f.errors_seen or 0 for f in self.files)
+
+    @property
+    def failed_files(self) -> list[FileLoad]:
+        return [f for f in self.files if f.status.upper() not in ("LOADED", "")]
+
+
+class MergeResult(BaseModel):
+    """Rows affected by a merge, with the load of the staged data (or of the table
+    itself if it did not exist), the query ids of the statements applying the staged rows
+    and the time spent in each phase."""
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    load: LoadResult | None = None
+    rows_inserted: int = 0
+    rows_updated: int = 0
+    rows_deleted: int = 0
+    query_ids: list[str] = Field(default_factory=list)
+    phases: dict[str, float] = Field(default_factory=dict)
+
+    def set_load(self, load, into_target: bool = False) -> None:
+        """Sets the load of the staged data, or of the target itself if it did not exist,
+        in which case the loaded rows are the rows inserted"""
+        if not isinstance(load, LoadResult):
+            return None
+        self.load = load
+        if into_target:
+            self.rows_inserted += load.rows_loaded
+
+    def add(self, statement: str, rows: list[tuple], query_id: str | None) -> None:
+        """Counts the rows affected by a statement applying the staged rows"""
+        if query_id is not None:
+            self.query_ids.append(query_id)
+        counts = [_count(v) or 0 for v in rows[0]] if rows else []
+        match statement_kind(statement), counts:
+            case StatementKind.MERGE, [inserted, updated, *deleted]:
+                self.rows_inserted += inserted
+                self.rows_updated += updated
+                self.rows_deleted += sum(deleted)
+            case StatementKind.MERGE, [inserted]:
+                self.rows_inserted += inserted
+            case StatementKind.INSERT, [inserted, *_]:
+                self.rows_inserted += inserted
+            case StatementKind.DELETE, [deleted, *_]:
+                self.rows_deleted += deleted
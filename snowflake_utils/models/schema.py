@@ -1,9 +1,73 @@
-from pydantic import BaseModel
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+from pydantic import BaseModel, ConfigDict, Field
 from snowflake.connector.cursor import SnowflakeCursor
 
+from ..pool import connection_pool
+from ..queries import execute
+from ..settings import SnowflakeSettings
+from .catalog import schema_catalog, tag_catalog
+from .file_format import FileFormat, InlineFileFormat
 from .table import Table
 
 
+class MergeJob(BaseModel):
+    table: Table
+    path: str
+    file_format: InlineFileFormat | FileFormat
+    primary_keys: list[str] = ["id"]
+    replication_keys: list[str] | None = None
+    storage_integration: str | None = None
+    qualify: bool = False
+    files: list[str] | None = None
+    stage: str | None = None
+    options: dict[str, Any] = Field(
+        default_factory=dict,
+        description="Any other keyword argument to be passed to Table.merge",
+    )
+
+    def run(self) -> Any:
+        return self.table.merge(
+            path=self.path,
+            file_format=self.file_format,
+            primary_keys=self.primary_keys,
+            replication_keys=self.replication_keys,
+            storage_integration=self.storage_integration,
+            qualify=self.qualify,
+            files=self.files,
+            stage=self.stage,
+            **self.options,
+        )
+
+
+class MergeJobResult(BaseModel):
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    job: MergeJob
+    result: Any = None
+    error: Exception | None = None
+    elapsed: float
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def _run_merge_job(job: MergeJob) -> MergeJobResult:
+    start = time.perf_counter()
+    try:
+        result = job.run()
+    except Exception as e:
+        logging.exception(f"Merge into `{job.table.fqn}` failed")
+        return MergeJobResult(job=job, error=e, elapsed=time.perf_counter() - start)
+    elapsed = time.perf_counter() - start
+    logging.info(f"Merged into `{job.table.fqn}` in {elapsed:.1f}s")
+    return MergeJobResult(job=job, result=result, elapsed=elapsed)
+
+
 class Schema(BaseModel):
     name: str
     database: str | None = None
@@ -15,12 +79,63 @@ class Schema(BaseModel):
         else:
             return self.name
 
-    def get_tables(self, cursor: SnowflakeCursor):
-        cursor.execute(f"show tables in schema {self.fully_qualified_name};")
-        data = cursor.execute(
-            'select "name", "database_name", "schema_name" FROM TABLE(RESULT_SCAN(LAST_QUERY_ID()));'
+    @property
+    def _database(self) -> str:
+        return self.database or SnowflakeSettings().db
+
+    def get_tables(self, cursor: SnowflakeCursor | None = None):
+        if (cached := schema_catalog.tables(self._database, self.name)) is not None:
+            return [
+                Table(name=name, schema_name=schema, database=database)
+                for (name, database, schema) in cached
+            ]
+        if cursor is None:
+            with connection_pool.connection() as connection:
+                return self.get_tables(connection.cursor())
+        execute(cursor, f"show tables in schema {self.fully_qualified_name};")
+        data = execute(
+            cursor,
+            'select "name", "database_name", "schema_name" FROM TABLE(RESULT_SCAN(LAST_QUERY_ID()));',
         ).fetchall()
         return [
             Table(name=name, schema_name=schema, database=database)
             for (name, database, schema, *_) in data
         ]
+
+    def load_tags(self, cursor: SnowflakeCursor | None = None) -> int:
+        """Loads the table and column tags of the whole schema into the tag catalog with one query,
+        so that the tables of the schema no longer look up their tags one by one"""
+        if cursor is None:
+            with connection_pool.connection() as connection:
+                return self.load_tags(connection.cursor())
+        return tag_catalog.load(cursor, self._database, self.name)
+
+    def load_catalog(self, cursor: SnowflakeCursor | None = None) -> int:
+        """Loads the tables and columns of the whole schema into the schema catalog with one query,
+        serving `get_tables` and the `exists` and `get_columns` lookups of its tables"""
+        if cursor is None:
+            with connection_pool.connection() as connection:
+                return self.load_catalog(connection.cursor())
+        return schema_catalog.load(cursor, self._database, self.name)
+
+    def merge_many(
+        self, jobs: list[MergeJob], max_workers: int = 8
+    ) -> list[MergeJobResult]:
+        """Runs the merge jobs concurrently on `max_workers` threads, each drawing its session
+        from the connection pool. Workers are capped to the pool size, as the extra ones would
+        only wait for a session and time out. A failing job does not stop the others: the results,
+        in the same order as the jobs, carry either the merge result or the error, and the elapsed time.
+        """
+        if max_workers > connection_pool.max_size:
+            logging.warning(
+                f"Capping merge_many to {connection_pool.max_size} workers, the size of the connection pool"
+            )
+            max_workers = connection_pool.max_size
+        logging.info(
+            f"Running {len(jobs)} merges in schema {self.fully_qualified_name} on {max_workers} workers"
+        )
+        with ThreadPoolExecutor(max_workers) as executor:
+            results = list(executor.map(_run_merge_job, jobs))
+        if failed := [r.job.table.fqn for r in results if not r.ok]:
+            logging.warning(f"{len(failed)} merges failed: {', '.join(failed)}")
+        return results
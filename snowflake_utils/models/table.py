@@ -1,16 +1,304 @@
+import asyncio
+import hashlib
 import logging
-from collections import defaultdict
+from collections import defaultdict, deque
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager, suppress
 from functools import partial
+from itertools import chain, islice
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from typing import TYPE_CHECKING, TypeVar
+from uuid import uuid4
 
 from pydantic import BaseModel, Field
+from snowflake.connector import SnowflakeConnection
 from snowflake.connector.cursor import SnowflakeCursor
 
-from ..queries import execute_statement
-from ..settings import SnowflakeSettings, connect, governance_settings
-from .column import Column, MetadataColumn, _inserts, _matched, _type_cast
-from .enums import MatchByColumnName, TagLevel
+from ..files import (
+    ChunkFormat,
+    _import_pyarrow,
+    iter_record_batches,
+    write_arrow_chunks,
+    write_chunks,
+)
+from ..pool import connection_pool, session_objects
+from ..queries import (
+    execute,
+    execute_many,
+    execute_statement,
+    execute_statement_async,
+    execute_statements,
+    put_file,
+)
+from ..settings import SnowflakeSettings, governance_settings
+from ..tracing import tracing
+from .catalog import inference_cache, schema_catalog, tag_catalog
+from .column import Column, MetadataColumn, _changed, _inserts, _matched
+from .enums import (
+    MatchByColumnName,
+    MergeStrategy,
+    QualifyMode,
+    TableType,
+    TagLevel,
+)
 from .file_format import FileFormat, InlineFileFormat
-from .table_structure import TableStructure
+from .results import LoadResult, MergeResult, timed
+from .table_structure import SchemaInference, TableStructure
+
+if TYPE_CHECKING:
+    import pandas
+    import pyarrow
+
+T = TypeVar("T")
+
+
+def _record_batches(
+    records: Mapping[str, dict] | Iterable[dict], batch_size: int
+) -> Iterator[tuple[tuple[str, ...], list[tuple]]]:
+    """Groups consecutive records sharing the same columns in batches of at most `batch_size` rows"""
+    if isinstance(records, Mapping):
+        records = records.values()
+    columns, rows = None, []
+    for record in records:
+        keys = tuple(record.keys())
+        if rows and (keys != columns or len(rows) >= batch_size):
+            yield columns, rows
+            rows = []
+        columns = keys
+        rows.append(tuple(record.values()))
+    if rows:
+        yield columns, rows
+
+
+def _upload_chunk(connection: SnowflakeConnection, path: Path, location: str) -> None:
+    put_file(connection.cursor(), path, location)
+    path.unlink()
+
+
+# Snowflake rejects a COPY listing more files than this
+_MAX_COPY_FILES = 1000
+
+
+def _file_chunks(files: list[str] | None) -> list[list[str] | None]:
+    """Splits the files in batches that fit in the FILES clause of a COPY"""
+    if not files:
+        return [None]
+    return [
+        files[i : i + _MAX_COPY_FILES] for i in range(0, len(files), _MAX_COPY_FILES)
+    ]
+
+
+def _files_clause(files: list[str] | None) -> str:
+    if not files:
+        return ""
+    # Format files list properly for Snowflake FILES clause
+    files_str = "', '".join(files)
+    return f"FILES = ('{files_str}')"
+
+
+def _load(cursor: SnowflakeCursor, statement: str) -> LoadResult:
+    rows = execute_statement(cursor, statement)
+    return LoadResult(rows, query_ids=[cursor.sfqid])
+
+
+def _copy_chunk(
+    connection: SnowflakeConnection, statement: str, retries: int
+) -> LoadResult:
+    """Runs the COPY of a chunk of files on its own cursor, retrying it if it fails.
+    Files already loaded are skipped by Snowflake, so a retry only loads the rest."""
+    for attempt in range(retries + 1):
+        try:
+            return _load(connection.cursor(), statement)
+        except Exception as e:
+            if attempt == retries:
+                raise
+            logging.warning(f"COPY of a chunk of files failed, retrying: {e}")
+
+
+async def _load_async(cursor: SnowflakeCursor, statement: str) -> LoadResult:
+    rows = await execute_statement_async(cursor, statement)
+    return LoadResult(rows, query_ids=[cursor.sfqid])
+
+
+async def _copy_chunk_async(
+    connection: SnowflakeConnection,
+    statement: str,
+    retries: int,
+    semaphore: asyncio.Semaphore,
+) -> LoadResult:
+    async with semaphore:
+        for attempt in range(retries + 1):
+            try:
+                return await _load_async(connection.cursor(), statement)
+            except Exception as e:
+                if attempt == retries:
+                    raise
+                logging.warning(f"COPY of a chunk of files failed, retrying: {e}")
+
+
+def _same_tag_value(current: str | None, desired: str) -> bool:
+    return current is not None and current.casefold() == desired.casefold()
+
+
+def _check_start_partition(partitions: int | None, start_partition: int) -> None:
+    if not 0 <= start_partition < (partitions or 1):
+        raise ValueError(
+            f"start_partition must be between 0 and {(partitions or 1) - 1}, got {start_partition}"
+        )
+
+
+def _quote_literal(value: str) -> str:
+    escaped = value.replace("'", "''")
+    return f"'{escaped}'"
+
+
+_TIMESTAMP_TZ_FORMAT = "YYYY-MM-DD HH24:MI:SS.FF9 TZHTZM"
+_TIMESTAMP_NTZ_FORMAT = "YYYY-MM-DD HH24:MI:SS.FF9"
+# Conversion function and full precision text format of the temporal types, whose
+# ::varchar follows the session output formats (milliseconds for timestamps by default)
+_TEMPORAL_FORMATS = {
+    "DATE": ("to_date", "YYYY-MM-DD"),
+    "TIME": ("to_time", "HH24:MI:SS.FF9"),
+    "DATETIME": ("to_timestamp_ntz", _TIMESTAMP_NTZ_FORMAT),
+    "TIMESTAMP": ("to_timestamp_ntz", _TIMESTAMP_NTZ_FORMAT),
+    "TIMESTAMP_NTZ": ("to_timestamp_ntz", _TIMESTAMP_NTZ_FORMAT),
+    "TIMESTAMP_LTZ": ("to_timestamp_ltz", _TIMESTAMP_TZ_FORMAT),
+    "TIMESTAMP_TZ": ("to_timestamp_tz", _TIMESTAMP_TZ_FORMAT),
+}
+
+# Types whose ::varchar round-trips exactly, unlike FLOAT or NUMBER with a scale
+_EXACT_TEXT_TYPES = {
+    "INT",
+    "INTEGER",
+    "BIGINT",
+    "SMALLINT",
+    "TINYINT",
+    "BYTEINT",
+    "VARCHAR",
+    "TEXT",
+    "STRING",
+    "CHAR",
+    "CHARACTER",
+}
+
+
+def _round_trips_as_text(data_type: str) -> bool:
+    base, _, args = data_type.upper().partition("(")
+    if base.strip() in ("NUMBER", "DECIMAL", "NUMERIC"):
+        return [a.strip() for a in args.rstrip(") ").split(",")[1:]] in ([], ["0"])
+    return base.strip() in _EXACT_TEXT_TYPES
+
+
+_LOAD_STARTED_AT = "LOAD_STARTED_AT"
+
+
+def _execute_all(
+    cursor: SnowflakeCursor, statements: list[str]
+) -> list[tuple[str, list[tuple], str | None]]:
+    """Executes the statements, in a single transaction if there are more than one,
+    and returns each statement with its result rows and query id"""
+    if len(statements) == 1:
+        rows = execute(cursor, statements[0]).fetchall()
+        return [(statements[0], rows, cursor.sfqid)]
+    results = []
+    execute(cursor, "begin")
+    try:
+        for statement in statements:
+            rows = execute(cursor, statement).fetchall()
+            results.append((statement, rows, cursor.sfqid))
+    except BaseException:
+        execute(cursor, "rollback")
+        raise
+    execute(cursor, "commit")
+    return results
+
+
+def _execute_setup(cursor: SnowflakeCursor, statements: list[str]) -> None:
+    """Submits the setup statements in one request. If it fails, the temporary objects
+    recorded for the session may not exist and are created again next time."""
+    try:
+        execute_statements(cursor, statements)
+    except BaseException:
+        session_objects.forget(cursor.connection)
+        raise
+
+
+async def _execute_all_async(
+    cursor: SnowflakeCursor, statements: list[str]
+) -> list[tuple[str, list[tuple], str | None]]:
+    if len(statements) == 1:
+        rows = await execute_statement_async(cursor, statements[0])
+        return [(statements[0], rows, cursor.sfqid)]
+    results = []
+    await asyncio.to_thread(execute, cursor, "begin")
+    try:
+        for statement in statements:
+            rows = await execute_statement_async(cursor, statement)
+            results.append((statement, rows, cursor.sfqid))
+    except BaseException:
+        await asyncio.to_thread(execute, cursor, "rollback")
+        raise
+    await asyncio.to_thread(execute, cursor, "commit")
+    return results
+
+
+def _qualify_clause(primary_keys: list[str], replication_keys: list[str] | None) -> str:
+    """Keeps the row with the highest replication keys of every primary key"""
+    if not primary_keys:
+        raise ValueError("Primary keys are required for qualifying")
+    qualify_partition = ",".join(f'"{c.upper()}"' for c in primary_keys)
+    qualify_order = ",".join(
+        f'"{c.upper()}" desc' for c in (replication_keys or primary_keys)
+    )
+    logging.debug(
+        f"QUALIFY on PARTITION {qualify_partition} ORDERED BY {qualify_order}"
+    )
+    return f"qualify row_number() over (partition by {qualify_partition} order by {qualify_order}) = 1"
+
+
+def _join_condition(
+    primary_keys: list[str], pruning_predicate: str | None = None
+) -> str:
+    condition = " and ".join(
+        f'dest."{c.upper()}" = tmp."{c.upper()}"' for c in primary_keys
+    )
+    if pruning_predicate:
+        return f"{condition} and {pruning_predicate}"
+    return condition
+
+
+def _merge_source(
+    fqn: str,
+    primary_keys: list[str],
+    replication_keys: list[str] | None,
+    qualify_source: bool,
+    partition: tuple[int, int] | None = None,
+) -> str:
+    """The staging table, restricted to the `(index, count)` hash partition of the primary keys
+    and deduplicated on the fly if `qualify_source`"""
+    filters = []
+    if partition is not None:
+        index, count = partition
+        keys = ", ".join(f'"{c.upper()}"' for c in primary_keys)
+        filters.append(f"where mod(abs(hash({keys})), {count}) = {index}")
+    if qualify_source:
+        filters.append(_qualify_clause(primary_keys, replication_keys))
+    if filters:
+        return f"(select * from {fqn} {' '.join(filters)})"
+    return fqn
+
+
+def _tag_assignments(tags: dict[str, str]) -> str:
+    return ", ".join(
+        f"{governance_settings.fqn(tag_name)} = {_quote_literal(tag_value)}"
+        for tag_name, tag_value in tags.items()
+    )
+
+
+def _session_has(current: str | None, expected: str) -> bool:
+    return isinstance(current, str) and current.casefold() == expected.casefold()
 
 
 class Table(BaseModel):
@@ -21,10 +309,17 @@ class Table(BaseModel):
     database: str | None = None
     include_metadata: list[MetadataColumn] = Field(default_factory=list)
     enable_schema_evolution: bool = False
+    table_type: TableType = TableType.PERMANENT
     existing_column_tags: dict[str, dict[str, str]] | None = None
     existing_table_tags: dict[str, str] | None = None
+    schema_inference: SchemaInference | None = None
     _file_format: FileFormat | None = None
     _stage: str | None = None
+    # What the file format and stage were set up from, shared by tables loading the same files
+    _file_format_source: str | None = None
+    _stage_source: str | None = None
+    # The table the temporary file format and stage are named after, when loading on its behalf
+    _objects_of: str | None = None
 
     @property
     def file_format(self) -> str:
@@ -47,12 +342,37 @@ class Table(BaseModel):
             )
             return f"INCLUDE_METADATA = ({metadata})"
 
+    def _settings(self) -> SnowflakeSettings:
+        """Connection settings for this table, logging in directly with its role if set"""
+        if self.role is not None:
+            return SnowflakeSettings(role=self.role)
+        return SnowflakeSettings()
+
     @property
     def fqn(self) -> str:
         if database := self.database:
             return f"{database}.{self.schema_name}.{self.name}"
         return f"{self.schema_name}.{self.name}"
 
+    def _catalog_key(self) -> tuple[str, str, str]:
+        """(database, schema, name) of the table, as indexed by the catalogs"""
+        return (self.database or SnowflakeSettings().db, self.schema_name, self.name)
+
+    @property
+    def table_stage(self) -> str:
+        return f"{self.fqn.rsplit('.', 1)[0]}.%{self.name}"
+
+    @property
+    def _objects_name(self) -> str:
+        return self._objects_of or self.name
+
+    def _loading_for(self, name: str, **update) -> "Table":
+        """A copy of the table loaded on behalf of this one, such as a staging table,
+        reusing its temporary file format and stage instead of creating its own"""
+        table = self.model_copy(update={"name": name, **update})
+        table._objects_of = self._objects_name
+        return table
+
     @property
     def temporary_stage(self) -> str:
         return self._stage_fqn()
@@ -62,7 +382,7 @@ class Table(BaseModel):
         return FileFormat(
             database=self.database,
             schema_name=self.schema_name,
-            name=f"tmp_file_format_{self.schema_name}_{self.name}".upper(),
+            name=f"tmp_file_format_{self.schema_name}_{self._objects_name}".upper(),
         )
 
     def get_create_temporary_file_format_statement(self, file_format: str) -> str:
@@ -93,7 +413,9 @@ class Table(BaseModel):
         """
 
     def _stage_fqn(self):
-        temporary_stage = f"tmp_external_stage_{self.schema_name}_{self.name}".upper()
+        temporary_stage = (
+            f"tmp_external_stage_{self.schema_name}_{self._objects_name}".upper()
+        )
         return (
             f"{self.database}.{self.schema_name}.{temporary_stage}"
             if self.database
@@ -106,9 +428,19 @@ class Table(BaseModel):
         copy_grants: bool = True,
     ) -> str:
         logging.debug(f"Creating table: {self.fqn}")
-        copy_grants_clause = " COPY GRANTS" if copy_grants and full_refresh else ""
+        copy_grants_clause = (
+            " COPY GRANTS"
+            if copy_grants and full_refresh and self.table_type is TableType.PERMANENT
+            else ""
+        )
+        create = self._create_clause(full_refresh)
         if self.table_structure:
-            return f"{'CREATE OR REPLACE TABLE' if full_refresh else 'CREATE TABLE IF NOT EXISTS'} {self.fqn}{copy_grants_clause} ({self.table_structure.parsed_columns})"
+            evolution = (
+                " ENABLE_SCHEMA_EVOLUTION = TRUE"
+                if self.enable_schema_evolution
+                else ""
+            )
+            return f"{create} {self.fqn}{copy_grants_clause} ({self.table_structure.parsed_columns}){evolution}{self._retention_clause()}"
         else:
             template = """ARRAY_AGG(
                 OBJECT_CONSTRUCT(
@@ -135,7 +467,7 @@ class Table(BaseModel):
 
             stage_query = f"LOCATION => '@{self.stage}'"
             return f"""
-            {"CREATE OR REPLACE TABLE" if full_refresh else "CREATE TABLE IF NOT EXISTS"} {self.fqn}{copy_grants_clause}
+            {create} {self.fqn}{copy_grants_clause}
             USING TEMPLATE (
                 SELECT {template}
                 FROM TABLE(
@@ -145,31 +477,175 @@ class Table(BaseModel):
                     IGNORE_CASE => TRUE
                 )
                 )
-            ) ENABLE_SCHEMA_EVOLUTION = {self.enable_schema_evolution};
+            ) ENABLE_SCHEMA_EVOLUTION = {self.enable_schema_evolution}{self._retention_clause()};
             """
 
+    def _create_clause(self, full_refresh: bool) -> str:
+        kind = (
+            ""
+            if self.table_type is TableType.PERMANENT
+            else f"{self.table_type.value.upper()} "
+        )
+        if full_refresh:
+            return f"CREATE OR REPLACE {kind}TABLE"
+        return f"CREATE {kind}TABLE IF NOT EXISTS"
+
+    def _retention_clause(self) -> str:
+        """Throwaway tables keep no Time Travel history"""
+        if self.table_type is TableType.PERMANENT:
+            return ""
+        return " DATA_RETENTION_TIME_IN_DAYS = 0"
+
     def bulk_insert(
         self,
-        records,
+        records: Mapping[str, dict] | Iterable[dict],
         full_refresh: bool = False,
-    ) -> None:
-        with connect() as connection:
+        connection: SnowflakeConnection | None = None,
+        batch_size: int = 10_000,
+        stage_threshold: int | None = 100_000,
+        chunk_format: ChunkFormat = ChunkFormat.CSV,
+        chunk_size: int = 100 * 2**20,
+        upload_threads: int = 4,
+    ) -> list[int]:
+        """Inserts the records with one parameter-bound, multi-row INSERT per batch.
+        From `stage_threshold` records on, they are instead streamed to compressed files
+        of about `chunk_size` bytes, uploaded to the table stage and loaded with one COPY.
+        Returns the number of rows inserted by each batch, or loaded from each file."""
+        if isinstance(records, Mapping):
+            records = records.values()
+        records = iter(records)
+        use_stage = False
+        if stage_threshold is not None:
+            head = list(islice(records, stage_threshold))
+            use_stage = len(head) == stage_threshold
+            records = chain(head, records)
+
+        with connection_pool.connection(connection, self._settings()) as connection:
             cursor = connection.cursor()
             _execute_statement = partial(execute_statement, cursor)
             _execute_statement(self.get_create_schema_statement())
             _execute_statement(
                 self.get_create_table_statement(full_refresh, copy_grants=True)
             )
-            for k in records:
-                cols = ", ".join([k for k in records[k].keys()])
-                vals = ", ".join([_type_cast(v) for v in records[k].values()])
-                _execute_statement(
-                    f"""
-                    INSERT INTO {self.fqn}({cols})
-                    VALUES ({vals})
-                    """
+            if use_stage:
+                return self._stage_load(
+                    connection,
+                    partial(
+                        write_chunks,
+                        records,
+                        chunk_format=chunk_format,
+                        chunk_size=chunk_size,
+                    ),
+                    chunk_format.file_format_definition,
+                    upload_threads,
+                )
+            placeholder = "%s" if connection.is_pyformat else "?"
+            inserted = []
+            for columns, rows in _record_batches(records, batch_size):
+                cols = ", ".join(columns)
+                vals = ", ".join(placeholder for _ in columns)
+                execute_many(
+                    cursor, f"INSERT INTO {self.fqn}({cols}) VALUES ({vals})", rows
+                )
+                inserted.append(cursor.rowcount)
+                logging.info(
+                    f"Inserted batch of {cursor.rowcount} rows into {self.fqn}"
                 )
-        return None
+        return inserted
+
+    def insert_arrow(
+        self,
+        data: "pyarrow.Table | pyarrow.RecordBatchReader | Iterable[pyarrow.RecordBatch]",
+        full_refresh: bool = False,
+        connection: SnowflakeConnection | None = None,
+        chunk_size: int = 100 * 2**20,
+        upload_threads: int = 4,
+    ) -> list[int]:
+        """Writes Arrow record batches to Parquet files, uploads them to the table stage
+        and loads them with one COPY. Without a table structure, the table is created
+        from the Arrow schema. Returns the number of rows loaded from each file."""
+        batches = iter_record_batches(data)
+        first = next(batches, None)
+        if first is None:
+            return []
+        table = self
+        if self.table_structure is None:
+            table = self.model_copy(
+                update={
+                    "table_structure": TableStructure.from_arrow_schema(first.schema)
+                }
+            )
+        with connection_pool.connection(connection, self._settings()) as connection:
+            _execute_statement = partial(execute_statement, connection.cursor())
+            _execute_statement(self.get_create_schema_statement())
+            _execute_statement(
+                table.get_create_table_statement(full_refresh, copy_grants=True)
+            )
+            return self._stage_load(
+                connection,
+                partial(
+                    write_arrow_chunks, chain([first], batches), chunk_size=chunk_size
+                ),
+                ChunkFormat.PARQUET.file_format_definition,
+                upload_threads,
+            )
+
+    def insert_dataframe(
+        self,
+        df: "pandas.DataFrame",
+        full_refresh: bool = False,
+        connection: SnowflakeConnection | None = None,
+        chunk_size: int = 100 * 2**20,
+        upload_threads: int = 4,
+    ) -> list[int]:
+        """Same as `insert_arrow`, for a pandas DataFrame (its index is not loaded)"""
+        pa = _import_pyarrow()
+        return self.insert_arrow(
+            pa.Table.from_pandas(df, preserve_index=False),
+            full_refresh=full_refresh,
+            connection=connection,
+            chunk_size=chunk_size,
+            upload_threads=upload_threads,
+        )
+
+    def _stage_load(
+        self,
+        connection: SnowflakeConnection,
+        write: Callable[[str], Iterator[Path]],
+        file_format_definition: str,
+        upload_threads: int,
+    ) -> list[int]:
+        """Uploads the chunks produced by `write` in a temporary directory to the
+        table stage while they are written, then COPYs them into the table"""
+        path = f"bulk_insert/{uuid4().hex}"
+        location = f"{self.table_stage}/{path}"
+        logging.info(f"Uploading records for `{self.fqn}` to @{location}")
+        try:
+            with (
+                TemporaryDirectory() as directory,
+                ThreadPoolExecutor(upload_threads) as executor,
+            ):
+                uploads = deque()
+                for chunk in write(directory):
+                    uploads.append(
+                        executor.submit(_upload_chunk, connection, chunk, location)
+                    )
+                    # Only keep on disk the chunks that are waiting to be uploaded
+                    while len(uploads) > upload_threads:
+                        uploads.popleft().result()
+                for upload in uploads:
+                    upload.result()
+            result = self.copy_into(
+                path=path,
+                file_format=InlineFileFormat(definition=file_format_definition),
+                stage=self.table_stage,
+                create_table=False,
+                connection=connection,
+            )
+        finally:
+            execute_statement(connection.cursor(), f"REMOVE @{location}")
+        # COPY returns one row per file: file, status, rows_parsed, rows_loaded, ...
+        return [row[3] for row in result or [] if len(row) > 3]
 
     def _copy(
         self,
@@ -182,36 +658,148 @@ class Table(BaseModel):
         stage: str | None = None,
         create_table: bool = True,
         copy_grants: bool = True,
-    ) -> None:
-        with connect() as connection:
+        connection: SnowflakeConnection | None = None,
+        files: list[str] | None = None,
+        copy_concurrency: int = 4,
+        chunk_retries: int = 1,
+    ) -> LoadResult:
+        """Copies the files, in chunks of at most 1000 run concurrently on the session
+        (each retried on its own) if there are more, and returns the rows of every chunk"""
+        phases = {}
+        with (
+            tracing.span(
+                "Table.copy", table=self.fqn, path=path, files=len(files or []) or None
+            ) as span,
+            connection_pool.connection(connection, self._settings()) as connection,
+        ):
             cursor = connection.cursor()
-            execute = self.setup_connection(
-                path, storage_integration, cursor, file_format, stage
-            )
-            if create_table:
-                self.create_table(full_refresh, execute, copy_grants)
+            with timed(phases, "setup"):
+                statements = self._setup_statements(
+                    path, storage_integration, cursor, file_format, stage
+                )
+                if create_table:
+                    statements = self._with_create_table(
+                        cursor, statements, full_refresh, copy_grants, files
+                    )
+                _execute_setup(cursor, statements)
 
             if sync_tags and self.table_structure:
-                self.sync_tags(cursor)
-
-            # Determine the FROM clause based on whether we're using a stage or direct path
-            if stage:
-                from_clause = f"@{stage}/{path}"
-            elif storage_integration:
-                from_clause = f"@{self.stage}"
-            else:
-                from_clause = f"'{path}'"
+                with timed(phases, "sync_tags"):
+                    self.sync_tags(cursor)
 
             logging.info(f"Starting copy into `{self.fqn}` from path '{path}'")
-            return execute(
-                query.format(
-                    file_format=self.file_format,
-                    from_clause=from_clause,
-                    storage_integration_clause=f"STORAGE_INTEGRATION = {storage_integration}"
-                    if storage_integration and not (stage or self._stage)
-                    else "",
+            statements = [
+                self._format_copy_query(query, path, storage_integration, stage, chunk)
+                for chunk in _file_chunks(files)
+            ]
+            with timed(phases, "copy", chunks=len(statements)):
+                if len(statements) == 1:
+                    result = _load(cursor, statements[0])
+                else:
+                    logging.info(
+                        f"Copying {len(files)} files in {len(statements)} chunks"
+                    )
+                    with ThreadPoolExecutor(copy_concurrency) as executor:
+                        result = LoadResult.combine(
+                            executor.map(
+                                partial(_copy_chunk, connection, retries=chunk_retries),
+                                statements,
+                            )
+                        )
+            span.set_attribute("rows_loaded", result.rows_loaded)
+            result.phases = phases
+            return result
+
+    async def _copy_async(
+        self,
+        query: str,
+        path: str,
+        file_format: InlineFileFormat | FileFormat,
+        storage_integration: str | None,
+        full_refresh: bool,
+        sync_tags: bool,
+        stage: str | None,
+        create_table: bool,
+        copy_grants: bool,
+        cursor: SnowflakeCursor,
+        files: list[str] | None = None,
+        copy_concurrency: int = 4,
+        chunk_retries: int = 1,
+    ) -> LoadResult:
+        with tracing.span(
+            "Table.copy", table=self.fqn, path=path, files=len(files or []) or None
+        ) as span:
+            phases = {}
+            with timed(phases, "setup"):
+                statements = self._setup_statements(
+                    path, storage_integration, cursor, file_format, stage
                 )
-            )
+                if create_table:
+                    statements = await asyncio.to_thread(
+                        self._with_create_table,
+                        cursor,
+                        statements,
+                        full_refresh,
+                        copy_grants,
+                        files,
+                    )
+                await asyncio.to_thread(_execute_setup, cursor, statements)
+
+            if sync_tags and self.table_structure:
+                with timed(phases, "sync_tags"):
+                    await asyncio.to_thread(self.sync_tags, cursor)
+
+            logging.info(f"Submitting copy into `{self.fqn}` from path '{path}'")
+            statements = [
+                self._format_copy_query(query, path, storage_integration, stage, chunk)
+                for chunk in _file_chunks(files)
+            ]
+            with timed(phases, "copy", chunks=len(statements)):
+                if len(statements) == 1:
+                    result = await _load_async(cursor, statements[0])
+                else:
+                    logging.info(
+                        f"Copying {len(files)} files in {len(statements)} chunks"
+                    )
+                    semaphore = asyncio.Semaphore(copy_concurrency)
+                    result = LoadResult.combine(
+                        await asyncio.gather(
+                            *(
+                                _copy_chunk_async(
+                                    cursor.connection, s, chunk_retries, semaphore
+                                )
+                                for s in statements
+                            )
+                        )
+                    )
+            span.set_attribute("rows_loaded", result.rows_loaded)
+            result.phases = phases
+            return result
+
+    def _format_copy_query(
+        self,
+        query: str,
+        path: str,
+        storage_integration: str | None,
+        stage: str | None,
+        files: list[str] | None = None,
+    ) -> str:
+        # Determine the FROM clause based on whether we're using a stage or direct path
+        if stage:
+            from_clause = f"@{stage}/{path}"
+        elif storage_integration:
+            from_clause = f"@{self.stage}"
+        else:
+            from_clause = f"'{path}'"
+
+        return query.format(
+            file_format=self.file_format,
+            files_clause=_files_clause(files),
+            from_clause=from_clause,
+            storage_integration_clause=f"STORAGE_INTEGRATION = {storage_integration}"
+            if storage_integration and not (stage or self._stage)
+            else "",
+        )
 
     def copy_into(
         self,
@@ -229,25 +817,74 @@ class Table(BaseModel):
         files: list[str] | None = None,
         create_table: bool = True,
         copy_grants: bool = True,
-    ) -> None:
-        col_str = f"({', '.join(target_columns)})" if target_columns else ""
-        files_clause = ""
-        if files:
-            # Format files list properly for Snowflake FILES clause
-            files_str = "', '".join(files)
-            files_clause = f"FILES = ('{files_str}')"
-
-        copy_query = f"""
-                COPY INTO {self.fqn} {col_str}
-                FROM {{from_clause}}
-                {{storage_integration_clause}}
-                FILE_FORMAT = ( FORMAT_NAME ='{{file_format}}')
-                MATCH_BY_COLUMN_NAME={match_by_column_name.value}
-                {files_clause}
-                {self._include_metadata()}
-                """
+        connection: SnowflakeConnection | None = None,
+        qualify_mode: QualifyMode = QualifyMode.REWRITE,
+        swap: bool = False,
+        copy_concurrency: int = 4,
+        chunk_retries: int = 1,
+    ) -> LoadResult:
+        """Loads the files into the table, returning the rows of the COPY parsed in a
+        `LoadResult`, with its query ids and the time spent in each phase"""
+        if full_refresh and swap:
+            return self._swap_refresh(
+                lambda shadow, connection: shadow.copy_into(
+                    path=path,
+                    file_format=file_format,
+                    storage_integration=storage_integration,
+                    match_by_column_name=match_by_column_name,
+                    full_refresh=True,
+                    target_columns=target_columns,
+                    sync_tags=True,
+                    primary_keys=primary_keys,
+                    replication_keys=replication_keys,
+                    qualify=qualify,
+                    stage=stage,
+                    files=files,
+                    create_table=create_table,
+                    copy_grants=True,
+                    connection=connection,
+                    qualify_mode=qualify_mode,
+                    copy_concurrency=copy_concurrency,
+                    chunk_retries=chunk_retries,
+                ),
+                create_table,
+                connection,
+            )
+        copy_query = self._copy_into_query(match_by_column_name, target_columns)
         if qualify:
-            self._copy(
+            with connection_pool.connection(connection, self._settings()) as connection:
+                cursor = connection.cursor()
+                if qualify_mode is QualifyMode.INCREMENTAL:
+                    self._check_incremental_qualify(replication_keys)
+                    execute(cursor, self._load_started_statement())
+                result = self._copy(
+                    copy_query,
+                    path,
+                    file_format,
+                    storage_integration,
+                    full_refresh,
+                    sync_tags,
+                    stage,
+                    create_table,
+                    copy_grants,
+                    connection=connection,
+                    files=files,
+                    copy_concurrency=copy_concurrency,
+                    chunk_retries=chunk_retries,
+                )
+                with timed(result.phases, "qualify"):
+                    self.qualify(
+                        cursor=cursor,
+                        primary_keys=primary_keys,
+                        replication_keys=replication_keys,
+                        qualify_mode=qualify_mode,
+                    )
+                if sync_tags and self.table_structure:
+                    with timed(result.phases, "sync_tags"):
+                        self.sync_tags(cursor)
+                return result
+        else:
+            return self._copy(
                 copy_query,
                 path,
                 file_format,
@@ -257,18 +894,45 @@ class Table(BaseModel):
                 stage,
                 create_table,
                 copy_grants,
+                connection=connection,
+                files=files,
+                copy_concurrency=copy_concurrency,
+                chunk_retries=chunk_retries,
             )
-            with connect() as connection:
-                cursor = connection.cursor()
-                self.qualify(
-                    cursor=cursor,
-                    primary_keys=primary_keys,
-                    replication_keys=replication_keys,
-                )
-                if sync_tags and self.table_structure:
-                    self.sync_tags(cursor)
-        else:
-            return self._copy(
+
+    async def copy_into_async(
+        self,
+        path: str,
+        file_format: InlineFileFormat | FileFormat,
+        storage_integration: str | None = None,
+        match_by_column_name: MatchByColumnName = MatchByColumnName.CASE_INSENSITIVE,
+        full_refresh: bool = False,
+        target_columns: list[str] | None = None,
+        sync_tags: bool = False,
+        primary_keys: list[str] = ["id"],
+        replication_keys: list[str] | None = None,
+        qualify: bool = False,
+        stage: str | None = None,
+        files: list[str] | None = None,
+        create_table: bool = True,
+        copy_grants: bool = True,
+        connection: SnowflakeConnection | None = None,
+        qualify_mode: QualifyMode = QualifyMode.REWRITE,
+        copy_concurrency: int = 4,
+        chunk_retries: int = 1,
+    ) -> LoadResult:
+        """Same as `copy_into`, but statements are submitted asynchronously and polled
+        with backoff, so that many loads can be awaited concurrently on a single thread."""
+        copy_query = self._copy_into_query(match_by_column_name, target_columns)
+        incremental = qualify and qualify_mode is QualifyMode.INCREMENTAL
+        async with connection_pool.connection_async(
+            connection, self._settings()
+        ) as connection:
+            cursor = connection.cursor()
+            if incremental:
+                self._check_incremental_qualify(replication_keys)
+                await asyncio.to_thread(execute, cursor, self._load_started_statement())
+            result = await self._copy_async(
                 copy_query,
                 path,
                 file_format,
@@ -278,45 +942,207 @@ class Table(BaseModel):
                 stage,
                 create_table,
                 copy_grants,
+                cursor,
+                files,
+                copy_concurrency,
+                chunk_retries,
             )
+            if qualify:
+                with timed(result.phases, "qualify"):
+                    await execute_statement_async(
+                        cursor,
+                        self._incremental_qualify_statement(
+                            primary_keys, replication_keys
+                        )
+                        if incremental
+                        else self._qualify_statement(primary_keys, replication_keys),
+                    )
+                if sync_tags and self.table_structure:
+                    with timed(result.phases, "sync_tags"):
+                        await asyncio.to_thread(self.sync_tags, cursor)
+            return result
+
+    @staticmethod
+    def _load_started_statement() -> str:
+        return f"set {_LOAD_STARTED_AT} = current_timestamp()"
+
+    def _copy_into_query(
+        self,
+        match_by_column_name: MatchByColumnName,
+        target_columns: list[str] | None,
+    ) -> str:
+        col_str = f"({', '.join(target_columns)})" if target_columns else ""
+        return f"""
+                COPY INTO {self.fqn} {col_str}
+                FROM {{from_clause}}
+                {{storage_integration_clause}}
+                FILE_FORMAT = ( FORMAT_NAME ='{{file_format}}')
+                MATCH_BY_COLUMN_NAME={match_by_column_name.value}
+                {{files_clause}}
+                {self._include_metadata()}
+                """
 
     def create_table(
         self, full_refresh: bool, execute_statement: callable, copy_grants: bool = True
     ) -> None:
+        if not full_refresh and schema_catalog.columns(*self._catalog_key()):
+            # The table is known to exist, creating it if not exists changes nothing
+            execute_statement(
+                self.get_create_table_statement(full_refresh, copy_grants)
+            )
+            return
+        if full_refresh:
+            # Replacing the table drops its tags
+            tag_catalog.invalidate(*self._catalog_key())
         execute_statement(self.get_create_table_statement(full_refresh, copy_grants))
+        self._created()
+
+    def _created(self) -> None:
+        """Records the table in the schema catalog, temporary tables are only visible to their session"""
+        if self.table_type is TableType.TEMPORARY:
+            schema_catalog.invalidate(*self._catalog_key())
+        else:
+            schema_catalog.created(*self._catalog_key())
+
+    def _with_create_table(
+        self,
+        cursor: SnowflakeCursor,
+        statements: list[str],
+        full_refresh: bool,
+        copy_grants: bool,
+        files: list[str] | None,
+    ) -> list[str]:
+        """Adds the create table statement to the setup statements. A structure to be inferred
+        needs the stage and file format to exist, so the setup is then run first. Nothing is
+        inferred for an existing table that is not refreshed, which would not be recreated."""
+        if self.table_structure is not None or self.schema_inference is None:
+            self.create_table(full_refresh, statements.append, copy_grants)
+            return statements
+        if not full_refresh and self.exists(cursor):
+            return statements
+        _execute_setup(cursor, statements)
+        table = self.model_copy(
+            update={"table_structure": self.infer_table_structure(cursor, files)}
+        )
+        statements = []
+        table.create_table(full_refresh, statements.append, copy_grants)
+        return statements
+
+    def infer_table_structure(
+        self, cursor: SnowflakeCursor, files: list[str] | None = None
+    ) -> TableStructure:
+        """Infers the structure of the table from the files of its stage, sampled as set in
+        `schema_inference`. Inferences are cached by stage location, file format and the
+        fingerprint of the files listed, so the staging table of a merge reuses the one of its
+        target. The structure can be saved and set as `table_structure` in later runs."""
+        inference = self.schema_inference or SchemaInference()
+        files = inference.files or files
+        if files and inference.max_file_count is not None:
+            files = files[: inference.max_file_count]
+        if files:
+            listing = sorted(files)
+        else:
+            listing = sorted(
+                str(row) for row in execute(cursor, f"list @{self.stage}").fetchall()
+            )
+        key = (
+            self._stage_source or self.stage,
+            self._file_format_source or str(self.file_format),
+            hashlib.sha256("\n".join(listing).encode()).hexdigest(),
+            None if files else inference.max_file_count,
+        )
+        structure = inference_cache.get(key)
+        if structure is None:
+            structure = self._infer_schema(cursor, files, inference.max_file_count)
+            inference_cache.put(key, structure)
+        else:
+            logging.debug(f"Reusing the structure inferred for {self.fqn}")
+        columns = dict(structure.columns)
+        for m in self.include_metadata:
+            columns[m.name] = Column(name=m.name, data_type=m.data_type)
+        return TableStructure(columns=columns)
+
+    def _infer_schema(
+        self,
+        cursor: SnowflakeCursor,
+        files: list[str] | None,
+        max_file_count: int | None,
+    ) -> TableStructure:
+        options = [
+            f"LOCATION => '@{self.stage}'",
+            f"FILE_FORMAT => '{self.file_format}'",
+            "IGNORE_CASE => TRUE",
+        ]
+        if files:
+            options.append(f"FILES => ({', '.join(map(_quote_literal, files))})")
+        elif max_file_count is not None:
+            options.append(f"MAX_FILE_COUNT => {max_file_count}")
+        logging.info(f"Inferring the structure of {self.fqn} from @{self.stage}")
+        rows = execute(
+            cursor,
+            f"""select column_name, iff(startswith(type, 'NUMBER'), 'NUMBER(38,6)', type)
+                from table(infer_schema({", ".join(options)}))
+                order by order_id""",
+        ).fetchall()
+        return TableStructure(
+            columns={
+                name: Column(name=name, data_type=data_type) for name, data_type in rows
+            }
+        )
 
     def setup_file_format(
         self,
         execute_statement: callable,
         file_format: FileFormat | InlineFileFormat,
+        session: SnowflakeConnection | None = None,
     ) -> FileFormat:
+        """Creates the temporary file format of an inline definition, unless `session`
+        already holds one with the same definition"""
         if isinstance(file_format, InlineFileFormat):
-            execute_statement(
-                self.get_create_temporary_file_format_statement(
-                    file_format=file_format.definition
+            name = str(self.temporary_file_format)
+            digest = session_objects.digest(file_format.definition)
+            if session is None or not session_objects.exists(session, name, digest):
+                execute_statement(
+                    self.get_create_temporary_file_format_statement(
+                        file_format=file_format.definition
+                    )
                 )
-            )
+                if session is not None:
+                    session_objects.created(session, name, digest)
             file_format = self.temporary_file_format
+            self._file_format_source = digest
+        else:
+            self._file_format_source = str(file_format)
         self._file_format = file_format
         return file_format
 
     def get_columns(self, cursor: SnowflakeCursor) -> list[Column]:
-        data = cursor.execute(f"desc table {self.fqn}").fetchall()
-        return [
-            Column(name=name, data_type=data_type) for (name, data_type, *_) in data
-        ]
+        with tracing.span("get_columns", table=self.fqn):
+            if (cached := schema_catalog.columns(*self._catalog_key())) is not None:
+                return cached
+            data = execute(cursor, f"desc table {self.fqn}").fetchall()
+            return [
+                Column(name=name, data_type=data_type) for (name, data_type, *_) in data
+            ]
 
     def add_column(self, cursor: SnowflakeCursor, column: Column) -> None:
-        cursor.execute(
-            f"alter table {self.fqn} add column {column.name} {column.data_type}"
-        )
+        with tracing.span("add_column", table=self.fqn, column=column.name):
+            schema_catalog.invalidate(*self._catalog_key())
+            execute(
+                cursor,
+                f"alter table {self.fqn} add column {column.name} {column.data_type}",
+            )
 
     def exists(self, cursor: SnowflakeCursor) -> bool:
-        return bool(
-            cursor.execute(
-                f"select table_name from information_schema.tables where table_name ilike '{self.name}' and table_schema = '{self.schema_name}' and table_catalog = '{self.database or SnowflakeSettings().db}'"
-            ).fetchall()
-        )
+        with tracing.span("exists", table=self.fqn):
+            if (cached := schema_catalog.columns(*self._catalog_key())) is not None:
+                return bool(cached)
+            return bool(
+                execute(
+                    cursor,
+                    f"select table_name from information_schema.tables where table_name ilike '{self.name}' and table_schema = '{self.schema_name}' and table_catalog = '{self.database or SnowflakeSettings().db}'",
+                ).fetchall()
+            )
 
     def _merge(
         self,
@@ -324,42 +1150,421 @@ class Table(BaseModel):
         primary_keys: list[str] = ["id"],
         replication_keys: list[str] | None = None,
         qualify: bool = False,
-    ) -> None:
-        with connect() as connection:
+        connection: SnowflakeConnection | None = None,
+        staging_table_type: TableType = TableType.PERMANENT,
+        qualify_mode: QualifyMode = QualifyMode.REWRITE,
+        skip_unchanged: bool = False,
+        pruning_column: str | None = None,
+        strategy: MergeStrategy = MergeStrategy.MERGE,
+        partitions: int | None = None,
+        start_partition: int = 0,
+    ) -> MergeResult:
+        _check_start_partition(partitions, start_partition)
+        result = MergeResult()
+        phases = result.phases
+        with (
+            tracing.span(
+                "Table.merge",
+                table=self.fqn,
+                strategy=strategy.value,
+                staging_table_type=staging_table_type.value,
+                qualify=qualify,
+                partitions=partitions,
+            ) as span,
+            connection_pool.connection(connection, self._settings()) as connection,
+        ):
             cursor = connection.cursor()
-            if not self.exists(cursor):
-                copy_callable(self, sync_tags=True)
+            exists = self.exists(cursor)
+            span.set_attribute("target_exists", exists)
+            if not exists:
+                with timed(phases, "copy"):
+                    load = copy_callable(self, sync_tags=True, connection=connection)
                 if qualify:
-                    self.qualify(cursor, primary_keys, replication_keys)
-                return None
-
-        temp_table = self.model_copy(update={"name": f"{self.name}_temp"})
-        copy_callable(temp_table, sync_tags=False)
-        if qualify:
-            with connect() as connection:
-                cursor = connection.cursor()
-                temp_table.qualify(cursor, primary_keys, replication_keys)
-
-        with connect() as connection:
+                    with timed(phases, "qualify"):
+                        self.qualify(cursor, primary_keys, replication_keys)
+                result.set_load(load, into_target=True)
+                return result
+
+            temp_table = self._staging_table(staging_table_type)
+            with temp_table._discarded_on_error(cursor):
+                with timed(phases, "copy"):
+                    load = copy_callable(
+                        temp_table, sync_tags=False, connection=connection
+                    )
+                result.set_load(load)
+                qualify_source = qualify and qualify_mode is QualifyMode.SOURCE
+                if qualify and not qualify_source:
+                    with timed(phases, "qualify"):
+                        temp_table.qualify(cursor, primary_keys, replication_keys)
+
+                with timed(phases, "prepare"):
+                    groups = self._prepare_merge(
+                        cursor,
+                        temp_table,
+                        primary_keys,
+                        replication_keys if qualify_source else None,
+                        qualify_source,
+                        skip_unchanged,
+                        pruning_column,
+                        strategy,
+                        partitions,
+                    )
+                with timed(phases, "merge"):
+                    for index in range(start_partition, len(groups)):
+                        with self._partition_progress(index, len(groups)):
+                            for applied in _execute_all(cursor, groups[index]):
+                                result.add(*applied)
+                if self.table_structure:
+                    with timed(phases, "sync_tags"):
+                        self.sync_tags(cursor)
+            with timed(phases, "drop"):
+                temp_table.drop(cursor)
+            return result
+
+    def _swap_refresh(
+        self,
+        load: Callable[["Table", SnowflakeConnection], T],
+        create_table: bool,
+        connection: SnowflakeConnection | None = None,
+    ) -> T:
+        """Fully refreshes the table by loading a shadow table and swapping it in.
+
+        The shadow table is first cloned from this table with its grants, so that recreating it
+        with COPY GRANTS carries them over, then loaded and tagged. The swap is a metadata-only
+        operation: readers see the old data until then, and a failed load leaves the table untouched.
+        """
+        if not create_table:
+            raise ValueError("A swap full refresh needs to create the shadow table")
+        with connection_pool.connection(connection, self._settings()) as connection:
             cursor = connection.cursor()
-            cursor.execute(
-                self.get_create_table_statement(full_refresh=False, copy_grants=True)
+            shadow = self._loading_for(
+                f"{self.name}_swap_{uuid4().hex[:12]}",
+                existing_column_tags=None,
+                existing_table_tags=None,
             )
-            old_columns = {x.name: x.data_type for x in self.get_columns(cursor)}
-            new_columns = temp_table.get_columns(cursor)
-
-            for column in new_columns:
-                if column.name not in old_columns:
-                    self.add_column(cursor, column)
-
-            cursor.execute(
+            exists = self.exists(cursor)
+            try:
+                if exists:
+                    execute(
+                        cursor,
+                        f"create table {shadow.fqn} clone {self.fqn} copy grants",
+                    )
+                result = load(shadow, connection)
+                if exists:
+                    execute(cursor, f"alter table {self.fqn} swap with {shadow.fqn}")
+                else:
+                    execute(cursor, f"alter table {shadow.fqn} rename to {self.fqn}")
+                    schema_catalog.dropped(*shadow._catalog_key())
+                    tag_catalog.dropped(*shadow._catalog_key())
+            except BaseException:
+                with suppress(Exception):
+                    shadow.drop(cursor, if_exists=True)
+                raise
+            self._created()
+            tag_catalog.invalidate(*self._catalog_key())
+            if exists:
+                shadow.drop(cursor)
+            return result
+
+    @contextmanager
+    def _partition_progress(self, index: int, count: int) -> Iterator[None]:
+        """Logs the progress of partitioned merges, and where to resume them from on failure"""
+        with tracing.span("partition", index=index, partitions=count):
+            try:
+                yield
+            except BaseException:
+                if count > 1:
+                    logging.error(
+                        f"Merge into {self.fqn} failed on partition {index + 1}/{count}, "
+                        f"it can be resumed with start_partition={index}"
+                    )
+                raise
+            if count > 1:
+                logging.info(f"Merged partition {index + 1}/{count} into {self.fqn}")
+
+    def _staging_table(self, table_type: TableType) -> "Table":
+        """The table the data is copied into before being merged. Temporary and transient
+        staging tables get a unique name, so that concurrent merges into the same table do not collide.
+        The temporary file format and stage are named after this table, so they are reused.
+        """
+        name = f"{self.name}_temp"
+        if table_type is not TableType.PERMANENT:
+            name = f"{name}_{uuid4().hex[:12]}"
+        return self._loading_for(name, table_type=table_type)
+
+    @contextmanager
+    def _discarded_on_error(self, cursor: SnowflakeCursor) -> Iterator[None]:
+        """Drops a uniquely named staging table if the merge fails, as it would otherwise be left behind"""
+        try:
+            yield
+        except BaseException:
+            if self.table_type is not TableType.PERMANENT:
+                with suppress(Exception):
+                    self.drop(cursor, if_exists=True)
+            raise
+
+    def _prepare_merge(
+        self,
+        cursor: SnowflakeCursor,
+        temp_table: "Table",
+        primary_keys: list[str],
+        replication_keys: list[str] | None = None,
+        qualify_source: bool = False,
+        skip_unchanged: bool = False,
+        pruning_column: str | None = None,
+        strategy: MergeStrategy = MergeStrategy.MERGE,
+        partitions: int | None = None,
+    ) -> list[list[str]]:
+        """Adds the columns of the staging table missing from this table and returns
+        the statements loading the staging table into it with the given strategy,
+        grouped by hash partition of the primary keys if `partitions` is set"""
+        old_columns = {x.name: x.data_type for x in self.get_columns(cursor)}
+        new_columns = temp_table.get_columns(cursor)
+
+        for column in new_columns:
+            if column.name not in old_columns:
+                self.add_column(cursor, column)
+
+        pruning_predicate = None
+        if pruning_column:
+            pruning_predicate = temp_table._pruning_predicate(
+                cursor, pruning_column, new_columns
+            )
+        if strategy is MergeStrategy.AUTO:
+            strategy = (
+                MergeStrategy.MERGE
+                if self._overlaps(cursor, temp_table, primary_keys, pruning_predicate)
+                else MergeStrategy.APPEND
+            )
+            logging.info(f"Merging into {self.fqn} with strategy {strategy.value}")
+
+        def statements(partition: tuple[int, int] | None) -> list[str]:
+            insert = self._insert_statement(
+                temp_table,
+                new_columns,
+                old_columns,
+                primary_keys,
+                replication_keys,
+                qualify_source,
+                partition,
+            )
+            if strategy is MergeStrategy.APPEND:
+                return [insert]
+            if strategy is MergeStrategy.DELETE_INSERT:
+                return [
+                    self._delete_statement(
+                        temp_table, primary_keys, pruning_predicate, partition
+                    ),
+                    insert,
+                ]
+            return [
                 self._merge_statement(
-                    temp_table, new_columns, old_columns, primary_keys
+                    temp_table,
+                    new_columns,
+                    old_columns,
+                    primary_keys,
+                    replication_keys,
+                    qualify_source,
+                    skip_unchanged,
+                    pruning_predicate,
+                    partition,
                 )
+            ]
+
+        if not partitions:
+            return [statements(None)]
+        return [statements((index, partitions)) for index in range(partitions)]
+
+    def _overlaps(
+        self,
+        cursor: SnowflakeCursor,
+        temp_table: "Table",
+        primary_keys: list[str],
+        pruning_predicate: str | None,
+    ) -> bool:
+        """Whether any staged primary key already exists in this table, stopping at the first match"""
+        return (
+            execute(
+                cursor,
+                f"select 1 from {temp_table.fqn} tmp join {self.fqn} dest on {_join_condition(primary_keys, pruning_predicate)} limit 1",
+            ).fetchone()
+            is not None
+        )
+
+    def _delete_statement(
+        self,
+        temp_table: "Table",
+        primary_keys: list[str],
+        pruning_predicate: str | None = None,
+        partition: tuple[int, int] | None = None,
+    ) -> str:
+        source = _merge_source(temp_table.fqn, primary_keys, None, False, partition)
+        return f"""
+            delete from {self.fqn} as dest
+            using {source} tmp
+            where {_join_condition(primary_keys, pruning_predicate)}
+        """
+
+    def _insert_statement(
+        self,
+        temp_table: "Table",
+        columns: list[Column],
+        old_columns: dict[str, str],
+        primary_keys: list[str],
+        replication_keys: list[str] | None = None,
+        qualify_source: bool = False,
+        partition: tuple[int, int] | None = None,
+    ) -> str:
+        column_names = ",".join(f'"{c.name}"' for c in columns)
+        source = _merge_source(
+            temp_table.fqn, primary_keys, replication_keys, qualify_source, partition
+        )
+        return f"""
+            insert into {self.fqn} ({column_names})
+            select {_inserts(columns, old_columns)} from {source} tmp
+        """
+
+    def _pruning_predicate(
+        self, cursor: SnowflakeCursor, column_name: str, columns: list[Column]
+    ) -> str | None:
+        """Restricts the merge target to the range of `column_name` found in this staging table.
+        Values are read back as text, with a full precision format for the temporal types,
+        and converted back to the column type, so that they round-trip exactly. Only integer,
+        text and temporal columns are supported, FLOAT or scaled NUMBER bounds could be rounded.
+        """
+        column = next(
+            (c for c in columns if c.name.upper() == column_name.upper()), None
+        )
+        if column is None:
+            raise ValueError(f"Pruning column {column_name} not found in {self.fqn}")
+        temporal = _TEMPORAL_FORMATS.get(column.data_type.split("(")[0].strip().upper())
+        if not temporal and not _round_trips_as_text(column.data_type):
+            raise ValueError(
+                f"Pruning column {column.name} must be an integer, text, date or timestamp column, not {column.data_type}"
             )
-            if self.table_structure:
-                self.sync_tags(cursor)
-            temp_table.drop(cursor)
+        name = f'"{column.name}"'
+        text = f"to_varchar({{}}, '{temporal[1]}')" if temporal else "{}::varchar"
+        low, high = execute(
+            cursor,
+            f"select {text.format(f'min({name})')}, {text.format(f'max({name})')} from {self.fqn}",
+        ).fetchone()
+        if low is None:
+            return None
+        logging.debug(f"Pruning merge on {column.name} between {low} and {high}")
+
+        def bound(value: str) -> str:
+            if temporal:
+                return f"{temporal[0]}({_quote_literal(value)}, '{temporal[1]}')"
+            return f"{_quote_literal(value)}::{column.data_type}"
+
+        return f"dest.{name} between {bound(low)} and {bound(high)}"
+
+    async def merge_async(
+        self,
+        path: str,
+        file_format: InlineFileFormat | FileFormat,
+        primary_keys: list[str] = ["id"],
+        replication_keys: list[str] | None = None,
+        storage_integration: str | None = None,
+        match_by_column_name: MatchByColumnName = MatchByColumnName.CASE_INSENSITIVE,
+        qualify: bool = False,
+        files: list[str] | None = None,
+        copy_grants: bool = True,
+        stage: str | None = None,
+        connection: SnowflakeConnection | None = None,
+        staging_table_type: TableType = TableType.PERMANENT,
+        qualify_mode: QualifyMode = QualifyMode.REWRITE,
+        skip_unchanged: bool = False,
+        pruning_column: str | None = None,
+        strategy: MergeStrategy = MergeStrategy.MERGE,
+        partitions: int | None = None,
+        start_partition: int = 0,
+    ) -> MergeResult:
+        """Same as `merge`, but the COPY, QUALIFY and MERGE statements are submitted
+        asynchronously and polled with backoff. Short metadata statements run in a worker thread.
+        """
+        _check_start_partition(partitions, start_partition)
+        copy = partial(
+            Table.copy_into_async,
+            path=path,
+            storage_integration=storage_integration,
+            file_format=file_format,
+            match_by_column_name=match_by_column_name,
+            files=files,
+            copy_grants=copy_grants,
+            stage=stage,
+        )
+        with tracing.span(
+            "Table.merge",
+            table=self.fqn,
+            strategy=strategy.value,
+            staging_table_type=staging_table_type.value,
+            qualify=qualify,
+            partitions=partitions,
+        ) as span:
+            async with connection_pool.connection_async(
+                connection, self._settings()
+            ) as connection:
+                cursor = connection.cursor()
+                result = MergeResult()
+                phases = result.phases
+                exists = await asyncio.to_thread(self.exists, cursor)
+                span.set_attribute("target_exists", exists)
+                if not exists:
+                    with timed(phases, "copy"):
+                        load = await copy(self, sync_tags=True, connection=connection)
+                    if qualify:
+                        with timed(phases, "qualify"):
+                            await execute_statement_async(
+                                cursor,
+                                self._qualify_statement(primary_keys, replication_keys),
+                            )
+                    result.set_load(load, into_target=True)
+                    return result
+
+                temp_table = self._staging_table(staging_table_type)
+                with temp_table._discarded_on_error(cursor):
+                    with timed(phases, "copy"):
+                        load = await copy(
+                            temp_table, sync_tags=False, connection=connection
+                        )
+                    result.set_load(load)
+                    qualify_source = qualify and qualify_mode is QualifyMode.SOURCE
+                    if qualify and not qualify_source:
+                        with timed(phases, "qualify"):
+                            await execute_statement_async(
+                                cursor,
+                                temp_table._qualify_statement(
+                                    primary_keys, replication_keys
+                                ),
+                            )
+
+                    with timed(phases, "prepare"):
+                        groups = await asyncio.to_thread(
+                            self._prepare_merge,
+                            cursor,
+                            temp_table,
+                            primary_keys,
+                            replication_keys if qualify_source else None,
+                            qualify_source,
+                            skip_unchanged,
+                            pruning_column,
+                            strategy,
+                            partitions,
+                        )
+                    with timed(phases, "merge"):
+                        for index in range(start_partition, len(groups)):
+                            with self._partition_progress(index, len(groups)):
+                                for applied in await _execute_all_async(
+                                    cursor, groups[index]
+                                ):
+                                    result.add(*applied)
+                    if self.table_structure:
+                        with timed(phases, "sync_tags"):
+                            await asyncio.to_thread(self.sync_tags, cursor)
+                with timed(phases, "drop"):
+                    await asyncio.to_thread(temp_table.drop, cursor)
+                return result
 
     def merge(
         self,
@@ -373,8 +1578,20 @@ class Table(BaseModel):
         files: list[str] | None = None,
         copy_grants: bool = True,
         stage: str | None = None,
-    ) -> None:
-        def copy_callable(table: Table, sync_tags: bool) -> None:
+        connection: SnowflakeConnection | None = None,
+        staging_table_type: TableType = TableType.PERMANENT,
+        qualify_mode: QualifyMode = QualifyMode.REWRITE,
+        skip_unchanged: bool = False,
+        pruning_column: str | None = None,
+        strategy: MergeStrategy = MergeStrategy.MERGE,
+        partitions: int | None = None,
+        start_partition: int = 0,
+    ) -> MergeResult:
+        def copy_callable(
+            table: Table,
+            sync_tags: bool,
+            connection: SnowflakeConnection | None = None,
+        ) -> LoadResult:
             return table.copy_into(
                 path=path,
                 storage_integration=storage_integration,
@@ -384,9 +1601,23 @@ class Table(BaseModel):
                 files=files,
                 copy_grants=copy_grants,
                 stage=stage,
+                connection=connection,
             )
 
-        return self._merge(copy_callable, primary_keys, replication_keys, qualify)
+        return self._merge(
+            copy_callable,
+            primary_keys,
+            replication_keys,
+            qualify,
+            connection,
+            staging_table_type,
+            qualify_mode,
+            skip_unchanged,
+            pruning_column,
+            strategy,
+            partitions,
+            start_partition,
+        )
 
     def setup_connection(
         self,
@@ -396,22 +1627,41 @@ class Table(BaseModel):
         file_format: FileFormat | InlineFileFormat,
         stage: str | None = None,
     ) -> callable:
-        """Setup the connection including custom role, database, schema, and temporary stage"""
-        _execute_statement = partial(execute_statement, cursor)
-        if self.role is not None:
+        """Setup the connection including custom role, database, schema, and temporary stage,
+        submitting all the statements needed in a single request"""
+        _execute_setup(
+            cursor,
+            self._setup_statements(
+                path, storage_integration, cursor, file_format, stage
+            ),
+        )
+        return partial(execute_statement, cursor)
+
+    def _setup_statements(
+        self,
+        path: str,
+        storage_integration: str,
+        cursor: SnowflakeCursor,
+        file_format: FileFormat | InlineFileFormat,
+        stage: str | None = None,
+    ) -> list[str]:
+        statements = []
+        # Pooled sessions may already carry the required context
+        session = cursor.connection
+        if self.role is not None and not _session_has(session.role, self.role):
             logging.debug(f"Using role: {self.role}")
-            _execute_statement(f"USE ROLE {self.role}")
+            statements.append(f"USE ROLE {self.role}")
 
         # If we don't have database in FQN, we need to set the database context
         if self.database is None:
             default_db = SnowflakeSettings().db
-            logging.debug(f"Using default database: {default_db}")
-            _execute_statement(f"USE DATABASE {default_db}")
-
-        self.setup_file_format(_execute_statement, file_format)
-        self.setup_stage(_execute_statement, storage_integration, path, stage)
+            if not _session_has(session.database, default_db):
+                logging.debug(f"Using default database: {default_db}")
+                statements.append(f"USE DATABASE {default_db}")
 
-        return _execute_statement
+        self.setup_file_format(statements.append, file_format, session)
+        self.setup_stage(statements.append, storage_integration, path, stage, session)
+        return statements
 
     def setup_stage(
         self,
@@ -419,40 +1669,102 @@ class Table(BaseModel):
         storage_integration: str | None = None,
         path: str | None = None,
         stage: str | None = None,
+        session: SnowflakeConnection | None = None,
     ) -> None:
+        """Points the table at a named stage, or creates a temporary one on the path
+        unless `session` already holds one with the same URL and storage integration"""
         if stage:
-            self._stage = f"{stage}/{path}"
+            self._stage = self._stage_source = f"{stage}/{path}"
             return None
 
         if storage_integration and path:
-            execute_statement(
-                self.get_create_temporary_external_stage(path, storage_integration)
-            )
+            digest = session_objects.digest(path, storage_integration)
+            if session is None or not session_objects.exists(
+                session, self.temporary_stage, digest
+            ):
+                execute_statement(
+                    self.get_create_temporary_external_stage(path, storage_integration)
+                )
+                if session is not None:
+                    session_objects.created(session, self.temporary_stage, digest)
             self._stage = self.temporary_stage
+            self._stage_source = digest
 
     def qualify(
         self,
         cursor: SnowflakeCursor,
         primary_keys: list[str],
         replication_keys: list[str] | None,
+        qualify_mode: QualifyMode = QualifyMode.REWRITE,
     ) -> None:
+        if qualify_mode is QualifyMode.INCREMENTAL:
+            return execute(
+                cursor,
+                self._incremental_qualify_statement(primary_keys, replication_keys),
+            )
+        return execute(cursor, self._qualify_statement(primary_keys, replication_keys))
+
+    def _check_incremental_qualify(
+        self, replication_keys: list[str] | None
+    ) -> MetadataColumn:
+        """Returns the scan time column, checking an incremental qualify can tell the rows apart"""
+        if not replication_keys:
+            raise ValueError(
+                "Incremental qualify requires replication keys: the rows of a load share their "
+                "scan time, so duplicates within a load could not be removed"
+            )
+        return self._scan_time_column()
+
+    def _scan_time_column(self) -> MetadataColumn:
+        for column in self.include_metadata:
+            if column.metadata.upper() == "START_SCAN_TIME":
+                return column
+        raise ValueError(
+            "Incremental qualify requires a START_SCAN_TIME column in include_metadata"
+        )
+
+    def _incremental_qualify_statement(
+        self, primary_keys: list[str], replication_keys: list[str] | None
+    ) -> str:
+        """Deletes the rows superseded by the last load, for the primary keys it touched only.
+        The loaded rows are those scanned since `$LOAD_STARTED_AT`, set before the COPY.
+        Rows are ranked so that exact duplicates, which cannot be told apart, are all kept."""
         if not primary_keys:
             raise ValueError("Primary keys are required for qualifying")
-        qualify_partition = ",".join(f'"{c.upper()}"' for c in primary_keys)
-        qualify_order = ",".join(
-            f'"{c.upper()}" desc' for c in (replication_keys or primary_keys)
+        scan_time = (
+            f'"{self._check_incremental_qualify(replication_keys).name.upper()}"'
         )
-        logging.debug(
-            f"Adding QUALIFY to table {self.fqn} on PARTITION {qualify_partition} ORDERED BY {qualify_order}"
+        keys = [f'"{c.upper()}"' for c in primary_keys]
+        order = [f'"{c.upper()}"' for c in replication_keys] + [scan_time]
+        key_list = ", ".join(keys)
+        columns = ", ".join(dict.fromkeys(keys + order))
+        matches = " and ".join(
+            f"dest.{c} = superseded.{c}" for c in dict.fromkeys(keys + order)
         )
-        return cursor.execute(
-            f"""
-        create or replace table {self.fqn} as (
+        logging.debug(f"Deleting superseded rows in {self.fqn} on PARTITION {key_list}")
+        return f"""
+        delete from {self.fqn} as dest using (
+            select {columns} from {self.fqn}
+            where ({key_list}) in (
+                select {key_list} from {self.fqn} where {scan_time} >= ${_LOAD_STARTED_AT}
+            )
+            qualify rank() over (partition by {key_list} order by {", ".join(f"{c} desc" for c in order)}) > 1
+        ) as superseded
+        where {matches}
+        """
+
+    def _qualify_statement(
+        self, primary_keys: list[str], replication_keys: list[str] | None
+    ) -> str:
+        logging.debug(f"Adding QUALIFY to table {self.fqn}")
+        # The table is recreated, without its tags
+        tag_catalog.invalidate(*self._catalog_key())
+        return f"""
+        {self._create_clause(full_refresh=True).lower()} {self.fqn}{self._retention_clause()} as (
             select * from {self.fqn}
-            qualify row_number() over (partition by {qualify_partition} order by {qualify_order}) = 1
+            {_qualify_clause(primary_keys, replication_keys)}
             )
         """
-        )
 
     def _merge_statement(
         self,
@@ -460,11 +1772,25 @@ class Table(BaseModel):
         columns: list[Column],
         old_columns: dict[str, str],
         primary_keys: list[str],
+        replication_keys: list[str] | None = None,
+        qualify_source: bool = False,
+        skip_unchanged: bool = False,
+        pruning_predicate: str | None = None,
+        partition: tuple[int, int] | None = None,
     ) -> str:
-        pkes = " and ".join(
-            f'dest."{c.upper()}" = tmp."{c.upper()}"' for c in primary_keys
-        )
-        matched = _matched(columns, old_columns)
+        """Merges the staging table, or one of its hash partitions, into this table. With `qualify_source` the staging table
+        is deduplicated in the USING subquery, keeping the latest row per primary key.
+        With `skip_unchanged` only the rows with at least one different value are updated.
+        A `pruning_predicate` on the target is added to the join condition."""
+        pkes = _join_condition(primary_keys, pruning_predicate)
+        keys = {c.upper() for c in primary_keys}
+        updates = [c for c in columns if c.name.upper() not in keys]
+        when_matched = ""
+        if updates:
+            condition = (
+                f" and ({_changed(updates, old_columns)})" if skip_unchanged else ""
+            )
+            when_matched = f"when matched{condition} then update set {_matched(updates, old_columns)}"
         column_names = ",".join(f'"{c.name}"' for c in columns)
         inserts = _inserts(columns, old_columns)
 
@@ -472,19 +1798,27 @@ class Table(BaseModel):
             f"Running merge statement on table: {self.fqn} using {temp_table.fqn}"
         )
         logging.debug(f"Primary keys: {pkes}")
+        source = _merge_source(
+            temp_table.fqn, primary_keys, replication_keys, qualify_source, partition
+        )
         return f"""
             merge into {self.fqn} as dest 
-            using {temp_table.fqn} tmp
+            using {source} tmp
             ON {pkes}
-            when matched then update set {matched}
+            {when_matched}
             when not matched then insert ({column_names}) VALUES ({inserts})
         """
 
-    def drop(self, cursor: SnowflakeCursor | None = None) -> None:
+    def drop(
+        self, cursor: SnowflakeCursor | None = None, if_exists: bool = False
+    ) -> None:
         if cursor is None:
-            cursor = connect().cursor()
+            with connection_pool.connection(settings=self._settings()) as connection:
+                return self.drop(connection.cursor(), if_exists)
         logging.debug(f"Dropping table:{self.fqn}")
-        cursor.execute(f"drop table {self.fqn}")
+        execute(cursor, f"drop table {'if exists ' if if_exists else ''}{self.fqn}")
+        schema_catalog.dropped(*self._catalog_key())
+        tag_catalog.dropped(*self._catalog_key())
 
     def single_column_update(
         self, cursor: SnowflakeCursor, target_column: Column, new_column: Column
@@ -493,24 +1827,27 @@ class Table(BaseModel):
         logging.debug(
             f"Updating the value of {target_column.name} with {new_column.name} in the table {self.name}"
         )
-        cursor.execute(
-            f"UPDATE {self.fqn} SET {target_column.name} = {new_column.name};"
+        execute(
+            cursor, f"UPDATE {self.fqn} SET {target_column.name} = {new_column.name};"
         )
 
     def _current_tags(
         self, level: TagLevel, cursor: SnowflakeCursor
     ) -> list[tuple[str, str, str]]:
-        cursor.execute(
+        execute(
+            cursor,
             f"""select lower(column_name) as column_name, lower(tag_name) as tag_name, tag_value
                 from table(information_schema.tag_references_all_columns('{self.fqn}', 'table'))
                 where lower(level) = '{level.value}'
-                """
+                """,
         )
         return cursor.fetchall()
 
     def current_column_tags(self, cursor: SnowflakeCursor) -> dict[str, dict[str, str]]:
         if self.existing_column_tags is not None:
             return self.existing_column_tags
+        if (cached := tag_catalog.column_tags(*self._catalog_key())) is not None:
+            return cached
 
         tags = defaultdict(dict)
 
@@ -523,75 +1860,121 @@ class Table(BaseModel):
     def current_table_tags(self, cursor: SnowflakeCursor) -> dict[str, str]:
         if self.existing_table_tags is not None:
             return self.existing_table_tags
+        if (cached := tag_catalog.table_tags(*self._catalog_key())) is not None:
+            return cached
         return {
             tag_name.casefold(): tag_value
             for _, tag_name, tag_value in self._current_tags(TagLevel.TABLE, cursor)
         }
 
-    def sync_tags_table(self, cursor: SnowflakeCursor) -> None:
-        tags = self.current_table_tags(cursor=cursor)
-        desired_tags = {k.casefold(): v for k, v in self.table_structure.tags.items()}
-        for tag_name in desired_tags:
-            if tag_name not in tags:
-                self._set_table_tag(cursor, desired_tags, tag_name)
-        for tag_name in tags:
-            if tag_name not in desired_tags:
-                self._unset_table_tag(cursor, tag_name)
-
-    def _unset_table_tag(self, cursor, tag_name):
-        cursor.execute(
-            f"ALTER TABLE {self.fqn} UNSET TAG {governance_settings.fqn(tag_name)}"
-        )
-
-    def _set_table_tag(self, cursor, desired_tags, tag_name):
-        cursor.execute(
-            f"ALTER TABLE {self.fqn} SET TAG {governance_settings.fqn(tag_name)} = '{desired_tags[tag_name]}'"
-        )
-
-    def sync_tags(self, cursor: SnowflakeCursor) -> None:
-        self.sync_tags_table(cursor)
-        self.sync_tags_columns(cursor)
-
-    def sync_tags_columns(self, cursor: SnowflakeCursor) -> None:
-        tags = self.current_column_tags(cursor)
-        existing_tags = {
-            f"{column}.{tag_name}.{tags[column][tag_name]}".casefold(): (
-                column,
-                tag_name,
-                tags[column][tag_name],
+    def sync_tags_table(self, cursor: SnowflakeCursor) -> int:
+        """Applies the table tags of the table structure with at most one UNSET and one SET statement.
+        Returns the number of statements issued."""
+        with tracing.span("sync_tags_table", table=self.fqn) as span:
+            tags = {
+                k.casefold(): v
+                for k, v in self.current_table_tags(cursor=cursor).items()
+            }
+            desired_tags = {
+                k.casefold(): v for k, v in self.table_structure.tags.items()
+            }
+            statements = self._table_tag_statements(
+                to_set={
+                    tag_name: tag_value
+                    for tag_name, tag_value in desired_tags.items()
+                    if not _same_tag_value(tags.get(tag_name), tag_value)
+                },
+                to_unset=[
+                    tag_name for tag_name in tags if tag_name not in desired_tags
+                ],
             )
-            for column in tags
-            for tag_name in tags[column]
-        }
-
-        desired_tags = {
-            f"{column}.{tag_name}.{tag_value}".casefold(): (column, tag_name, tag_value)
-            for column in self.table_structure.columns
-            for tag_name, tag_value in self.table_structure.columns[
-                column.casefold()
-            ].tags.items()
-        }
-
-        for tag in existing_tags:
-            if tag not in desired_tags:
-                column, tag_name, _value = existing_tags[tag]
-                self._unset_column_tag(cursor, column, tag_name)
-
-        for tag in desired_tags:
-            if tag not in existing_tags:
-                self._set_column_tag(cursor, *desired_tags[tag])
-
-    def _set_column_tag(
-        self, cursor: SnowflakeCursor, column: str, tag_name: str, tag_value: str
+            self._apply_tag_statements(cursor, statements)
+            span.set_attribute("statements", len(statements))
+            return len(statements)
+
+    def _table_tag_statements(
+        self, to_set: dict[str, str], to_unset: list[str]
+    ) -> list[str]:
+        statements = []
+        if to_unset:
+            unset = ", ".join(governance_settings.fqn(t) for t in to_unset)
+            statements.append(f"ALTER TABLE {self.fqn} UNSET TAG {unset}")
+        if to_set:
+            statements.append(
+                f"ALTER TABLE {self.fqn} SET TAG {_tag_assignments(to_set)}"
+            )
+        return statements
+
+    def sync_tags(self, cursor: SnowflakeCursor) -> int:
+        """Syncs table and column tags, returning the number of statements issued"""
+        with tracing.span("Table.sync_tags", table=self.fqn) as span:
+            issued = self.sync_tags_table(cursor) + self.sync_tags_columns(cursor)
+            logging.debug(f"Synced tags on {self.fqn} with {issued} statements")
+            span.set_attribute("statements", issued)
+            return issued
+
+    def sync_tags_columns(self, cursor: SnowflakeCursor) -> int:
+        """Applies the column tags of the table structure with at most one UNSET and one SET
+        statement, each modifying all the affected columns. Returns the number of statements issued.
+        """
+        with tracing.span("sync_tags_columns", table=self.fqn) as span:
+            tags = {
+                column.casefold(): {k.casefold(): v for k, v in column_tags.items()}
+                for column, column_tags in self.current_column_tags(cursor).items()
+            }
+            desired_tags = {
+                column: {
+                    k.casefold(): v
+                    for k, v in self.table_structure.columns[column].tags.items()
+                }
+                for column in self.table_structure.columns
+            }
+
+            to_unset = defaultdict(list)
+            for column, column_tags in tags.items():
+                for tag_name in column_tags:
+                    if tag_name not in desired_tags.get(column, {}):
+                        to_unset[column].append(tag_name)
+
+            to_set = defaultdict(dict)
+            for column, column_tags in desired_tags.items():
+                for tag_name, tag_value in column_tags.items():
+                    if not _same_tag_value(
+                        tags.get(column, {}).get(tag_name), tag_value
+                    ):
+                        to_set[column][tag_name] = tag_value
+
+            statements = self._column_tag_statements(to_set, to_unset)
+            self._apply_tag_statements(cursor, statements)
+            span.set_attribute("statements", len(statements))
+            return len(statements)
+
+    def _apply_tag_statements(
+        self, cursor: SnowflakeCursor, statements: list[str]
     ) -> None:
-        cursor.execute(
-            f"""ALTER TABLE {self.fqn} MODIFY COLUMN "{column.upper()}" SET TAG {governance_settings.fqn(tag_name)} = '{tag_value}'"""
-        )
-
-    def _unset_column_tag(self, cursor: SnowflakeCursor, column: str, tag: str) -> None:
-        cursor.execute(
-            f'ALTER TABLE {self.fqn} MODIFY COLUMN "{column.upper()}" UNSET TAG {governance_settings.fqn(tag)}'
-        )
+        if not statements:
+            return None
+        tag_catalog.invalidate(*self._catalog_key())
+        for statement in statements:
+            execute(cursor, statement)
+
+    def _column_tag_statements(
+        self, to_set: dict[str, dict[str, str]], to_unset: dict[str, list[str]]
+    ) -> list[str]:
+        statements = []
+        if to_unset:
+            unset = ", ".join(
+                f'COLUMN "{column.upper()}" UNSET TAG {", ".join(governance_settings.fqn(t) for t in tag_names)}'
+                for column, tag_names in to_unset.items()
+            )
+            statements.append(f"ALTER TABLE {self.fqn} MODIFY {unset}")
+        if to_set:
+            assignments = ", ".join(
+                f'COLUMN "{column.upper()}" SET TAG {_tag_assignments(column_tags)}'
+                for column, column_tags in to_set.items()
+            )
+            statements.append(f"ALTER TABLE {self.fqn} MODIFY {assignments}")
+        return statements
 
     def copy_custom(
         self,
@@ -605,22 +1988,40 @@ class Table(BaseModel):
         files: list[str] | None = None,
         create_table: bool = True,
         copy_grants: bool = True,
-    ) -> None:
+        connection: SnowflakeConnection | None = None,
+        swap: bool = False,
+        copy_concurrency: int = 4,
+        chunk_retries: int = 1,
+    ) -> LoadResult:
+        if full_refresh and swap:
+            return self._swap_refresh(
+                lambda shadow, connection: shadow.copy_custom(
+                    column_definitions,
+                    path=path,
+                    file_format=file_format,
+                    storage_integration=storage_integration,
+                    full_refresh=True,
+                    sync_tags=True,
+                    stage=stage,
+                    files=files,
+                    create_table=create_table,
+                    copy_grants=True,
+                    connection=connection,
+                    copy_concurrency=copy_concurrency,
+                    chunk_retries=chunk_retries,
+                ),
+                create_table,
+                connection,
+            )
         column_names = ", ".join(column_definitions.keys())
         definitions = ", ".join(column_definitions.values())
 
-        files_clause = ""
-        if files:
-            # Format files list properly for Snowflake FILES clause
-            files_str = "', '".join(files)
-            files_clause = f"FILES = ('{files_str}')"
-
         query = f"""
                 COPY INTO {self.fqn} ({column_names})
                 FROM 
                 (select {definitions} from @{stage}/{path})
                 FILE_FORMAT = ( FORMAT_NAME ='{{file_format}}')
-                {files_clause}
+                {{files_clause}}
                 """
         return self._copy(
             query,
@@ -632,6 +2033,10 @@ class Table(BaseModel):
             stage,
             create_table,
             copy_grants,
+            connection=connection,
+            files=files,
+            copy_concurrency=copy_concurrency,
+            chunk_retries=chunk_retries,
         )
 
     def merge_custom(
@@ -646,8 +2051,20 @@ class Table(BaseModel):
         files: list[str] | None = None,
         create_table: bool = True,
         copy_grants: bool = True,
-    ) -> None:
-        def copy_callable(table: Table, sync_tags: bool) -> None:
+        connection: SnowflakeConnection | None = None,
+        staging_table_type: TableType = TableType.PERMANENT,
+        qualify_mode: QualifyMode = QualifyMode.REWRITE,
+        skip_unchanged: bool = False,
+        pruning_column: str | None = None,
+        strategy: MergeStrategy = MergeStrategy.MERGE,
+        partitions: int | None = None,
+        start_partition: int = 0,
+    ) -> MergeResult:
+        def copy_callable(
+            table: Table,
+            sync_tags: bool,
+            connection: SnowflakeConnection | None = None,
+        ) -> LoadResult:
             return table.copy_custom(
                 column_definitions,
                 path=path,
@@ -658,6 +2075,20 @@ class Table(BaseModel):
                 files=files,
                 create_table=create_table,
                 copy_grants=copy_grants,
+                connection=connection,
             )
 
-        return self._merge(copy_callable, primary_keys, replication_keys, qualify)
+        return self._merge(
+            copy_callable,
+            primary_keys,
+            replication_keys,
+            qualify,
+            connection,
+            staging_table_type,
+            qualify_mode,
+            skip_unchanged,
+            pruning_column,
+            strategy,
+            partitions,
+            start_partition,
+        )
@@ -1,7 +1,232 @@
+import csv
+import gzip
+import json
+import re
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from decimal import Decimal
+from pathlib import Path
+from typing import TYPE_CHECKING, NamedTuple, TextIO
+
 from pydantic import BaseModel, Field, field_validator
+from typing_extensions import Self
 
+from ..files import _import_pyarrow
 from .column import Column
 
+if TYPE_CHECKING:
+    import pyarrow
+
+# Largest precision of a Snowflake NUMBER, wider numbers are inferred as FLOAT
+_MAX_PRECISION = 38
+_BLOCK_SIZE = 2**16
+# Numbers as written in CSV files, leading zeros (e.g. codes) are kept as text
+_CSV_NUMBER = re.compile(r"[+-]?(0|[1-9]\d*)(\.\d+)?([eE][+-]?\d+)?")
+_SEPARATORS = re.compile(r"[\s,]*")
+
+
+def _arrow_to_snowflake_type(data_type: "pyarrow.DataType") -> str:
+    pa = _import_pyarrow()
+    types = pa.types
+    if types.is_dictionary(data_type):
+        return _arrow_to_snowflake_type(data_type.value_type)
+    if types.is_boolean(data_type):
+        return "BOOLEAN"
+    if types.is_integer(data_type):
+        return "NUMBER(38,0)"
+    if types.is_floating(data_type):
+        return "FLOAT"
+    if types.is_decimal(data_type):
+        return f"NUMBER({data_type.precision},{data_type.scale})"
+    if types.is_string(data_type) or types.is_large_string(data_type):
+        return "VARCHAR"
+    if types.is_binary(data_type) or types.is_large_binary(data_type):
+        return "BINARY"
+    if types.is_fixed_size_binary(data_type):
+        return "BINARY"
+    if types.is_date(data_type):
+        return "DATE"
+    if types.is_timestamp(data_type):
+        return "TIMESTAMP_TZ" if data_type.tz else "TIMESTAMP_NTZ"
+    if types.is_time(data_type):
+        return "TIME"
+    if types.is_null(data_type):
+        return "VARCHAR"
+    return "VARIANT"
+
+
+class _InferredType(NamedTuple):
+    """Type of a column, widened as values are read. NUMBERs keep the digits
+    needed on each side of the decimal point."""
+
+    kind: str
+    integer_digits: int = 0
+    scale: int = 0
+
+    @property
+    def data_type(self) -> str:
+        if self.kind == "NUMBER":
+            return f"NUMBER({_MAX_PRECISION},{self.scale})"
+        if self.kind == "NULL":
+            return "VARCHAR"
+        return self.kind
+
+
+_NULL = _InferredType("NULL")
+
+
+def _number_type(integer_digits: int, scale: int) -> _InferredType:
+    if integer_digits + scale > _MAX_PRECISION:
+        return _InferredType("FLOAT")
+    return _InferredType("NUMBER", integer_digits, scale)
+
+
+def _decimal_type(value: Decimal) -> _InferredType:
+    if not value.is_finite():
+        return _InferredType("FLOAT")
+    _, digits, exponent = value.as_tuple()
+    return _number_type(max(len(digits) + exponent, 1), max(-exponent, 0))
+
+
+def _widen(a: _InferredType, b: _InferredType) -> _InferredType:
+    """Narrowest type holding the values of both: INT -> NUMBER -> FLOAT -> VARCHAR,
+    and VARIANT as soon as nested values are found"""
+    if a.kind == "NULL" or a == b:
+        return b
+    if b.kind == "NULL":
+        return a
+    kinds = {a.kind, b.kind}
+    if kinds == {"NUMBER"}:
+        return _number_type(
+            max(a.integer_digits, b.integer_digits), max(a.scale, b.scale)
+        )
+    if kinds == {"NUMBER", "FLOAT"}:
+        return _InferredType("FLOAT")
+    if "VARIANT" in kinds:
+        return _InferredType("VARIANT")
+    return _InferredType("VARCHAR")
+
+
+def _value_type(value) -> _InferredType:
+    if value is None:
+        return _NULL
+    if isinstance(value, bool):
+        return _InferredType("BOOLEAN")
+    if isinstance(value, int):
+        return _decimal_type(Decimal(value))
+    if isinstance(value, Decimal):
+        return _decimal_type(value)
+    if isinstance(value, float):
+        return _InferredType("FLOAT")
+    if isinstance(value, (dict, list)):
+        return _InferredType("VARIANT")
+    return _InferredType("VARCHAR")
+
+
+def _text_type(value: str | None) -> _InferredType:
+    if not value:
+        return _NULL
+    if value.lower() in ("true", "false"):
+        return _InferredType("BOOLEAN")
+    if _CSV_NUMBER.fullmatch(value):
+        return _decimal_type(Decimal(value))
+    return _InferredType("VARCHAR")
+
+
+def _arrow_type(data_type: "pyarrow.DataType") -> _InferredType:
+    types = _import_pyarrow().types
+    if types.is_dictionary(data_type):
+        return _arrow_type(data_type.value_type)
+    if types.is_integer(data_type):
+        return _number_type(len(str(2**data_type.bit_width)), 0)
+    if types.is_decimal(data_type):
+        return _number_type(data_type.precision - data_type.scale, data_type.scale)
+    return _InferredType(_arrow_to_snowflake_type(data_type))
+
+
+def _iter_json_values(file: TextIO) -> Iterator:
+    """Yields the values of a JSON array, or of newline-delimited JSON, reading the file
+    in blocks so that a single value is held in memory at a time"""
+    decoder = json.JSONDecoder(parse_float=Decimal)
+    buffer, position, eof, array = "", 0, False, None
+    while True:
+        position = _SEPARATORS.match(buffer, position).end()
+        if position < len(buffer):
+            if array is None:
+                array = buffer[position] == "["
+                position += array
+                continue
+            if array and buffer[position] == "]":
+                return
+            try:
+                value, end = decoder.raw_decode(buffer, position)
+            except json.JSONDecodeError:
+                if eof:
+                    raise
+            else:
+                # Unless the file is over, a value ending the buffer may go on in the next block
+                if end < len(buffer) or eof:
+                    yield value
+                    position = end
+                    continue
+        elif eof:
+            return
+        block = file.read(_BLOCK_SIZE)
+        eof = not block
+        buffer = buffer[position:] + block
+        position = 0
+
+
+def _open_text(path: Path) -> TextIO:
+    if path.suffix.lower() == ".gz":
+        return gzip.open(path, "rt", encoding="utf-8", newline="")
+    return open(path, encoding="utf-8", newline="")
+
+
+def _infer_file_types(path: str | Path) -> dict[str, _InferredType]:
+    """Types of the columns of a local file, in a single pass over its records"""
+    path = Path(path)
+    suffixes = [s.lower() for s in path.suffixes if s.lower() != ".gz"]
+    kind = suffixes[-1] if suffixes else ""
+    if kind == ".parquet":
+        schema = _import_pyarrow().parquet.read_schema(path)
+        return {field.name: _arrow_type(field.type) for field in schema}
+    if kind not in (".csv", ".json", ".jsonl", ".ndjson"):
+        raise ValueError(f"Cannot infer the structure of {path}")
+
+    types: dict[str, _InferredType] = {}
+    with _open_text(path) as file:
+        if kind == ".csv":
+            values = (
+                (column, _text_type(value))
+                for record in csv.DictReader(file)
+                for column, value in record.items()
+                if column is not None
+            )
+        else:
+            values = (
+                (column, _value_type(value))
+                for record in _iter_json_values(file)
+                for column, value in _json_record(record, path).items()
+            )
+        for column, value_type in values:
+            types[column] = _widen(types.get(column, _NULL), value_type)
+    return types
+
+
+def _json_record(record, path: Path) -> dict:
+    if not isinstance(record, dict):
+        raise ValueError(f"{path} does not contain JSON records")
+    return record
+
+
+class SchemaInference(BaseModel):
+    """Infers the structure of a table created without a `TableStructure` with a cached
+    INFER_SCHEMA query, optionally sampling at most `max_file_count` files or only `files`."""
+
+    max_file_count: int | None = None
+    files: list[str] | None = None
+
 
 class TableStructure(BaseModel):
     columns: dict = [str, Column]
@@ -20,8 +245,51 @@ class TableStructure(BaseModel):
                 for k, v in self.columns.items()
             )
 
-    def parse_from_json(self):
-        raise NotImplementedError("Not implemented yet")
+    @classmethod
+    def from_arrow_schema(cls, schema: "pyarrow.Schema") -> Self:
+        return cls(
+            columns={
+                field.name: Column(
+                    name=field.name, data_type=_arrow_to_snowflake_type(field.type)
+                )
+                for field in schema
+            }
+        )
+
+    @classmethod
+    def from_files(
+        cls, paths: Iterable[str | Path], max_workers: int | None = None
+    ) -> Self:
+        """Infers the structure of local NDJSON, JSON array, CSV (with a header) and Parquet files,
+        optionally gzip'd, reading each of them once with bounded memory. Files are read in
+        parallel on a process pool and the types found are widened to fit all of them."""
+        paths = list(paths)
+        if len(paths) > 1 and max_workers != 1:
+            with ProcessPoolExecutor(max_workers) as executor:
+                results = list(executor.map(_infer_file_types, paths))
+        else:
+            results = [_infer_file_types(path) for path in paths]
+
+        names: dict[str, str] = {}
+        types: dict[str, _InferredType] = {}
+        for result in results:
+            for column, value_type in result.items():
+                key = column.casefold()
+                names.setdefault(key, column)
+                types[key] = _widen(types.get(key, _NULL), value_type)
+        return cls(
+            columns={
+                key: Column(name=names[key], data_type=value_type.data_type)
+                for key, value_type in types.items()
+            }
+        )
+
+    @classmethod
+    def parse_from_json(
+        cls, paths: Iterable[str | Path], max_workers: int | None = None
+    ) -> Self:
+        """Same as `from_files`, for NDJSON or JSON array files"""
+        return cls.from_files(paths, max_workers)
 
     @field_validator("columns")
     @classmethod
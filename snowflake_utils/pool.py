@@ -0,0 +1,266 @@
+import asyncio
+import atexit
+import hashlib
+import logging
+import threading
+import time
+import weakref
+from collections import OrderedDict, defaultdict
+from contextlib import asynccontextmanager, contextmanager
+from dataclasses import dataclass
+from typing import AsyncIterator, Iterator
+
+from snowflake.connector import SnowflakeConnection
+
+from .settings import PoolSettings, SnowflakeSettings
+from .tracing import tracing
+
+logger = logging.getLogger(__name__)
+
+PoolKey = tuple[str, str, str, str, str]
+
+
+@dataclass(eq=False)
+class _IdleConnection:
+    connection: SnowflakeConnection
+    released_at: float
+
+
+class ConnectionPool:
+    """Thread-safe pool of Snowflake sessions, keyed by the session context.
+
+    Sessions are bounded to `max_size` per (account, user, role, database, warehouse),
+    are kept alive on the server side, validated with a heartbeat when they have been
+    idle for more than `validate_after` seconds and closed after `idle_timeout` seconds.
+    """
+
+    def __init__(
+        self,
+        max_size: int | None = None,
+        idle_timeout: float | None = None,
+        validate_after: float | None = None,
+        checkout_timeout: float | None = None,
+    ) -> None:
+        settings = PoolSettings()
+        self.max_size = max_size if max_size is not None else settings.max_size
+        self.idle_timeout = (
+            idle_timeout if idle_timeout is not None else settings.idle_timeout
+        )
+        self.validate_after = (
+            validate_after if validate_after is not None else settings.validate_after
+        )
+        self.checkout_timeout = (
+            checkout_timeout
+            if checkout_timeout is not None
+            else settings.checkout_timeout
+        )
+        self._condition = threading.Condition()
+        self._idle: dict[PoolKey, list[_IdleConnection]] = defaultdict(list)
+        self._size: dict[PoolKey, int] = defaultdict(int)
+        self._leased: dict[int, PoolKey] = {}
+
+    @staticmethod
+    def key(settings: SnowflakeSettings) -> PoolKey:
+        return (
+            settings.account,
+            settings.user,
+            settings.role,
+            settings.db,
+            settings.warehouse,
+        )
+
+    def acquire(self, settings: SnowflakeSettings | None = None) -> SnowflakeConnection:
+        """Hands out a healthy session, logging in only if no idle one is available."""
+        settings = settings or SnowflakeSettings()
+        with tracing.span("connect", role=settings.role) as span:
+            key = self.key(settings)
+            deadline = time.monotonic() + self.checkout_timeout
+            while True:
+                entry = self._reserve(key, deadline)
+                if entry is None:
+                    try:
+                        connection = settings.connect(client_session_keep_alive=True)
+                    except BaseException:
+                        self._forget(key)
+                        raise
+                    logger.debug(f"Opened new pooled session for role {settings.role}")
+                    span.set_attribute("new_session", True)
+                elif self._is_healthy(entry):
+                    connection = entry.connection
+                else:
+                    logger.debug("Discarding unhealthy pooled session")
+                    self._close(entry.connection)
+                    self._forget(key)
+                    continue
+                with self._condition:
+                    self._leased[id(connection)] = key
+                return connection
+
+    def release(self, connection: SnowflakeConnection) -> None:
+        """Returns a session to the pool, dropping it if it has been closed."""
+        with self._condition:
+            key = self._leased.pop(id(connection), None)
+            if key is None:
+                return None
+            if connection.is_closed():
+                self._size[key] -= 1
+            else:
+                self._idle[key].append(_IdleConnection(connection, time.monotonic()))
+            self._condition.notify()
+
+    @contextmanager
+    def connection(
+        self,
+        connection: SnowflakeConnection | None = None,
+        settings: SnowflakeSettings | None = None,
+    ) -> Iterator[SnowflakeConnection]:
+        """Yields `connection` as is if given, otherwise a pooled session."""
+        if connection is not None:
+            yield connection
+            return
+        connection = self.acquire(settings)
+        try:
+            yield connection
+        except BaseException:
+            self._rollback(connection)
+            raise
+        finally:
+            self.release(connection)
+
+    @asynccontextmanager
+    async def connection_async(
+        self,
+        connection: SnowflakeConnection | None = None,
+        settings: SnowflakeSettings | None = None,
+    ) -> AsyncIterator[SnowflakeConnection]:
+        """Same as `connection`, logging in on a worker thread if needed"""
+        if connection is not None:
+            yield connection
+            return
+        connection = await asyncio.to_thread(self.acquire, settings)
+        try:
+            yield connection
+        except BaseException:
+            self._rollback(connection)
+            raise
+        finally:
+            self.release(connection)
+
+    def close_all(self) -> None:
+        """Closes every idle session. Leased sessions are closed when released."""
+        with self._condition:
+            idle = [e for entries in self._idle.values() for e in entries]
+            for key, entries in self._idle.items():
+                self._size[key] -= len(entries)
+            self._idle.clear()
+            self._condition.notify_all()
+        for entry in idle:
+            self._close(entry.connection)
+
+    def _reserve(self, key: PoolKey, deadline: float) -> _IdleConnection | None:
+        """Takes the most recently used idle session for `key`, or reserves a slot for a new one."""
+        expired = []
+        try:
+            with self._condition:
+                while True:
+                    expired.extend(self._evict_expired())
+                    if self._idle[key]:
+                        return self._idle[key].pop()
+                    if self._size[key] < self.max_size:
+                        self._size[key] += 1
+                        return None
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise TimeoutError(
+                            f"No Snowflake session available after {self.checkout_timeout}s"
+                        )
+                    self._condition.wait(remaining)
+        finally:
+            for connection in expired:
+                self._close(connection)
+
+    def _evict_expired(self) -> list[SnowflakeConnection]:
+        now = time.monotonic()
+        expired = []
+        for key, entries in self._idle.items():
+            stale = [e for e in entries if now - e.released_at >= self.idle_timeout]
+            if stale:
+                entries[:] = [e for e in entries if e not in stale]
+                self._size[key] -= len(stale)
+                expired.extend(e.connection for e in stale)
+        return expired
+
+    def _forget(self, key: PoolKey) -> None:
+        with self._condition:
+            self._size[key] -= 1
+            self._condition.notify()
+
+    def _is_healthy(self, entry: _IdleConnection) -> bool:
+        if entry.connection.is_closed():
+            return False
+        if time.monotonic() - entry.released_at > self.validate_after:
+            return entry.connection.is_valid()
+        return True
+
+    @staticmethod
+    def _rollback(connection: SnowflakeConnection) -> None:
+        try:
+            connection.rollback()
+        except Exception:
+            connection.close()
+
+    @staticmethod
+    def _close(connection: SnowflakeConnection) -> None:
+        try:
+            connection.close()
+        except Exception as e:
+            logger.debug(f"Error while closing pooled session: {e}")
+
+
+class SessionObjects:
+    """Temporary objects created in each session, by name, with a hash of their definition.
+
+    Temporary file formats and stages live as long as the session that created them, so one
+    created with the same definition in the same session does not need to be created again.
+    Sessions are held weakly and their entries go away with them. At most `max_per_session`
+    objects are remembered per session, the least recently used being forgotten first, which
+    only means that they are created again if needed.
+    """
+
+    def __init__(self, max_per_session: int = 64) -> None:
+        self.max_per_session = max_per_session
+        self._lock = threading.Lock()
+        self._objects: weakref.WeakKeyDictionary[
+            SnowflakeConnection, OrderedDict[str, str]
+        ] = weakref.WeakKeyDictionary()
+
+    @staticmethod
+    def digest(*parts: str) -> str:
+        return hashlib.sha256("\0".join(parts).encode()).hexdigest()
+
+    def exists(self, connection: SnowflakeConnection, name: str, digest: str) -> bool:
+        """Whether `name` was created in this session with the same definition"""
+        with self._lock:
+            objects = self._objects.get(connection, {})
+            if objects.get(name.casefold()) != digest:
+                return False
+            objects.move_to_end(name.casefold())
+            return True
+
+    def created(self, connection: SnowflakeConnection, name: str, digest: str) -> None:
+        with self._lock:
+            objects = self._objects.setdefault(connection, OrderedDict())
+            objects[name.casefold()] = digest
+            objects.move_to_end(name.casefold())
+            while len(objects) > self.max_per_session:
+                objects.popitem(last=False)
+
+    def forget(self, connection: SnowflakeConnection) -> None:
+        """Drops what is known of the session, e.g. after a failed setup"""
+        with self._lock:
+            self._objects.pop(connection, None)
+
+
+connection_pool = ConnectionPool()
+session_objects = SessionObjects()
+atexit.register(connection_pool.close_all)
@@ -1,8 +1,30 @@
+import asyncio
 import logging
+from pathlib import Path
 from typing import no_type_check
 
 from snowflake import connector
 
+from .instrumentation import StatementKind, instrumentation
+
+
+@no_type_check
+def execute(
+    cursor: connector.cursor.SnowflakeCursor, statement: str, **kwargs
+) -> connector.cursor.SnowflakeCursor:
+    """Executes the statement on the cursor, recording it in the instrumentation sinks"""
+    kind = StatementKind.BATCH if kwargs.get("num_statements", 1) > 1 else None
+    with instrumentation.statement(cursor, statement, kind):
+        return cursor.execute(statement, **kwargs)
+
+
+@no_type_check
+def execute_many(
+    cursor: connector.cursor.SnowflakeCursor, statement: str, rows: list
+) -> connector.cursor.SnowflakeCursor:
+    with instrumentation.statement(cursor, statement):
+        return cursor.executemany(statement, rows)
+
 
 @no_type_check
 def execute_statement(
@@ -10,6 +32,64 @@ def execute_statement(
 ) -> list[tuple] | list[dict] | None:
     logging.debug("Statement to execute: ")
     logging.debug(statement)
-    result = cursor.execute(statement).fetchall()
+    result = execute(cursor, statement).fetchall()
     logging.debug("Statement executed.")
     return result
+
+
+@no_type_check
+def execute_statements(
+    cursor: connector.cursor.SnowflakeCursor, statements: list[str]
+) -> list[list[tuple] | list[dict]]:
+    """Submits the statements as a single multi-statement request, saving a round trip
+    per statement, and returns the results of each of them in order."""
+    statements = [s.strip().rstrip(";") for s in statements]
+    if len(statements) <= 1:
+        return [execute_statement(cursor, s) for s in statements]
+    request = ";\n".join(statements)
+    logging.debug(f"Submitting {len(statements)} statements in one request: ")
+    logging.debug(request)
+    execute(cursor, request, num_statements=len(statements))
+    results = [cursor.fetchall()]
+    for _ in statements[1:]:
+        cursor.nextset()
+        results.append(cursor.fetchall())
+    logging.debug("Statements executed.")
+    return results
+
+
+@no_type_check
+async def execute_statement_async(
+    cursor: connector.cursor.SnowflakeCursor,
+    statement: str,
+    poll_interval: float = 0.1,
+    max_poll_interval: float = 10.0,
+) -> list[tuple] | list[dict] | None:
+    """Submits the statement without waiting for it, then polls its status
+    with exponential backoff until it completes and fetches its results.
+    The requests to Snowflake block, so they run in a worker thread, off the event loop."""
+    logging.debug("Statement to submit: ")
+    logging.debug(statement)
+    with instrumentation.statement(cursor, statement):
+        query_id = (await asyncio.to_thread(cursor.execute_async, statement))["queryId"]
+        connection = cursor.connection
+        while connection.is_still_running(
+            await asyncio.to_thread(
+                connection.get_query_status_throw_if_error, query_id
+            )
+        ):
+            await asyncio.sleep(poll_interval)
+            poll_interval = min(poll_interval * 2, max_poll_interval)
+        await asyncio.to_thread(cursor.get_results_from_sfqid, query_id)
+    logging.debug(f"Statement {query_id} executed.")
+    return await asyncio.to_thread(cursor.fetchall)
+
+
+def put_file(
+    cursor: connector.cursor.SnowflakeCursor, path: Path, location: str
+) -> list[tuple] | list[dict] | None:
+    """Uploads an already compressed local file to a stage location"""
+    return execute_statement(
+        cursor,
+        f"PUT 'file://{path.as_posix()}' @{location} AUTO_COMPRESS = FALSE OVERWRITE = TRUE",
+    )
@@ -68,14 +68,23 @@ class SnowflakeSettings(BaseSettings):
             }
         return base_creds | {"password": self.password}
 
-    def connect(self) -> SnowflakeConnection:
-        return _connect(**self.creds())
+    def connect(self, **kwargs) -> SnowflakeConnection:
+        return _connect(**self.creds(), **kwargs)
 
 
 def connect() -> SnowflakeConnection:
     return SnowflakeSettings().connect()
 
 
+class PoolSettings(BaseSettings):
+    model_config = SettingsConfigDict(env_prefix="SNOWFLAKE_POOL_")
+
+    max_size: int = 8
+    idle_timeout: float = 600
+    validate_after: float = 60
+    checkout_timeout: float = 300
+
+
 class GovernanceSettings(BaseSettings):
     governance_database: str = "governance"
     governance_schema: str = "public"
@@ -0,0 +1,175 @@
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Protocol
+
+AttributeValue = str | bool | int | float
+
+
+class Span(Protocol):
+    def set_attribute(self, key: str, value: AttributeValue) -> None: ...
+
+
+class Tracer(Protocol):
+    def start_span(
+        self, name: str, attributes: dict[str, AttributeValue]
+    ) -> Any: ...  # a context manager yielding a Span
+
+
+class _NoopSpan:
+    def set_attribute(self, key: str, value: AttributeValue) -> None:
+        return None
+
+
+_NOOP_SPAN = _NoopSpan()
+
+
+@dataclass
+class RecordedSpan:
+    """A span kept by the `InMemoryTracer`, with its nested spans"""
+
+    name: str
+    attributes: dict[str, AttributeValue]
+    start: float
+    end: float | None = None
+    error: str | None = None
+    children: list["RecordedSpan"] = field(default_factory=list)
+
+    def set_attribute(self, key: str, value: AttributeValue) -> None:
+        self.attributes[key] = value
+
+    @property
+    def duration(self) -> float | None:
+        return None if self.end is None else self.end - self.start
+
+    def walk(self, depth: int = 0) -> Iterator[tuple[int, "RecordedSpan"]]:
+        """Yields the span and its nested spans, in order, with their depth"""
+        yield depth, self
+        for child in self.children:
+            yield from child.walk(depth + 1)
+
+    def breakdown(self) -> dict[str, float]:
+        """Total seconds spent in each nested span, keyed by the `/` separated path
+        of span names below this one, to compare the phases of several runs"""
+        durations: dict[str, float] = {}
+
+        def add(span: RecordedSpan, prefix: str) -> None:
+            for child in span.children:
+                path = f"{prefix}{child.name}"
+                durations[path] = durations.get(path, 0.0) + (child.duration or 0.0)
+                add(child, f"{path}/")
+
+        add(self, "")
+        return durations
+
+    def timeline(self) -> str:
+        """The nested spans as an indented list of offsets, durations and attributes"""
+        lines = []
+        for depth, span in self.walk():
+            attributes = " ".join(f"{k}={v}" for k, v in span.attributes.items())
+            lines.append(
+                f"{span.start - self.start:9.3f}s {span.duration or 0.0:9.3f}s "
+                f"{'  ' * depth}{span.name} {attributes}".rstrip()
+                + (f" failed: {span.error}" if span.error else "")
+            )
+        return "\n".join(lines)
+
+
+class InMemoryTracer:
+    """Keeps the spans in memory as trees, one per outermost span. Nesting follows the
+    context, so it carries over to `asyncio` tasks and `asyncio.to_thread` calls."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._current: ContextVar[RecordedSpan | None] = ContextVar(
+            "snowflake_utils_span", default=None
+        )
+        self._spans: list[RecordedSpan] = []
+
+    @contextmanager
+    def start_span(
+        self, name: str, attributes: dict[str, AttributeValue]
+    ) -> Iterator[RecordedSpan]:
+        span = RecordedSpan(name, dict(attributes), time.perf_counter())
+        parent = self._current.get()
+        with self._lock:
+            (parent.children if parent is not None else self._spans).append(span)
+        token = self._current.set(span)
+        try:
+            yield span
+        except BaseException as e:
+            span.error = str(e) or type(e).__name__
+            raise
+        finally:
+            span.end = time.perf_counter()
+            self._current.reset(token)
+
+    @property
+    def spans(self) -> list[RecordedSpan]:
+        with self._lock:
+            return list(self._spans)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._spans.clear()
+
+
+class OpenTelemetryTracer:
+    """Emits the spans with an OpenTelemetry tracer, by default the one of the global
+    tracer provider. Requires `opentelemetry-api`."""
+
+    def __init__(self, tracer: Any = None) -> None:
+        if tracer is None:
+            try:
+                from opentelemetry import trace
+            except ImportError as e:
+                raise ImportError(
+                    "opentelemetry-api is required for OpenTelemetry tracing, install snowflake-utils[otel]"
+                ) from e
+            tracer = trace.get_tracer("snowflake_utils")
+        self.tracer = tracer
+
+    def start_span(self, name: str, attributes: dict[str, AttributeValue]) -> Any:
+        return self.tracer.start_as_current_span(name, attributes=attributes)
+
+
+class Tracing:
+    """Opens nested spans around the phases of the loads, merges and tag syncs, and
+    around every statement, with the configured tracer. Without a tracer, spans are no-ops."""
+
+    def __init__(self) -> None:
+        self._tracer: Tracer | None = None
+
+    @property
+    def enabled(self) -> bool:
+        return self._tracer is not None
+
+    def set_tracer(self, tracer: Tracer | None) -> None:
+        self._tracer = tracer
+
+    @contextmanager
+    def tracer(self, tracer: Tracer) -> Iterator[Tracer]:
+        """Uses the tracer for the duration of the block"""
+        previous, self._tracer = self._tracer, tracer
+        try:
+            yield tracer
+        finally:
+            self._tracer = previous
+
+    @contextmanager
+    def span(self, name: str, **attributes: AttributeValue | None) -> Iterator[Span]:
+        """Runs the block in a span, dropping the attributes that are None"""
+        tracer = self._tracer
+        if tracer is None:
+            yield _NOOP_SPAN
+            return
+        with tracer.start_span(
+            name, {k: v for k, v in attributes.items() if v is not None}
+        ) as span:
+            yield span
+
+
+tracing = Tracing()
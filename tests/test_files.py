@@ -0,0 +1,64 @@
+import gzip
+from datetime import date
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+
+from snowflake_utils.files import write_csv_chunks, write_parquet_chunks
+
+
+def test_write_csv_chunks_quotes_and_nulls(tmp_path):
+    records = [
+        {"id": 1, "name": 'say "hi"', "born": date(2024, 7, 4)},
+        {"id": 2, "name": "", "born": None},
+    ]
+    (chunk,) = write_csv_chunks(records, tmp_path, chunk_size=2**20)
+    assert gzip.decompress(chunk.read_bytes()).decode().splitlines() == [
+        '"id","name","born"',
+        '1,"say ""hi""","2024-07-04"',
+        '2,"",',
+    ]
+
+
+def test_write_csv_chunks_splits_on_size_and_columns(tmp_path):
+    records = [{"id": i} for i in range(3)] + [{"id": 3, "name": "x"}]
+    chunks = list(write_csv_chunks(records, tmp_path, chunk_size=1))
+    assert len(chunks) == 4
+    assert gzip.decompress(chunks[-1].read_bytes()).decode().startswith('"id","name"')
+
+
+def test_write_parquet_chunks(tmp_path):
+    records = ({"id": i, "name": str(i)} for i in range(25))
+    chunks = list(
+        write_parquet_chunks(records, tmp_path, chunk_size=2**20, rows_per_group=10)
+    )
+    assert len(chunks) == 1
+    table = pq.read_table(chunks[0])
+    assert table.num_rows == 25
+    assert table.column_names == ["id", "name"]
+
+
+def test_write_parquet_chunks_unifies_the_schema(tmp_path):
+    records = [{"id": 1, "name": None}, {"id": 2.5, "name": "b", "flag": True}]
+    chunks = list(
+        write_parquet_chunks(records, tmp_path, chunk_size=2**20, rows_per_group=1)
+    )
+    assert len(chunks) == 2
+    first, second = (pq.read_table(chunk) for chunk in chunks)
+    assert first.column_names == ["id", "name"]
+    assert second.schema.to_string() == "id: double\nname: string\nflag: bool"
+    assert second.to_pylist() == [{"id": 2.5, "name": "b", "flag": True}]
+
+    schema = pa.schema([("id", pa.int64()), ("name", pa.string())])
+    (chunk,) = write_parquet_chunks(
+        records[:1], tmp_path, chunk_size=2**20, schema=schema
+    )
+    assert pq.read_table(chunk).schema == schema
+
+    with pytest.raises(ValueError, match="do not share a schema"):
+        list(
+            write_parquet_chunks(
+                [{"id": 1}, {"id": "a"}], tmp_path, chunk_size=2**20, rows_per_group=1
+            )
+        )
@@ -0,0 +1,91 @@
+import logging
+from unittest.mock import MagicMock
+
+import pytest
+
+from snowflake_utils.instrumentation import (
+    LoggingSink,
+    StatementAggregator,
+    StatementKind,
+    instrumentation,
+    statement_kind,
+    statement_table,
+)
+from snowflake_utils.queries import execute_statement, execute_statements
+
+
+@pytest.mark.parametrize(
+    "statement, kind, table",
+    [
+        ("\n COPY INTO PUBLIC.T (a) FROM @s", StatementKind.COPY, "PUBLIC.T"),
+        ("merge into DB.S.T as dest using x", StatementKind.MERGE, "DB.S.T"),
+        ("CREATE OR REPLACE TRANSIENT TABLE S.T (a int)", StatementKind.DDL, "S.T"),
+        ("CREATE TABLE IF NOT EXISTS S.T_temp", StatementKind.DDL, "S.T_temp"),
+        (
+            "CREATE OR REPLACE TEMPORARY FILE FORMAT S.F TYPE = CSV",
+            StatementKind.DDL,
+            None,
+        ),
+        ("ALTER TABLE S.T SET TAG pii = 'x'", StatementKind.TAG, "S.T"),
+        ('ALTER TABLE S.T MODIFY COLUMN "A" UNSET TAG pii', StatementKind.TAG, "S.T"),
+        ("alter table S.T swap with S.T_swap", StatementKind.DDL, "S.T"),
+        ("drop table if exists S.T", StatementKind.DDL, "S.T"),
+        ("desc table S.T", StatementKind.QUERY, "S.T"),
+        ("delete from S.T using x", StatementKind.DELETE, "S.T"),
+        ("select 1", StatementKind.QUERY, None),
+        ("USE ROLE LOADER", StatementKind.CONTEXT, None),
+        ("begin", StatementKind.TRANSACTION, None),
+    ],
+)
+def test_statement_kind_and_table(statement, kind, table):
+    assert statement_kind(statement) == kind
+    assert statement_table(statement) == table
+
+
+def test_statements_are_recorded_to_sinks(caplog):
+    cursor = MagicMock()
+    cursor.execute.return_value = cursor
+    cursor.sfqid = "01-abc"
+    cursor.rowcount = 3
+    aggregator = StatementAggregator()
+    callback = MagicMock()
+
+    with (
+        caplog.at_level(logging.INFO, logger="snowflake_utils.statements"),
+        instrumentation.sink(aggregator),
+        instrumentation.sink(callback),
+        instrumentation.sink(LoggingSink()),
+    ):
+        execute_statement(cursor, "merge into S.T as dest using S.T_temp tmp on 1")
+        execute_statements(cursor, ["USE ROLE LOADER", "USE DATABASE DB"])
+        cursor.execute.side_effect = Exception("Table does not exist")
+        with pytest.raises(Exception, match="does not exist"):
+            execute_statement(cursor, "drop table S.T")
+    # Sinks are removed after the block
+    cursor.execute.side_effect = None
+    execute_statement(cursor, "select 1")
+
+    merge, batch, drop = aggregator.records
+    assert callback.call_count == 3
+    assert (merge.kind, merge.table, merge.query_id, merge.rows) == (
+        StatementKind.MERGE,
+        "S.T",
+        "01-abc",
+        3,
+    )
+    assert (batch.kind, batch.table) == (StatementKind.BATCH, None)
+    assert (drop.kind, drop.rows, drop.error) == (
+        StatementKind.DDL,
+        None,
+        "Table does not exist",
+    )
+
+    summary = aggregator.summary()
+    assert summary[StatementKind.MERGE].count == 1
+    assert summary[StatementKind.MERGE].rows == 3
+    assert summary[StatementKind.DDL].errors == 1
+    assert summary[StatementKind.MERGE].p95 == merge.elapsed
+    assert (StatementKind.MERGE, "S.T") in aggregator.summary(by_table=True)
+
+    (log,) = [r for r in caplog.records if r.snowflake_statement["kind"] == "merge"]
+    assert log.snowflake_statement["query_id"] == "01-abc"
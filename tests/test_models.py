@@ -1,5 +1,7 @@
+import asyncio
 import logging
 import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from unittest.mock import MagicMock, patch
 
@@ -10,11 +12,19 @@ from snowflake_utils.models import (
     FileFormat,
     InlineFileFormat,
     MatchByColumnName,
+    MergeJob,
+    MergeStrategy,
+    QualifyMode,
     Schema,
+    SchemaInference,
     Table,
     TableStructure,
+    TableType,
 )
+from snowflake_utils.models.catalog import SchemaCatalog, TagCatalog, inference_cache
 from snowflake_utils.models.column import MetadataColumn
+from snowflake_utils.models.table import _execute_all, _files_clause
+from snowflake_utils.queries import execute_statements
 
 test_table_schema = TableStructure(
     columns={
@@ -644,11 +654,15 @@ def test_copy_custom_with_files(mock_copy) -> None:
     # Verify the result
     assert result[0][1] == "LOADED"
 
-    # Verify the _copy method was called with the correct query containing FILES clause
+    # Verify the _copy method was called with the files, formatted in the FILES clause
     mock_copy.assert_called()
     call_args = mock_copy.call_args
     query = call_args[0][0]  # First positional argument is the query
-    assert "FILES = ('test_file.parquet', 'another_file.parquet')" in query
+    assert "{files_clause}" in query
+    assert (
+        _files_clause(call_args.kwargs["files"])
+        == "FILES = ('test_file.parquet', 'another_file.parquet')"
+    )
 
 
 @patch.object(Table, "_merge")
@@ -690,11 +704,14 @@ def test_merge_custom_with_files(mock_merge) -> None:
         # Call the copy_callable (this simulates what happens inside _merge)
         copy_callable(temp_table, sync_tags=False)
 
-        # Verify the _copy method was called with the correct query containing FILES clause
+        # Verify the _copy method was called with the files, formatted in the FILES clause
         mock_copy.assert_called()
         call_args = mock_copy.call_args
         query = call_args[0][0]  # First positional argument is the query
-        assert "FILES = ('test_file.parquet')" in query
+        assert "{files_clause}" in query
+        assert (
+            _files_clause(call_args.kwargs["files"]) == "FILES = ('test_file.parquet')"
+        )
 
 
 @patch.object(Table, "_copy")
@@ -716,11 +733,15 @@ def test_copy_with_files(mock_copy) -> None:
     # Verify the result
     assert result[0][1] == "LOADED"
 
-    # Verify the _copy method was called with the correct query containing FILES clause
+    # Verify the _copy method was called with the files, formatted in the FILES clause
     mock_copy.assert_called()
     call_args = mock_copy.call_args
     query = call_args[0][0]  # First positional argument is the query
-    assert "FILES = ('test_file.parquet', 'another_file.parquet')" in query
+    assert "{files_clause}" in query
+    assert (
+        _files_clause(call_args.kwargs["files"])
+        == "FILES = ('test_file.parquet', 'another_file.parquet')"
+    )
 
 
 @patch.object(Table, "_merge")
@@ -754,11 +775,14 @@ def test_merge_with_files(mock_merge) -> None:
         # Call the copy_callable (this simulates what happens inside _merge)
         copy_callable(temp_table, sync_tags=False)
 
-        # Verify the _copy method was called with the correct query containing FILES clause
+        # Verify the _copy method was called with the files, formatted in the FILES clause
         mock_copy.assert_called()
         call_args = mock_copy.call_args
         query = call_args[0][0]  # First positional argument is the query
-        assert "FILES = ('test_file.parquet')" in query
+        assert "{files_clause}" in query
+        assert (
+            _files_clause(call_args.kwargs["files"]) == "FILES = ('test_file.parquet')"
+        )
 
 
 @patch.object(Table, "_copy")
@@ -784,7 +808,8 @@ def test_copy_into_files_parameter_formatting(mock_copy) -> None:
     expected_files_clause = (
         "FILES = ('file1.parquet', 'file2.parquet', 'file3.parquet')"
     )
-    assert expected_files_clause in query
+    assert "{files_clause}" in query
+    assert _files_clause(mock_copy.call_args.kwargs["files"]) == expected_files_clause
     assert result[0][1] == "LOADED"
 
 
@@ -1238,3 +1263,1244 @@ def test_merge_statement_without_database():
         assert "merge into PUBLIC.MAIN as dest" in result
         assert "using PUBLIC.TEMP tmp" in result
         assert 'ON dest."ID" = tmp."ID"' in result
+
+
+def test_setup_connection_skips_context_already_set_on_session():
+    """Test setup_connection does not re-issue USE ROLE/DATABASE on a pooled session."""
+    mock_cursor = make_mock_cursor()
+    mock_cursor.connection.role = "MY_ROLE"
+    mock_cursor.connection.database = "SANDBOX"
+    table = Table(name="TEST", schema_name="PUBLIC", role="my_role")
+
+    with (
+        patch("snowflake_utils.models.table.SnowflakeSettings") as mock_settings,
+        patch.object(Table, "setup_file_format"),
+        patch.object(Table, "setup_stage"),
+    ):
+        mock_settings.return_value.db = "sandbox"
+        table.setup_connection(
+            path="s3://test/path",
+            storage_integration="TEST_INTEGRATION",
+            cursor=mock_cursor,
+            file_format=json_file_format,
+        )
+
+    mock_cursor.execute.assert_not_called()
+
+
+def test_bulk_insert_batches_bound_rows():
+    """Test bulk_insert sends one parameter-bound INSERT per batch."""
+    mock_cursor = make_mock_cursor()
+    mock_cursor.rowcount = 2
+    mock_conn = make_mock_conn(cursor=mock_cursor)
+    mock_conn.is_pyformat = True
+    records = {
+        "1": {"id": 1, "name": "it's"},
+        "2": {"id": 2, "name": "test2"},
+        "3": {"id": 3, "name": None},
+    }
+
+    result = test_table.bulk_insert(records, connection=mock_conn, batch_size=2)
+
+    assert result == [2, 2]
+    calls = mock_cursor.executemany.call_args_list
+    assert len(calls) == 2
+    assert calls[0].args == (
+        "INSERT INTO PUBLIC.PYTEST(id, name) VALUES (%s, %s)",
+        [(1, "it's"), (2, "test2")],
+    )
+    assert calls[1].args[1] == [(3, None)]
+
+
+def test_table_structure_from_files(tmp_path, monkeypatch):
+    import gzip
+
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    # Small blocks, so that JSON values span several reads
+    monkeypatch.setattr("snowflake_utils.models.table_structure._BLOCK_SIZE", 7)
+    ndjson = tmp_path / "events.ndjson"
+    ndjson.write_text(
+        '{"id": 1, "amount": 10, "code": "007", "tags": null}\n'
+        '{"id": 22, "amount": 10.25, "code": "8", "tags": ["a"]}\n'
+    )
+    array = tmp_path / "events.json"
+    array.write_text(
+        '[{"ID": 123456, "amount": 1.5e400, "flag": true},\n'
+        ' {"id": 4, "name": "x]", "flag": false}]'
+    )
+    csv_file = tmp_path / "events.csv.gz"
+    csv_file.write_bytes(
+        gzip.compress(b"id,zip,flag,ratio\n1,01234,TRUE,0.5\n2,,false,\n")
+    )
+    parquet = tmp_path / "events.parquet"
+    pq.write_table(
+        pa.table({"id": pa.array([1], pa.int32()), "ratio": pa.array([1.0])}), parquet
+    )
+
+    structure = TableStructure.parse_from_json([ndjson, array], max_workers=1)
+    assert {k: v.data_type for k, v in structure.columns.items()} == {
+        "id": "NUMBER(38,0)",
+        "amount": "FLOAT",
+        "code": "VARCHAR",
+        "tags": "VARIANT",
+        "flag": "BOOLEAN",
+        "name": "VARCHAR",
+    }
+    structure = TableStructure.from_files([csv_file, parquet], max_workers=1)
+    assert {k: v.data_type for k, v in structure.columns.items()} == {
+        "id": "NUMBER(38,0)",
+        "zip": "VARCHAR",
+        "flag": "BOOLEAN",
+        "ratio": "FLOAT",
+    }
+    structure = TableStructure.from_files([ndjson, csv_file])
+    assert structure.columns["amount"].data_type == "NUMBER(38,2)"
+    assert structure.columns["flag"].data_type == "BOOLEAN"
+
+
+@patch("snowflake_utils.models.table.put_file")
+@patch.object(Table, "copy_into")
+def test_bulk_insert_uploads_to_table_stage_above_threshold(mock_copy_into, mock_put):
+    """Test bulk_insert streams records to the table stage and COPYs them once."""
+    mock_copy_into.return_value = [("bulk_insert/chunk.csv.gz", "LOADED", 3, 3)]
+    mock_cursor = make_mock_cursor()
+    mock_conn = make_mock_conn(cursor=mock_cursor)
+    records = ({"id": i, "name": f"name {i}"} for i in range(3))
+
+    result = test_table.bulk_insert(records, connection=mock_conn, stage_threshold=2)
+
+    assert result == [3]
+    mock_cursor.executemany.assert_not_called()
+    mock_put.assert_called_once()
+    location = mock_put.call_args.args[2]
+    assert location.startswith("PUBLIC.%PYTEST/bulk_insert/")
+    assert mock_copy_into.call_args.kwargs["stage"] == "PUBLIC.%PYTEST"
+    assert "PARSE_HEADER = TRUE" in (
+        mock_copy_into.call_args.kwargs["file_format"].definition
+    )
+    assert mock_cursor.execute.call_args.args[0] == f"REMOVE @{location}"
+
+
+@patch("snowflake_utils.models.table.put_file")
+@patch.object(Table, "copy_into")
+def test_bulk_insert_removes_staged_chunks_when_upload_fails(mock_copy_into, mock_put):
+    mock_put.side_effect = OSError("upload failed")
+    mock_cursor = make_mock_cursor()
+    mock_conn = make_mock_conn(cursor=mock_cursor)
+    records = ({"id": i, "name": f"name {i}"} for i in range(3))
+
+    with pytest.raises(OSError, match="upload failed"):
+        test_table.bulk_insert(records, connection=mock_conn, stage_threshold=2)
+
+    mock_copy_into.assert_not_called()
+    location = mock_put.call_args.args[2]
+    assert mock_cursor.execute.call_args.args[0] == f"REMOVE @{location}"
+
+
+def test_table_structure_from_arrow_schema():
+    import pyarrow as pa
+
+    schema = pa.schema(
+        [
+            ("id", pa.int64()),
+            ("amount", pa.decimal128(10, 2)),
+            ("name", pa.string()),
+            ("loaded_at", pa.timestamp("us")),
+            ("payload", pa.struct([("a", pa.int32())])),
+        ]
+    )
+    structure = TableStructure.from_arrow_schema(schema)
+    assert {k: v.data_type for k, v in structure.columns.items()} == {
+        "id": "NUMBER(38,0)",
+        "amount": "NUMBER(10,2)",
+        "name": "VARCHAR",
+        "loaded_at": "TIMESTAMP_NTZ",
+        "payload": "VARIANT",
+    }
+
+
+@patch("snowflake_utils.models.table.put_file")
+@patch.object(Table, "copy_into")
+def test_insert_dataframe_creates_table_from_arrow_schema(mock_copy_into, mock_put):
+    pd = pytest.importorskip("pandas")
+
+    mock_copy_into.return_value = [("bulk_insert/chunk.parquet", "LOADED", 2, 2)]
+    mock_cursor = make_mock_cursor()
+    mock_conn = make_mock_conn(cursor=mock_cursor)
+    table = Table(name="PYTEST_ARROW", schema_name="PUBLIC")
+    df = pd.DataFrame({"id": [1, 2], "name": ["a", "b"]})
+
+    result = table.insert_dataframe(df, connection=mock_conn)
+
+    assert result == [2]
+    statements = [c.args[0] for c in mock_cursor.execute.call_args_list]
+    assert any(
+        'PUBLIC.PYTEST_ARROW ("ID" NUMBER(38,0), "NAME" VARCHAR)' in s
+        for s in statements
+    )
+    assert mock_put.call_args.args[1].suffix == ".parquet"
+    assert (
+        mock_copy_into.call_args.kwargs["file_format"].definition
+        == "TYPE = PARQUET USE_LOGICAL_TYPE = TRUE"
+    )
+    assert table.table_structure is None
+
+
+def test_merge_async_submits_copy_and_merge():
+    """Test merge_async stages into the temp table and submits the MERGE asynchronously."""
+    mock_cursor = make_mock_cursor(
+        fetchall_side_effect=lambda: [("ID", "NUMBER(38,0)")],
+    )
+    mock_cursor.connection.is_still_running.return_value = False
+    mock_conn = make_mock_conn(cursor=mock_cursor)
+    table = Table(name="PYTEST_ASYNC", schema_name="PUBLIC", database="SANDBOX")
+
+    asyncio.run(
+        table.merge_async(
+            path="s3://test-bucket/path",
+            file_format=parquet_file_format,
+            storage_integration=storage_integration,
+            connection=mock_conn,
+        )
+    )
+
+    submitted = [c.args[0] for c in mock_cursor.execute_async.call_args_list]
+    assert any("COPY INTO SANDBOX.PUBLIC.PYTEST_ASYNC_temp" in s for s in submitted)
+    assert "merge into SANDBOX.PUBLIC.PYTEST_ASYNC as dest" in submitted[-1]
+    assert (
+        "drop table SANDBOX.PUBLIC.PYTEST_ASYNC_temp"
+        in (mock_cursor.execute.call_args.args[0])
+    )
+
+
+def test_schema_merge_many_isolates_failures():
+    """Test merge_many runs every job and reports failures per job."""
+    tables = [Table(name=f"T{i}", schema_name="PUBLIC") for i in range(3)]
+    jobs = [
+        MergeJob(table=t, path=f"s3://bucket/{t.name}", file_format=parquet_file_format)
+        for t in tables
+    ]
+
+    def merge(self, **kwargs):
+        if self.name == "T1":
+            raise RuntimeError("boom")
+        return kwargs["path"]
+
+    with patch.object(Table, "merge", autospec=True, side_effect=merge):
+        results = test_schema.merge_many(jobs, max_workers=2)
+
+    assert [r.ok for r in results] == [True, False, True]
+    assert results[0].result == "s3://bucket/T0"
+    assert str(results[1].error) == "boom"
+    assert all(r.elapsed >= 0 for r in results)
+
+
+def test_schema_merge_many_caps_workers_to_pool_size():
+    jobs = [
+        MergeJob(
+            table=Table(name=f"T{i}", schema_name="PUBLIC"),
+            path="s3://bucket",
+            file_format=parquet_file_format,
+        )
+        for i in range(4)
+    ]
+    with (
+        patch.object(Table, "merge", autospec=True),
+        patch("snowflake_utils.models.schema.connection_pool.max_size", 3),
+        patch(
+            "snowflake_utils.models.schema.ThreadPoolExecutor", wraps=ThreadPoolExecutor
+        ) as executor,
+    ):
+        results = test_schema.merge_many(jobs, max_workers=16)
+    executor.assert_called_once_with(3)
+    assert all(r.ok for r in results)
+
+
+def test_sync_tags_batches_statements():
+    """Test sync_tags issues at most one SET and one UNSET per level."""
+    table = Table(
+        name="PYTEST",
+        schema_name="PUBLIC",
+        table_structure=TableStructure(
+            columns={
+                "id": Column(name="id", data_type="integer", tags={"pii": "personal"}),
+                "name": Column(
+                    name="name", data_type="text", tags={"pii": "it's", "owner": "x"}
+                ),
+                "last_name": Column(name="last_name", data_type="text"),
+            },
+            tags={"pii": "foo", "owner": "data"},
+        ),
+        existing_table_tags={"pii": "foo", "legacy": "bar"},
+        existing_column_tags={
+            "id": {"pii": "personal"},
+            "name": {"pii": "old"},
+            "last_name": {"pii": "personal", "legacy": "y"},
+        },
+    )
+    mock_cursor = make_mock_cursor()
+
+    assert table.sync_tags(mock_cursor) == 4
+
+    statements = [c.args[0] for c in mock_cursor.execute.call_args_list]
+    assert statements == [
+        "ALTER TABLE PUBLIC.PYTEST UNSET TAG governance.public.legacy",
+        "ALTER TABLE PUBLIC.PYTEST SET TAG governance.public.owner = 'data'",
+        'ALTER TABLE PUBLIC.PYTEST MODIFY COLUMN "LAST_NAME" UNSET TAG '
+        "governance.public.pii, governance.public.legacy",
+        'ALTER TABLE PUBLIC.PYTEST MODIFY COLUMN "NAME" SET TAG '
+        "governance.public.pii = 'it''s', governance.public.owner = 'x'",
+    ]
+
+
+def test_sync_tags_no_changes():
+    table = test_table.model_copy(
+        update={
+            "existing_table_tags": {"pii": "foo"},
+            "existing_column_tags": {"id": {"pii": "personal"}},
+        }
+    )
+    mock_cursor = make_mock_cursor()
+    assert table.sync_tags(mock_cursor) == 0
+    mock_cursor.execute.assert_not_called()
+
+
+def test_tag_catalog_serves_schema_tags():
+    catalog = TagCatalog()
+    mock_cursor = make_mock_cursor(
+        fetchall_return=[
+            ("PUBLIC", "PYTEST", "table", None, "pii", "foo"),
+            ("PUBLIC", "PYTEST", "column", "id", "pii", "personal"),
+            ("PUBLIC", "OTHER", "column", "name", "pii", "personal"),
+        ]
+    )
+    with (
+        patch("snowflake_utils.models.schema.tag_catalog", catalog),
+        patch("snowflake_utils.models.table.tag_catalog", catalog),
+    ):
+        assert test_schema.load_tags(mock_cursor) == 3
+        table = Table(name="pytest", schema_name="public", database="sandbox")
+        other = Table(name="OTHER", schema_name="PUBLIC", database="SANDBOX")
+        untagged = Table(name="UNTAGGED", schema_name="PUBLIC", database="SANDBOX")
+        elsewhere = Table(name="PYTEST", schema_name="RAW", database="SANDBOX")
+
+        lookups = make_mock_cursor(fetchall_return=[])
+        assert table.current_table_tags(lookups) == {"pii": "foo"}
+        assert table.current_column_tags(lookups) == {"id": {"pii": "personal"}}
+        assert other.current_table_tags(lookups) == {}
+        assert untagged.current_column_tags(lookups) == {}
+        lookups.execute.assert_not_called()
+
+        elsewhere.current_table_tags(lookups)
+        lookups.execute.assert_called_once()
+
+    query = mock_cursor.execute.call_args.args[0]
+    assert "snowflake.account_usage.tag_references" in query
+    assert "object_schema = 'PUBLIC'" in query
+    assert "object_database = 'SANDBOX'" in query
+
+
+def test_tag_catalog_invalidation_and_ttl():
+    catalog = TagCatalog(ttl=60)
+    mock_cursor = make_mock_cursor(
+        fetchall_return=[("PUBLIC", "PYTEST", "table", None, "pii", "old")]
+    )
+    catalog.load(mock_cursor, "SANDBOX")
+    table = test_table.model_copy(update={"database": "SANDBOX"})
+
+    with patch("snowflake_utils.models.table.tag_catalog", catalog):
+        assert table.current_table_tags(make_mock_cursor()) == {"pii": "old"}
+        table.sync_tags_table(make_mock_cursor())
+    assert catalog.table_tags("SANDBOX", "PUBLIC", "PYTEST") is None
+    assert catalog.table_tags("SANDBOX", "PUBLIC", "OTHER") == {}
+
+    with patch("snowflake_utils.models.catalog.time.monotonic", return_value=1e12):
+        assert catalog.table_tags("SANDBOX", "PUBLIC", "OTHER") is None
+
+
+@pytest.mark.parametrize("replace", ["full_refresh", "qualify"])
+def test_tag_catalog_invalidated_when_table_is_replaced(replace):
+    catalog = TagCatalog()
+    catalog.load(
+        make_mock_cursor(
+            fetchall_return=[
+                ("PUBLIC", "PYTEST", "table", None, "pii", "foo"),
+                ("PUBLIC", "PYTEST", "column", "id", "pii", "personal"),
+            ]
+        ),
+        "SANDBOX",
+    )
+    table = test_table.model_copy(update={"database": "SANDBOX"})
+    mock_cursor = make_mock_cursor(fetchall_return=[])
+
+    with patch("snowflake_utils.models.table.tag_catalog", catalog):
+        assert table.sync_tags(mock_cursor) == 0
+        if replace == "full_refresh":
+            table.create_table(True, lambda statement: None)
+        else:
+            table.qualify(mock_cursor, ["id"], None)
+        assert catalog.table_tags("SANDBOX", "PUBLIC", "PYTEST") is None
+        mock_cursor.execute.reset_mock()
+        # The tags are looked up live, and set again
+        assert table.sync_tags(mock_cursor) == 2
+    statements = [c.args[0] for c in mock_cursor.execute.call_args_list]
+    assert any("SET TAG" in s and "MODIFY COLUMN" not in s for s in statements)
+
+
+def test_schema_catalog_serves_lookups():
+    catalog = SchemaCatalog()
+    mock_cursor = make_mock_cursor(
+        fetchall_return=[
+            (
+                "SANDBOX",
+                "PUBLIC",
+                "PYTEST",
+                "BASE TABLE",
+                "ID",
+                "NUMBER",
+                None,
+                38,
+                0,
+                None,
+            ),
+            (
+                "SANDBOX",
+                "PUBLIC",
+                "PYTEST",
+                "BASE TABLE",
+                "NAME",
+                "TEXT",
+                16777216,
+                None,
+                None,
+                None,
+            ),
+            (
+                "SANDBOX",
+                "PUBLIC",
+                "PYTEST",
+                "BASE TABLE",
+                "TS",
+                "TIMESTAMP_NTZ",
+                None,
+                None,
+                None,
+                9,
+            ),
+            (
+                "SANDBOX",
+                "PUBLIC",
+                "V_PYTEST",
+                "VIEW",
+                "ID",
+                "NUMBER",
+                None,
+                38,
+                0,
+                None,
+            ),
+        ]
+    )
+    with (
+        patch("snowflake_utils.models.schema.schema_catalog", catalog),
+        patch("snowflake_utils.models.table.schema_catalog", catalog),
+    ):
+        assert test_schema.load_catalog(mock_cursor) == 4
+        table = Table(
+            name="pytest",
+            schema_name="PUBLIC",
+            database="SANDBOX",
+            table_structure=test_table_schema,
+        )
+        missing = table.model_copy(update={"name": "MISSING"})
+        lookups = make_mock_cursor()
+
+        assert table.exists(lookups)
+        assert not missing.exists(lookups)
+        assert [(c.name, c.data_type) for c in table.get_columns(lookups)] == [
+            ("ID", "NUMBER(38,0)"),
+            ("NAME", "VARCHAR(16777216)"),
+            ("TS", "TIMESTAMP_NTZ(9)"),
+        ]
+        assert [t.name for t in test_schema.get_tables()] == ["PYTEST"]
+        lookups.execute.assert_not_called()
+
+        table.create_table(False, lookups.execute)
+        assert catalog.columns("SANDBOX", "PUBLIC", "PYTEST") is not None
+
+        table.add_column(lookups, Column(name="extra", data_type="text"))
+        assert catalog.columns("SANDBOX", "PUBLIC", "PYTEST") is None
+        assert catalog.columns("SANDBOX", "PUBLIC", "V_PYTEST") is not None
+        assert [t.name for t in test_schema.get_tables()] == ["PYTEST"]
+
+        missing.create_table(False, lookups.execute)
+        assert catalog.columns("SANDBOX", "PUBLIC", "MISSING") is None
+        assert [t.name for t in test_schema.get_tables()] == ["MISSING", "PYTEST"]
+        missing.drop(lookups)
+        assert not missing.exists(lookups)
+        assert [t.name for t in test_schema.get_tables()] == ["PYTEST"]
+        assert lookups.execute.call_count == 4
+
+        catalog.invalidate("SANDBOX", "RAW", "PYTEST")
+        assert catalog._invalidated == {("sandbox", "public", "pytest")}
+
+    query = mock_cursor.execute.call_args.args[0]
+    assert "from SANDBOX.information_schema.columns" in query
+    assert "c.table_schema = 'PUBLIC'" in query
+
+
+def test_schema_catalog_ttl_and_refresh():
+    catalog = SchemaCatalog(ttl=60)
+    mock_cursor = make_mock_cursor(
+        fetchall_return=[
+            (
+                "SANDBOX",
+                "PUBLIC",
+                "PYTEST",
+                "BASE TABLE",
+                "ID",
+                "NUMBER",
+                None,
+                38,
+                0,
+                None,
+            )
+        ]
+    )
+    catalog.load(mock_cursor, "sandbox", "public")
+    query = mock_cursor.execute.call_args.args[0]
+    assert "from sandbox.information_schema.columns" in query
+    assert "c.table_schema = 'PUBLIC'" in query
+    catalog.invalidate("SANDBOX", "PUBLIC", "PYTEST")
+    catalog.refresh(mock_cursor)
+    assert mock_cursor.execute.call_count == 2
+    assert catalog.tables("SANDBOX", "PUBLIC") == [("PYTEST", "SANDBOX", "PUBLIC")]
+
+    with patch("snowflake_utils.models.catalog.time.monotonic", return_value=1e12):
+        assert catalog.columns("SANDBOX", "PUBLIC", "PYTEST") is None
+    assert catalog.tables("SANDBOX", "PUBLIC") is None
+
+
+def test_merge_temporary_staging_table():
+    """Test merge stages into a uniquely named temporary table in the same session."""
+    mock_cursor = make_mock_cursor(
+        fetchall_side_effect=lambda: [("ID", "NUMBER(38,0)")],
+    )
+    mock_conn = make_mock_conn(cursor=mock_cursor)
+    table = Table(name="PYTEST", schema_name="PUBLIC", database="SANDBOX")
+
+    for _ in range(2):
+        table.merge(
+            path="s3://test-bucket/path",
+            file_format=parquet_file_format,
+            storage_integration=storage_integration,
+            connection=mock_conn,
+            staging_table_type=TableType.TEMPORARY,
+        )
+
+    statements = [
+        s for c in mock_cursor.execute.call_args_list for s in c.args[0].split(";\n")
+    ]
+    creates = [s for s in statements if "CREATE TEMPORARY TABLE IF NOT EXISTS" in s]
+    staging = [s.split()[6] for s in creates]
+    assert len(set(staging)) == 2
+    assert all(s.startswith("SANDBOX.PUBLIC.PYTEST_temp_") for s in staging)
+    assert all("DATA_RETENTION_TIME_IN_DAYS = 0" in s for s in creates)
+    assert f"drop table {staging[-1]}" in statements
+    assert "COPY GRANTS" not in creates[0]
+    # The temporary file format and stage are named after the target and created once
+    (file_format,) = [s for s in statements if "TEMPORARY FILE FORMAT" in s]
+    assert "SANDBOX.PUBLIC.TMP_FILE_FORMAT_PUBLIC_PYTEST\n" in file_format
+    (stage,) = [s for s in statements if "TEMPORARY STAGE" in s]
+    assert "SANDBOX.PUBLIC.TMP_EXTERNAL_STAGE_PUBLIC_PYTEST\n" in stage
+
+
+def test_merge_drops_temporary_staging_table_on_error():
+    mock_cursor = make_mock_cursor(
+        fetchall_side_effect=lambda: [("ID", "NUMBER(38,0)")],
+    )
+    mock_conn = make_mock_conn(cursor=mock_cursor)
+    table = Table(name="PYTEST", schema_name="PUBLIC", database="SANDBOX")
+
+    with (
+        patch.object(Table, "_prepare_merge", side_effect=RuntimeError("boom")),
+        pytest.raises(RuntimeError),
+    ):
+        table.merge(
+            path="s3://test-bucket/path",
+            file_format=parquet_file_format,
+            storage_integration=storage_integration,
+            connection=mock_conn,
+            staging_table_type=TableType.TRANSIENT,
+        )
+
+    last = mock_cursor.execute.call_args.args[0]
+    assert last.startswith("drop table if exists SANDBOX.PUBLIC.PYTEST_temp_")
+
+
+def test_transient_table_statements():
+    table = test_table.model_copy(update={"table_type": TableType.TRANSIENT})
+    assert table.get_create_table_statement(full_refresh=True) == (
+        f"CREATE OR REPLACE TRANSIENT TABLE PUBLIC.PYTEST ({test_table_schema.parsed_columns})"
+        " DATA_RETENTION_TIME_IN_DAYS = 0"
+    )
+    assert "create or replace transient table PUBLIC.PYTEST" in (
+        table._qualify_statement(["id"], None)
+    )
+
+
+def test_merge_qualify_in_source():
+    """Test QualifyMode.SOURCE deduplicates in the MERGE source instead of rewriting the staging table."""
+    mock_cursor = make_mock_cursor(
+        fetchall_side_effect=lambda: [("ID", "NUMBER(38,0)")],
+    )
+    mock_conn = make_mock_conn(cursor=mock_cursor)
+    table = Table(name="PYTEST", schema_name="PUBLIC", database="SANDBOX")
+
+    table.merge(
+        path="s3://test-bucket/path",
+        file_format=parquet_file_format,
+        storage_integration=storage_integration,
+        replication_keys=["updated_at"],
+        qualify=True,
+        qualify_mode=QualifyMode.SOURCE,
+        connection=mock_conn,
+    )
+
+    statements = [c.args[0] for c in mock_cursor.execute.call_args_list]
+    assert not any("create or replace table" in s for s in statements)
+    merge = next(s for s in statements if "merge into" in s)
+    assert (
+        "using (select * from SANDBOX.PUBLIC.PYTEST_temp qualify row_number() over "
+        '(partition by "ID" order by "UPDATED_AT" desc) = 1) tmp'
+    ) in merge
+
+
+def test_copy_into_incremental_qualify():
+    """Test incremental qualify deletes superseded rows of the loaded keys only."""
+    table = Table(
+        name="PYTEST",
+        schema_name="PUBLIC",
+        database="SANDBOX",
+        include_metadata=[
+            MetadataColumn(
+                name="loaded_at", data_type="timestamp_ltz", metadata="START_SCAN_TIME"
+            )
+        ],
+    )
+    mock_cursor = make_mock_cursor()
+    mock_conn = make_mock_conn(cursor=mock_cursor)
+
+    with patch.object(Table, "_copy") as mock_copy:
+        table.copy_into(
+            path=path,
+            file_format=parquet_file_format,
+            storage_integration=storage_integration,
+            primary_keys=["id"],
+            replication_keys=["updated_at"],
+            qualify=True,
+            qualify_mode=QualifyMode.INCREMENTAL,
+            connection=mock_conn,
+        )
+    mock_copy.assert_called_once()
+
+    set_statement, delete = [c.args[0] for c in mock_cursor.execute.call_args_list]
+    assert set_statement == "set LOAD_STARTED_AT = current_timestamp()"
+    delete = " ".join(delete.split())
+    assert delete.startswith("delete from SANDBOX.PUBLIC.PYTEST as dest using (")
+    assert (
+        '("ID") in ( select "ID" from SANDBOX.PUBLIC.PYTEST '
+        'where "LOADED_AT" >= $LOAD_STARTED_AT )'
+    ) in delete
+    assert (
+        'qualify rank() over (partition by "ID" order by "UPDATED_AT" desc, "LOADED_AT" desc) > 1'
+    ) in delete
+    assert delete.endswith(
+        'where dest."ID" = superseded."ID" and dest."UPDATED_AT" = superseded."UPDATED_AT" '
+        'and dest."LOADED_AT" = superseded."LOADED_AT"'
+    )
+
+
+def test_incremental_qualify_requires_scan_time():
+    with pytest.raises(ValueError, match="START_SCAN_TIME"):
+        test_table.copy_into(
+            path=path,
+            file_format=parquet_file_format,
+            replication_keys=["updated_at"],
+            qualify=True,
+            qualify_mode=QualifyMode.INCREMENTAL,
+            connection=make_mock_conn(),
+        )
+
+
+def test_incremental_qualify_requires_replication_keys():
+    table = test_table.model_copy(
+        update={
+            "include_metadata": [
+                MetadataColumn(
+                    name="loaded_at",
+                    data_type="timestamp_ltz",
+                    metadata="START_SCAN_TIME",
+                )
+            ]
+        }
+    )
+    mock_cursor = make_mock_cursor()
+    with pytest.raises(ValueError, match="replication keys"):
+        table.copy_into(
+            path=path,
+            file_format=parquet_file_format,
+            qualify=True,
+            qualify_mode=QualifyMode.INCREMENTAL,
+            connection=make_mock_conn(cursor=mock_cursor),
+        )
+    with pytest.raises(ValueError, match="replication keys"):
+        table.qualify(mock_cursor, ["id"], None, QualifyMode.INCREMENTAL)
+    mock_cursor.execute.assert_not_called()
+
+
+def test_merge_statement_skip_unchanged():
+    """Test the change-aware merge only updates rows with different values, never the keys."""
+    main_table = Table(name="PYTEST", schema_name="PUBLIC", database="SANDBOX")
+    temp_table = main_table.model_copy(update={"name": "PYTEST_temp"})
+    columns = [
+        Column(name="ID", data_type="NUMBER(38,0)"),
+        Column(name="NAME", data_type="VARCHAR(16777216)"),
+        Column(name="PAYLOAD", data_type="VARCHAR(16777216)"),
+    ]
+    old_columns = {
+        "ID": "NUMBER(38,0)",
+        "NAME": "VARCHAR(16777216)",
+        "PAYLOAD": "VARIANT",
+    }
+
+    result = " ".join(
+        main_table._merge_statement(
+            temp_table, columns, old_columns, ["id"], skip_unchanged=True
+        ).split()
+    )
+
+    assert (
+        'when matched and (dest."NAME" is distinct from tmp."NAME" or '
+        'dest."PAYLOAD" is distinct from PARSE_JSON(tmp."PAYLOAD")) then update set '
+        'dest."NAME" = tmp."NAME",dest."PAYLOAD" = PARSE_JSON(tmp."PAYLOAD")'
+    ) in result
+    assert 'dest."ID" = tmp."ID" when' in result
+
+    keys_only = main_table._merge_statement(
+        temp_table, columns[:1], old_columns, ["id"], skip_unchanged=True
+    )
+    assert "when matched" not in keys_only
+
+
+def test_merge_pruning_column():
+    """Test the staged range of the pruning column is added to the merge join condition."""
+    mock_cursor = make_mock_cursor(
+        fetchall_side_effect=lambda: [("ID", "NUMBER(38,0)"), ("EVENT_DATE", "DATE")],
+    )
+    mock_cursor.fetchone.return_value = ("2024-01-01", "2024-01-03")
+    mock_conn = make_mock_conn(cursor=mock_cursor)
+    table = Table(name="PYTEST", schema_name="PUBLIC", database="SANDBOX")
+
+    table.merge(
+        path="s3://test-bucket/path",
+        file_format=parquet_file_format,
+        storage_integration=storage_integration,
+        pruning_column="event_date",
+        connection=mock_conn,
+    )
+
+    statements = [c.args[0] for c in mock_cursor.execute.call_args_list]
+    assert (
+        """select to_varchar(min("EVENT_DATE"), 'YYYY-MM-DD'), """
+        """to_varchar(max("EVENT_DATE"), 'YYYY-MM-DD') """
+        "from SANDBOX.PUBLIC.PYTEST_temp"
+    ) in statements
+    merge = " ".join(next(s for s in statements if "merge into" in s).split())
+    assert (
+        'ON dest."ID" = tmp."ID" and dest."EVENT_DATE" between '
+        "to_date('2024-01-01', 'YYYY-MM-DD') and to_date('2024-01-03', 'YYYY-MM-DD')"
+    ) in merge
+
+
+@pytest.mark.parametrize(
+    "data_type, low, high, expected",
+    [
+        (
+            "TIMESTAMP_NTZ(9)",
+            "2024-01-01 00:00:00.000000001",
+            "2024-01-01 10:00:00.123456789",
+            "to_timestamp_ntz('2024-01-01 10:00:00.123456789', 'YYYY-MM-DD HH24:MI:SS.FF9')",
+        ),
+        (
+            "TIMESTAMP_TZ(9)",
+            "2024-01-01 00:00:00.000000001 +0100",
+            "2024-01-01 10:00:00.123456789 +0100",
+            "to_timestamp_tz('2024-01-01 10:00:00.123456789 +0100', "
+            "'YYYY-MM-DD HH24:MI:SS.FF9 TZHTZM')",
+        ),
+        ("NUMBER(38,0)", "1", "10", "'10'::NUMBER(38,0)"),
+        ("VARCHAR(16)", "a", "it's", "'it''s'::VARCHAR(16)"),
+    ],
+)
+def test_pruning_predicate_full_precision(data_type, low, high, expected):
+    mock_cursor = make_mock_cursor()
+    mock_cursor.fetchone.return_value = (low, high)
+    columns = [Column(name="UPDATED", data_type=data_type)]
+    predicate = test_table._pruning_predicate(mock_cursor, "updated", columns)
+    assert predicate.endswith(f" and {expected}")
+    query = mock_cursor.execute.call_args.args[0]
+    if data_type.startswith("TIMESTAMP"):
+        assert 'to_varchar(max("UPDATED"), \'YYYY-MM-DD HH24:MI:SS.FF9' in query
+        assert "::varchar" not in query
+    else:
+        assert 'max("UPDATED")::varchar' in query
+
+
+def test_pruning_predicate_empty_staging():
+    mock_cursor = make_mock_cursor()
+    mock_cursor.fetchone.return_value = (None, None)
+    columns = [Column(name="EVENT_DATE", data_type="DATE")]
+    assert test_table._pruning_predicate(mock_cursor, "event_date", columns) is None
+    with pytest.raises(ValueError):
+        test_table._pruning_predicate(mock_cursor, "missing", columns)
+
+
+@pytest.mark.parametrize("data_type", ["FLOAT", "NUMBER(38,2)", "DECIMAL(10, 3)"])
+def test_pruning_predicate_rejects_inexact_types(data_type):
+    mock_cursor = make_mock_cursor()
+    columns = [Column(name="AMOUNT", data_type=data_type)]
+    with pytest.raises(ValueError, match="integer, text, date or timestamp"):
+        test_table._pruning_predicate(mock_cursor, "amount", columns)
+    mock_cursor.execute.assert_not_called()
+
+
+@pytest.mark.parametrize(
+    "strategy, overlap, expected",
+    [
+        (
+            MergeStrategy.DELETE_INSERT,
+            None,
+            ["begin", "delete from", "insert into", "commit"],
+        ),
+        (MergeStrategy.APPEND, None, ["insert into"]),
+        (MergeStrategy.AUTO, None, ["select 1 from", "insert into"]),
+        (MergeStrategy.AUTO, (1,), ["select 1 from", "merge into"]),
+    ],
+)
+def test_merge_strategies(strategy, overlap, expected):
+    mock_cursor = make_mock_cursor(
+        fetchall_side_effect=lambda: [("ID", "NUMBER(38,0)"), ("NAME", "TEXT")],
+    )
+    mock_cursor.fetchone.return_value = overlap
+    mock_conn = make_mock_conn(cursor=mock_cursor)
+    table = Table(name="PYTEST", schema_name="PUBLIC", database="SANDBOX")
+
+    with patch.object(Table, "_copy"):
+        table.merge(
+            path="s3://test-bucket/path",
+            file_format=parquet_file_format,
+            connection=mock_conn,
+            strategy=strategy,
+        )
+
+    statements = [
+        " ".join(c.args[0].split()) for c in mock_cursor.execute.call_args_list
+    ]
+    # exists, desc target, desc staging, then the strategy, then drop
+    loading = statements[3:-1]
+    assert [s.startswith(e) for s, e in zip(loading, expected)] == [True] * len(
+        expected
+    )
+    assert len(loading) == len(expected)
+    if "insert into" in expected:
+        insert = next(s for s in loading if s.startswith("insert into"))
+        assert insert == (
+            'insert into SANDBOX.PUBLIC.PYTEST ("ID","NAME") '
+            'select tmp."ID",tmp."NAME" from SANDBOX.PUBLIC.PYTEST_temp tmp'
+        )
+    assert statements[-1] == "drop table SANDBOX.PUBLIC.PYTEST_temp"
+
+
+def test_merge_delete_insert_rolls_back_on_error():
+    mock_cursor = make_mock_cursor()
+
+    def execute(statement):
+        if statement.startswith("insert"):
+            raise RuntimeError("boom")
+        return mock_cursor
+
+    mock_cursor.execute.side_effect = execute
+    with pytest.raises(RuntimeError):
+        _execute_all(mock_cursor, ["delete from t", "insert into t"])
+    assert mock_cursor.execute.call_args.args[0] == "rollback"
+
+
+def test_copy_into_swap_full_refresh():
+    """Test the swap full refresh loads a shadow table and swaps it with the table."""
+    mock_cursor = make_mock_cursor(fetchall_return=[("PYTEST",)])
+    mock_conn = make_mock_conn(cursor=mock_cursor)
+    table = test_table.model_copy(update={"database": "SANDBOX"})
+
+    with patch.object(Table, "_copy") as mock_copy:
+        table.copy_into(
+            path=path,
+            file_format=parquet_file_format,
+            full_refresh=True,
+            swap=True,
+            connection=mock_conn,
+        )
+
+    shadow = mock_copy.call_args.args[0].split()[2]
+    assert shadow.startswith("SANDBOX.PUBLIC.PYTEST_swap_")
+    full_refresh, sync_tags = mock_copy.call_args.args[4:6]
+    assert full_refresh and sync_tags
+    statements = [c.args[0] for c in mock_cursor.execute.call_args_list]
+    assert statements[1:] == [
+        f"create table {shadow} clone SANDBOX.PUBLIC.PYTEST copy grants",
+        f"alter table SANDBOX.PUBLIC.PYTEST swap with {shadow}",
+        f"drop table {shadow}",
+    ]
+
+
+def test_swap_shadow_reuses_temporary_objects():
+    mock_conn = make_mock_conn(cursor=make_mock_cursor(fetchall_return=[("PYTEST",)]))
+    table = test_table.model_copy(update={"database": "SANDBOX"})
+
+    with patch.object(Table, "_copy", autospec=True) as mock_copy:
+        table.copy_into(
+            path=path,
+            file_format=parquet_file_format,
+            storage_integration=storage_integration,
+            full_refresh=True,
+            swap=True,
+            connection=mock_conn,
+        )
+
+    shadow = mock_copy.call_args.args[0]
+    assert shadow.name.startswith("PYTEST_swap_")
+    assert shadow.temporary_file_format == table.temporary_file_format
+    assert shadow.temporary_stage == table.temporary_stage
+
+
+def test_copy_into_swap_failure_keeps_table():
+    mock_cursor = make_mock_cursor(fetchall_return=[])
+    mock_conn = make_mock_conn(cursor=mock_cursor)
+    table = test_table.model_copy(update={"database": "SANDBOX"})
+
+    with (
+        patch.object(Table, "_copy", side_effect=RuntimeError("boom")),
+        pytest.raises(RuntimeError),
+    ):
+        table.copy_into(
+            path=path,
+            file_format=parquet_file_format,
+            full_refresh=True,
+            swap=True,
+            connection=mock_conn,
+        )
+
+    statements = [c.args[0] for c in mock_cursor.execute.call_args_list]
+    assert not any("swap with" in s or "rename" in s for s in statements)
+    assert statements[-1].startswith("drop table if exists SANDBOX.PUBLIC.PYTEST_swap_")
+
+
+def test_merge_hash_partitions_resume():
+    """Test partitioned merges run one statement per hash partition, from start_partition on."""
+    mock_cursor = make_mock_cursor(
+        fetchall_side_effect=lambda: [("ID", "NUMBER(38,0)"), ("NAME", "TEXT")],
+    )
+    mock_conn = make_mock_conn(cursor=mock_cursor)
+    table = Table(name="PYTEST", schema_name="PUBLIC", database="SANDBOX")
+
+    with patch.object(Table, "_copy"):
+        table.merge(
+            path="s3://test-bucket/path",
+            file_format=parquet_file_format,
+            connection=mock_conn,
+            partitions=3,
+            start_partition=1,
+        )
+
+    merges = [
+        " ".join(c.args[0].split())
+        for c in mock_cursor.execute.call_args_list
+        if "merge into" in c.args[0]
+    ]
+    assert len(merges) == 2
+    for index, merge in enumerate(merges, 1):
+        assert (
+            "using (select * from SANDBOX.PUBLIC.PYTEST_temp "
+            f'where mod(abs(hash("ID")), 3) = {index}) tmp'
+        ) in merge
+
+
+@pytest.mark.parametrize(
+    "partitions, start_partition", [(None, 1), (3, 3), (3, -1), (None, -1)]
+)
+def test_merge_rejects_out_of_range_start_partition(partitions, start_partition):
+    mock_cursor = make_mock_cursor()
+    mock_conn = make_mock_conn(cursor=mock_cursor)
+    arguments = dict(
+        path="s3://test-bucket/path",
+        file_format=parquet_file_format,
+        connection=mock_conn,
+        partitions=partitions,
+        start_partition=start_partition,
+    )
+    with pytest.raises(ValueError, match="start_partition"):
+        test_table.merge(**arguments)
+    with pytest.raises(ValueError, match="start_partition"):
+        asyncio.run(test_table.merge_async(**arguments))
+    mock_cursor.execute.assert_not_called()
+
+
+def test_execute_statements_single_request():
+    """Test the setup statements are submitted as one multi-statement request."""
+    mock_cursor = make_mock_cursor()
+    mock_cursor.fetchall.side_effect = [[("a",)], [("b",)], [("c",)]]
+
+    results = execute_statements(
+        mock_cursor, ["USE ROLE R", "USE DATABASE D;", "  CREATE STAGE S\n"]
+    )
+
+    mock_cursor.execute.assert_called_once_with(
+        "USE ROLE R;\nUSE DATABASE D;\nCREATE STAGE S", num_statements=3
+    )
+    assert mock_cursor.nextset.call_count == 2
+    assert results == [[("a",)], [("b",)], [("c",)]]
+    assert execute_statements(mock_cursor, []) == []
+
+
+def test_copy_submits_preamble_in_one_request():
+    mock_cursor = make_mock_cursor()
+    mock_conn = make_mock_conn(cursor=mock_cursor)
+    table = Table(name="PYTEST", schema_name="PUBLIC", role="LOADER")
+
+    table.copy_into(
+        path=path,
+        file_format=json_file_format,
+        storage_integration=storage_integration,
+        connection=mock_conn,
+    )
+
+    preamble, copy = mock_cursor.execute.call_args_list
+    assert preamble.kwargs == {"num_statements": 5}
+    assert [s.split()[0:3] for s in preamble.args[0].split(";\n")] == [
+        ["USE", "ROLE", "LOADER"],
+        ["USE", "DATABASE", "snowlfake"],
+        ["CREATE", "OR", "REPLACE"],
+        ["CREATE", "OR", "REPLACE"],
+        ["CREATE", "TABLE", "IF"],
+    ]
+    assert "COPY INTO PUBLIC.PYTEST" in copy.args[0]
+
+
+def test_copy_reuses_session_temporary_objects():
+    mock_cursor = make_mock_cursor()
+    mock_conn = make_mock_conn(cursor=mock_cursor)
+    mock_cursor.connection = mock_conn
+    table = Table(name="PYTEST", schema_name="PUBLIC")
+
+    def preamble(file_format):
+        mock_cursor.execute.reset_mock()
+        table.copy_into(
+            path=path,
+            file_format=file_format,
+            storage_integration=storage_integration,
+            connection=mock_conn,
+        )
+        return [
+            " ".join(s.split()[0:5])
+            for s in mock_cursor.execute.call_args_list[0].args[0].split(";\n")
+        ]
+
+    assert preamble(json_file_format) == [
+        "USE DATABASE snowlfake",
+        "CREATE OR REPLACE TEMPORARY FILE",
+        "CREATE OR REPLACE TEMPORARY STAGE",
+        "CREATE TABLE IF NOT EXISTS",
+    ]
+    assert preamble(json_file_format) == [
+        "USE DATABASE snowlfake",
+        "CREATE TABLE IF NOT EXISTS",
+    ]
+    csv_file_format = InlineFileFormat(definition="TYPE = CSV")
+    assert preamble(csv_file_format) == [
+        "USE DATABASE snowlfake",
+        "CREATE OR REPLACE TEMPORARY FILE",
+        "CREATE TABLE IF NOT EXISTS",
+    ]
+
+    mock_cursor.execute.side_effect = [Exception("Session expired")]
+    with pytest.raises(Exception, match="Session expired"):
+        preamble(csv_file_format)
+    mock_cursor.execute.side_effect = None
+    assert len(preamble(csv_file_format)) == 4
+
+
+def test_copy_chunks_large_file_lists():
+    files = [f"file_{i}.parquet" for i in range(2500)]
+    copies = []
+    failed = set()
+
+    def execute(statement, **kwargs):
+        if "COPY INTO" in statement:
+            chunk = statement.count(".parquet")
+            # The second chunk fails once and is retried on its own
+            if chunk == 500 and not failed:
+                failed.add(chunk)
+                raise Exception("Transient failure")
+            copies.append(chunk)
+            cursor.fetchall.return_value = [(f"chunk of {chunk}", "LOADED")]
+        return cursor
+
+    def make_cursor():
+        nonlocal cursor
+        cursor = make_mock_cursor()
+        cursor.execute.side_effect = execute
+        return cursor
+
+    cursor = None
+    mock_conn = make_mock_conn()
+    mock_conn.cursor.side_effect = make_cursor
+
+    result = test_table.copy_into(
+        path=path,
+        file_format=parquet_file_format,
+        stage="EXTERNAL_STAGE",
+        files=files,
+        connection=mock_conn,
+        copy_concurrency=1,
+    )
+
+    assert sorted(copies) == [500, 1000, 1000]
+    assert result == [
+        ("chunk of 1000", "LOADED"),
+        ("chunk of 1000", "LOADED"),
+        ("chunk of 500", "LOADED"),
+    ]
+
+
+def test_copy_infers_structure_once():
+    inference_cache.clear()
+    mock_cursor = make_mock_cursor()
+    mock_conn = make_mock_conn(cursor=mock_cursor)
+    executed = []
+
+    def execute(statement, **kwargs):
+        executed.append(statement)
+        if statement.startswith("list @"):
+            rows = [("s3://bucket/a.parquet", 10, "md5", "Mon, 1 Jan 2024")]
+        elif "infer_schema" in statement:
+            rows = [("ID", "NUMBER(38,0)"), ("NAME", "TEXT")]
+        elif "information_schema.tables" in statement:
+            rows = [("PYTEST",)] if "'EXISTING'" in statement else []
+        else:
+            rows = [("statement succeeded",)]
+        mock_cursor.fetchall.return_value = rows
+        return mock_cursor
+
+    mock_cursor.execute.side_effect = execute
+    inference = SchemaInference(max_file_count=10)
+    for name in ["PYTEST", "PYTEST_temp"]:
+        Table(
+            name=name,
+            schema_name="PUBLIC",
+            schema_inference=inference,
+            include_metadata=[
+                MetadataColumn(
+                    name="_LOADED_AT",
+                    data_type="TIMESTAMP_LTZ",
+                    metadata="START_SCAN_TIME",
+                )
+            ],
+        ).copy_into(
+            path=path,
+            file_format=parquet_file_format,
+            storage_integration=storage_integration,
+            connection=mock_conn,
+        )
+
+    inferences = [s for s in executed if "infer_schema" in s]
+    assert len(inferences) == 1
+    assert "MAX_FILE_COUNT => 10" in inferences[0]
+    creates = [s for s in executed if s.startswith("CREATE TABLE IF NOT EXISTS")]
+    assert [c.split()[5] for c in creates] == ["PUBLIC.PYTEST", "PUBLIC.PYTEST_temp"]
+    for create in creates:
+        assert '("ID" NUMBER(38,0), "NAME" TEXT, "_LOADED_AT"' in create
+        assert "USING TEMPLATE" not in create
+
+    # An existing table is neither listed, inferred nor created again
+    executed.clear()
+    inference_cache.clear()
+    Table(name="EXISTING", schema_name="PUBLIC", schema_inference=inference).copy_into(
+        path=path,
+        file_format=parquet_file_format,
+        storage_integration=storage_integration,
+        connection=mock_conn,
+    )
+    assert not [s for s in executed if s.startswith(("list @", "CREATE TABLE"))]
+    assert not [s for s in executed if "infer_schema" in s]
+    assert any(s.lstrip().startswith("COPY INTO PUBLIC.EXISTING") for s in executed)
+
+
+def test_copy_and_merge_results():
+    mock_cursor = make_mock_cursor()
+    mock_conn = make_mock_conn(cursor=mock_cursor)
+    mock_cursor.sfqid = "01-abc"
+
+    def execute(statement, **kwargs):
+        if statement.lstrip().startswith("COPY INTO"):
+            rows = [
+                ("s3://bucket/a.parquet", "LOADED", 3, 3, 1, 0, None, None, None, None),
+                (
+                    "s3://bucket/b.parquet",
+                    "LOAD_FAILED",
+                    2,
+                    0,
+                    1,
+                    2,
+                    "bad row",
+                    1,
+                    1,
+                    "ID",
+                ),
+            ]
+        elif statement.lstrip().startswith("merge into"):
+            rows = [(4, 1)]
+        elif statement.startswith("desc table"):
+            rows = [("ID", "NUMBER(38,0)"), ("NAME", "TEXT")]
+        else:
+            rows = [(1,)]
+        mock_cursor.fetchall.return_value = rows
+        mock_cursor.fetchone.return_value = (1,)
+        return mock_cursor
+
+    mock_cursor.execute.side_effect = execute
+    table = Table(name="PYTEST", schema_name="PUBLIC")
+    load = table.copy_into(
+        path=path,
+        file_format=parquet_file_format,
+        stage="EXTERNAL_STAGE",
+        connection=mock_conn,
+    )
+    assert load[0][1] == "LOADED"
+    assert (load.rows_parsed, load.rows_loaded, load.errors_seen) == (5, 3, 2)
+    assert [f.file for f in load.failed_files] == ["s3://bucket/b.parquet"]
+    assert load.failed_files[0].first_error == "bad row"
+    assert load.query_ids == ["01-abc"]
+    assert set(load.phases) == {"setup", "copy"}
+
+    result = table.merge(
+        path=path,
+        file_format=parquet_file_format,
+        stage="EXTERNAL_STAGE",
+        connection=mock_conn,
+    )
+    assert (result.rows_inserted, result.rows_updated) == (4, 1)
+    assert result.load.rows_loaded == 3
+    assert result.query_ids == ["01-abc"]
+    assert list(result.phases) == ["copy", "prepare", "merge", "drop"]
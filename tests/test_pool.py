@@ -0,0 +1,102 @@
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from snowflake_utils.pool import ConnectionPool, SessionObjects
+from snowflake_utils.settings import SnowflakeSettings
+
+
+def make_session(closed: bool = False, valid: bool = True) -> MagicMock:
+    session = MagicMock()
+    session.is_closed.return_value = closed
+    session.is_valid.return_value = valid
+    return session
+
+
+@pytest.fixture
+def mock_connect():
+    with patch.object(SnowflakeSettings, "connect") as mock_connect:
+        mock_connect.side_effect = lambda **_: make_session()
+        yield mock_connect
+
+
+def test_pool_reuses_released_session(mock_connect):
+    pool = ConnectionPool(max_size=2)
+    with pool.connection() as first:
+        pass
+    with pool.connection() as second:
+        pass
+    assert first is second
+    mock_connect.assert_called_once_with(client_session_keep_alive=True)
+
+
+def test_pool_keys_sessions_by_role(mock_connect):
+    pool = ConnectionPool(max_size=2)
+    with pool.connection(settings=SnowflakeSettings(role="LOADER")) as loader:
+        pass
+    with pool.connection(settings=SnowflakeSettings(role="READER")) as reader:
+        pass
+    assert loader is not reader
+    assert mock_connect.call_count == 2
+
+
+def test_pool_uses_explicit_connection(mock_connect):
+    pool = ConnectionPool()
+    explicit = make_session()
+    with pool.connection(explicit) as connection:
+        assert connection is explicit
+    mock_connect.assert_not_called()
+
+
+def test_pool_discards_unhealthy_session(mock_connect):
+    pool = ConnectionPool(max_size=1, validate_after=0)
+    with pool.connection() as first:
+        first.is_valid.return_value = False
+    with pool.connection() as second:
+        pass
+    assert first is not second
+    first.close.assert_called_once()
+
+
+def test_pool_evicts_idle_sessions(mock_connect):
+    pool = ConnectionPool(max_size=1, idle_timeout=0)
+    with pool.connection() as first:
+        pass
+    with pool.connection() as second:
+        pass
+    assert first is not second
+    first.close.assert_called_once()
+
+
+def test_pool_is_bounded(mock_connect):
+    pool = ConnectionPool(max_size=1, checkout_timeout=0.01)
+    with pool.connection():
+        with pytest.raises(TimeoutError):
+            pool.acquire()
+
+
+def test_pool_rolls_back_on_error(mock_connect):
+    pool = ConnectionPool(max_size=1)
+    with pytest.raises(RuntimeError):
+        with pool.connection() as connection:
+            raise RuntimeError("boom")
+    connection.rollback.assert_called_once()
+    with pool.connection() as reused:
+        assert reused is connection
+
+
+def test_session_objects_are_capped_per_session():
+    objects = SessionObjects(max_per_session=2)
+    session, other = MagicMock(), MagicMock()
+    objects.created(session, "FORMAT_A", "a")
+    objects.created(session, "STAGE_B", "b")
+    assert objects.exists(session, "format_a", "a")
+    objects.created(session, "FORMAT_C", "c")
+    objects.created(other, "FORMAT_A", "a")
+
+    # STAGE_B was the least recently used
+    assert not objects.exists(session, "STAGE_B", "b")
+    assert objects.exists(session, "FORMAT_A", "a")
+    assert objects.exists(session, "FORMAT_C", "c")
+    assert not objects.exists(session, "FORMAT_C", "other definition")
+    assert objects.exists(other, "FORMAT_A", "a")
@@ -0,0 +1,48 @@
+import asyncio
+import time
+from unittest.mock import MagicMock, patch
+
+from snowflake_utils.queries import execute_statement_async
+
+
+def test_execute_statement_async_polls_until_done():
+    cursor = MagicMock()
+    cursor.execute_async.return_value = {"queryId": "01-abc"}
+    cursor.connection.is_still_running.side_effect = [True, True, False]
+    cursor.fetchall.return_value = [("LOADED",)]
+
+    with patch("snowflake_utils.queries.asyncio.sleep") as mock_sleep:
+        mock_sleep.return_value = None
+        result = asyncio.run(
+            execute_statement_async(cursor, "copy into t", poll_interval=1)
+        )
+
+    assert result == [("LOADED",)]
+    cursor.execute_async.assert_called_once_with("copy into t")
+    cursor.connection.get_query_status_throw_if_error.assert_called_with("01-abc")
+    assert [c.args[0] for c in mock_sleep.call_args_list] == [1, 2]
+    cursor.get_results_from_sfqid.assert_called_once_with("01-abc")
+
+
+def test_execute_statement_async_keeps_the_loop_responsive():
+    cursor = MagicMock()
+    cursor.execute_async.return_value = {"queryId": "01-abc"}
+    cursor.connection.is_still_running.return_value = False
+
+    def status(query_id):
+        time.sleep(0.2)
+        return "SUCCESS"
+
+    cursor.connection.get_query_status_throw_if_error.side_effect = status
+
+    async def main():
+        ticks = 0
+        poll = asyncio.create_task(execute_statement_async(cursor, "copy into t"))
+        while not poll.done():
+            await asyncio.sleep(0.01)
+            ticks += 1
+        await poll
+        return ticks
+
+    # The loop kept running other coroutines while the status request blocked
+    assert asyncio.run(main()) >= 5
@@ -0,0 +1,86 @@
+from contextlib import nullcontext
+from unittest.mock import MagicMock
+
+import pytest
+
+from snowflake_utils.models import InlineFileFormat, Table
+from snowflake_utils.tracing import InMemoryTracer, OpenTelemetryTracer, tracing
+
+
+def make_cursor():
+    cursor = MagicMock()
+    cursor.sfqid = "01-abc"
+    cursor.rowcount = 1
+
+    def execute(statement, **kwargs):
+        if statement.startswith("desc table"):
+            rows = [("ID", "NUMBER(38,0)")]
+        elif statement.lstrip().startswith("merge into"):
+            rows = [(2, 1)]
+        else:
+            rows = [(1,)]
+        cursor.fetchall.return_value = rows
+        cursor.fetchone.return_value = (1,)
+        return cursor
+
+    cursor.execute.side_effect = execute
+    return cursor
+
+
+def test_merge_is_traced():
+    connection = MagicMock()
+    connection.cursor.return_value = make_cursor()
+    table = Table(name="PYTEST", schema_name="PUBLIC")
+
+    with tracing.tracer(InMemoryTracer()) as tracer:
+        table.merge(
+            path="s3://bucket/path",
+            file_format=InlineFileFormat(definition="TYPE = PARQUET"),
+            stage="EXTERNAL_STAGE",
+            connection=connection,
+        )
+    assert not tracing.enabled
+
+    (merge,) = tracer.spans
+    assert merge.name == "Table.merge"
+    assert merge.attributes["table"] == table.fqn
+    assert merge.attributes["strategy"] == "merge"
+    assert merge.attributes["target_exists"] is True
+    assert "partitions" not in merge.attributes
+    assert [span.name for span in merge.children] == [
+        "exists",
+        "copy",
+        "prepare",
+        "merge",
+        "drop",
+    ]
+    breakdown = merge.breakdown()
+    assert "copy/Table.copy/copy/statement" in breakdown
+    assert "prepare/get_columns" in breakdown
+    assert all(duration >= 0 for duration in breakdown.values())
+
+    statements = [span for _, span in merge.walk() if span.name == "statement"]
+    (applied,) = [span for span in statements if span.attributes["kind"] == "merge"]
+    assert applied.attributes["table"] == table.fqn
+    assert applied.attributes["query_id"] == "01-abc"
+    assert "Table.merge" in merge.timeline().splitlines()[0]
+
+
+def test_failed_spans_and_opentelemetry():
+    tracer = InMemoryTracer()
+    with tracing.tracer(tracer), pytest.raises(ValueError):
+        with tracing.span("outer", table="T"):
+            with tracing.span("inner", rows=None):
+                raise ValueError("boom")
+    (outer,) = tracer.spans
+    assert outer.error == "boom"
+    assert outer.children[0].attributes == {}
+
+    otel = MagicMock()
+    otel.start_as_current_span.return_value = nullcontext(MagicMock())
+    with tracing.tracer(OpenTelemetryTracer(otel)):
+        with tracing.span("outer", table="T", rows=None):
+            pass
+    otel.start_as_current_span.assert_called_once_with(
+        "outer", attributes={"table": "T"}
+    )